@@ -5,7 +5,7 @@ from uuid import UUID
 import jwt
 from django.conf import settings
 
-from services import REPO
+from . import user_cache
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -80,4 +80,4 @@ def get_user_from_token(token: str) -> "AbstractUser | None":
     if payload.get("type") != "access":
         return None
 
-    return REPO.users.get_active_by_id(UUID(payload["user_id"]))
+    return user_cache.get_user(UUID(payload["user_id"]), payload["iat"])
@@ -0,0 +1,92 @@
+"""Per-process cache of authenticated users.
+
+Every authenticated request resolves its access token to a user. Entries are
+keyed by user id and the token's iat, hold the user with groups prefetched,
+and expire after AUTH_USER_CACHE_TTL seconds. Saving, deleting or regrouping
+a user drops its entries in this process (see apps/users/signals.py); other
+processes see the change once their entry expires, so keep the TTL short.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+from services import REPO
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from apps.users.models import User
+
+# Users with cached entries; past this, expired and then oldest are dropped.
+MAX_USERS = 10_000
+
+_lock = threading.Lock()
+# user id -> token iat -> (expires at, user)
+_entries: dict[UUID, dict[int, tuple[float, User]]] = {}
+# Bumped by every invalidation, so a lookup that raced one is not cached.
+_generation = 0
+
+
+def get_user(user_id: UUID, issued_at: int) -> User | None:
+    """The active user for a token, from the cache or the database."""
+    ttl = settings.AUTH_USER_CACHE_TTL
+    if ttl <= 0:
+        return REPO.users.get_active_with_groups(user_id)
+
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(user_id, {}).get(issued_at)
+        generation = _generation
+    if entry is not None and entry[0] > now:
+        # Requests may modify their user (e.g. PATCH /auth/me), so each gets
+        # its own copy; the prefetched groups are shared.
+        return copy.copy(entry[1])
+
+    user = REPO.users.get_active_with_groups(user_id)
+    if user is None:
+        return None
+    with _lock:
+        if generation == _generation:
+            if user_id not in _entries and len(_entries) >= MAX_USERS:
+                _evict(now)
+            tokens = _entries.setdefault(user_id, {})
+            _drop_expired(tokens, now)
+            tokens[issued_at] = (now + ttl, user)
+    return copy.copy(user)
+
+
+def _drop_expired(tokens: dict[int, tuple[float, User]], now: float) -> None:
+    for issued_at, (expires_at, _) in list(tokens.items()):
+        if expires_at <= now:
+            del tokens[issued_at]
+
+
+def _evict(now: float) -> None:
+    for user_id, tokens in list(_entries.items()):
+        _drop_expired(tokens, now)
+        if not tokens:
+            del _entries[user_id]
+    # Still full: drop the oldest half (dicts keep insertion order).
+    if len(_entries) >= MAX_USERS:
+        for user_id in list(_entries)[: MAX_USERS // 2]:
+            del _entries[user_id]
+
+
+def invalidate_user(user_id: UUID) -> None:
+    global _generation  # noqa: PLW0603
+    with _lock:
+        _entries.pop(user_id, None)
+        _generation += 1
+
+
+def clear_user_cache() -> None:
+    global _generation  # noqa: PLW0603
+    with _lock:
+        _entries.clear()
+        _generation += 1
@@ -0,0 +1,166 @@
+"""Response cache for public read endpoints whose data only changes on writes.
+
+Entries live in the "responses" cache alias (see CACHES in settings), so the
+backend is pluggable: local memory for a single process, file or database
+backed when several workers need to share entries and invalidations.
+
+Keys are versioned. Every entry is stored under the current cache version and
+invalidate_response_cache() moves the version on, which orphans all earlier
+entries at once; they age out through the backend's TIMEOUT.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from ninja.responses import NinjaJSONEncoder
+from pydantic import TypeAdapter
+
+from services import REPO
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from uuid import UUID
+
+    from django.core.cache.backends.base import BaseCache
+    from django.http import HttpRequest
+
+    from apps.projects.models import ProjectRanking
+    from services.project.query_interface import CompetitionResults
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_ALIAS = "responses"
+PENDING_COUNT_TIMEOUT = 30
+RESULTS_TIMEOUT = 300
+_VERSION_KEY = "response-cache:version"
+
+
+def _cache() -> BaseCache:
+    return caches[RESPONSE_CACHE_ALIAS]
+
+
+def response_cache_version() -> int:
+    cache = _cache()
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        # A timestamp rather than a counter: if the version key is evicted we
+        # must not restart at a value that older entries were stored under.
+        cache.add(_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(_VERSION_KEY)
+    return version
+
+
+def invalidate_response_cache() -> None:
+    """Drop every cached response. Safe to call from signals and admin actions."""
+    try:
+        _cache().set(_VERSION_KEY, time.time_ns(), timeout=None)
+    except Exception:
+        logger.exception("Failed to invalidate response cache")
+
+
+def cached_value[T](key: str, compute: Callable[[], T], timeout: int) -> T:
+    """Memoize compute() under the current cache version for up to timeout s."""
+    cache = _cache()
+    version = response_cache_version()
+    value = cache.get(key, version=version)
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout=timeout, version=version)
+    return value
+
+
+def pending_projects_count() -> int:
+    """Shared pending-project count for the public list endpoints.
+
+    Project writes move the cache version on, so the short timeout only bounds
+    staleness on processes that do not share the cache (locmem backend).
+    """
+    return cached_value(
+        "projects:pending-count",
+        REPO.project.count_pending,
+        timeout=PENDING_COUNT_TIMEOUT,
+    )
+
+
+def _results_key(competition_id: UUID) -> str:
+    return f"competitions:results:{competition_id}"
+
+
+def competition_results(competition_id: UUID) -> CompetitionResults:
+    """Consensus results of a competition, recomputed after ranking changes."""
+    return cached_value(
+        _results_key(competition_id),
+        lambda: REPO.project.get_competition_results(competition_id),
+        timeout=RESULTS_TIMEOUT,
+    )
+
+
+def invalidate_competition_results(competition_ids: Iterable[UUID]) -> None:
+    """Drop the cached results of these competitions, leaving the rest cached."""
+    try:
+        _cache().delete_many(
+            [_results_key(competition_id) for competition_id in competition_ids],
+            version=response_cache_version(),
+        )
+    except Exception:
+        logger.exception("Failed to invalidate competition results")
+
+
+def on_ranking_saved(sender: type, instance: ProjectRanking, **kwargs: Any) -> None:
+    """Signal receiver invalidating the results of the ranking's competition."""
+    transaction.on_commit(
+        lambda: invalidate_competition_results([instance.competition_id])
+    )
+
+
+def on_cached_data_changed(sender: type, **kwargs: Any) -> None:
+    """Signal receiver invalidating the response cache."""
+    invalidate_response_cache()
+
+
+def cached_response(
+    name: str, schema: Any
+) -> Callable[[Callable[..., Any]], Callable[..., HttpResponse]]:
+    """Cache a view's rendered JSON, keyed by name and its query parameters.
+
+    schema is the view's 200 response schema. The view result is validated and
+    rendered once per cache version, so hits skip the database and
+    serialization entirely. Only use this on views whose output does not
+    depend on the requesting user.
+    """
+    adapter = TypeAdapter(schema)
+
+    def decorator(view: Callable[..., Any]) -> Callable[..., HttpResponse]:
+        @functools.wraps(view)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            cache = _cache()
+            version = response_cache_version()
+            params = repr(sorted(kwargs.items()))
+            # Hashed: the repr may hold spaces and quotes and has no length
+            # limit, which memcached keys do not allow.
+            key = f"{name}:{hashlib.sha256(params.encode()).hexdigest()}"
+            logger.debug("Response cache key %s for %s%s", key, name, params)
+            content = cache.get(key, version=version)
+            if content is None:
+                result = adapter.validate_python(
+                    view(request, *args, **kwargs),
+                    from_attributes=True,
+                    context={"request": request},
+                )
+                # Rendered like ninja renders uncached responses.
+                content = json.dumps(adapter.dump_python(result), cls=NinjaJSONEncoder)
+                cache.set(key, content, version=version)
+            return HttpResponse(content, content_type="application/json")
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,65 @@
+"""Conditional GET support (ETag / If-None-Match) for read-only API routes.
+
+The validator is derived from cheap state rather than from the response body:
+the request (path, query parameters, Authorization header) and the response
+cache version, which every write hook moves on (see api/cache.py). Clients
+holding a matching ETag get a 304 before the route runs, so none of its
+queries or serialization happen. Only use this on routes whose output is
+covered by the response cache invalidation.
+
+Apply it with ninja's decorate_view so it wraps the finished HttpResponse:
+
+    @router.get("/things", response=list[ThingResponse])
+    @decorate_view(conditional_get)
+    def list_things(request): ...
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from django.utils.cache import get_conditional_response
+
+from api.cache import response_cache_version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest, HttpResponse
+
+
+def compute_etag(request: HttpRequest) -> str:
+    state = (
+        request.path,
+        sorted(request.GET.lists()),
+        # Routes may show owners and admins more than anonymous visitors.
+        request.headers.get("Authorization", ""),
+        response_cache_version(),
+    )
+    digest = hashlib.sha256(repr(state).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def conditional_get(
+    view: Callable[..., HttpResponse],
+) -> Callable[..., HttpResponse]:
+    """Give a GET route an ETag and answer a matching If-None-Match with 304."""
+
+    @functools.wraps(view)
+    def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        # Read before the view runs: a write landing meanwhile moves the
+        # version on, so the body can only be newer than its ETag claims.
+        etag = compute_etag(request)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
+        response = view(request, *args, **kwargs)
+        if response.status_code == HTTPStatus.OK:
+            response["ETag"] = etag
+        return response
+
+    return wrapper
@@ -0,0 +1,105 @@
+"""Coalescing dispatcher for frontend path revalidation.
+
+Project changes make the Next.js frontend drop its cached copies of the pages
+showing them. Rather than a task per change, paths are collected in-process
+for REVALIDATION_WINDOW seconds, deduplicated, and handed to one
+revalidate_paths task that sends them in a single request. An admin approving
+50 projects thus sends the listing pages once, not 50 times. The window also
+closes early once REVALIDATION_MAX_PATHS distinct paths are pending, and once
+more when the process exits; a window of 0 sends every call straight away.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import connections
+
+from api.tasks.web_ui import revalidate_paths
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+# Pages that list projects, shown stale after any project change.
+PROJECT_LISTING_PATHS = ("/", "/projects", "/competitions")
+
+
+def project_paths(project_id: UUID | str) -> list[str]:
+    return [*PROJECT_LISTING_PATHS, f"/projects/{project_id}"]
+
+
+class RevalidationDispatcher:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # A dict rather than a set keeps paths in the order they were added.
+        self._pending: dict[str, None] = {}
+        self._timer: threading.Timer | None = None
+
+    def add(self, paths: Iterable[str]) -> None:
+        window = settings.REVALIDATION_WINDOW
+        with self._lock:
+            self._pending.update(dict.fromkeys(paths))
+            full = window <= 0 or len(self._pending) >= settings.REVALIDATION_MAX_PATHS
+            if not full and self._timer is None:
+                self._timer = threading.Timer(window, self._flush_in_background)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Enqueue the pending paths in one task; returns how many there were."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return 0
+        try:
+            revalidate_paths.enqueue(list(pending))
+        except Exception:
+            logger.exception("Failed to enqueue revalidation of %d paths", len(pending))
+        return len(pending)
+
+    def clear(self) -> None:
+        """Drop pending paths without sending them."""
+        with self._lock:
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own connections; do not leak them.
+            connections.close_all()
+
+
+_dispatcher = RevalidationDispatcher()
+atexit.register(_dispatcher.flush)
+
+
+def revalidate(paths: Iterable[str]) -> None:
+    _dispatcher.add(paths)
+
+
+def revalidate_project(project_id: UUID | str) -> None:
+    _dispatcher.add(project_paths(project_id))
+
+
+def flush_revalidation() -> int:
+    return _dispatcher.flush()
+
+
+def clear_revalidation() -> None:
+    _dispatcher.clear()
@@ -181,11 +181,14 @@ def update_current_user(
 ) -> AbstractUser:
     user = request.auth
 
-    # Update only provided fields
-    for field, value in payload.dict(exclude_unset=True).items():
+    # Update only provided fields. request.auth may be a cached copy, so a
+    # full save could write back stale values of the other columns.
+    changes = payload.dict(exclude_unset=True)
+    for field, value in changes.items():
         setattr(user, field, value)
 
-    user.save()
+    if changes:
+        user.save(update_fields=[*changes, "updated_at"])
     return user
 
 
@@ -1,20 +1,27 @@
 import uuid
 
-from django.db.models import Count
+from django.db.models import Count, Prefetch, Q, QuerySet
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from ninja import Router
+from ninja.decorators import decorate_view
 
+from api.auth.security import auth
+from api.cache import cached_response, competition_results, pending_projects_count
+from api.conditional import conditional_get
 from api.schemas.competition import (
     ActiveOrRecentResponse,
     CompetitionListResponse,
     CompetitionOverviewListResponse,
     CompetitionOverviewResponse,
     CompetitionResponse,
+    CompetitionResultsResponse,
     CompetitionSummaryResponse,
+    competition_project_prefetches,
 )
 from api.schemas.errors import Error
 from apps.projects.models import Competition, CompetitionStatus, Project, ProjectStatus
+from services.project.query_interface import CompetitionResults
 
 
 def is_valid_uuid(value: str) -> bool:
@@ -30,37 +37,56 @@ def is_valid_uuid(value: str) -> bool:
 router = Router()
 
 
+def _with_project_counts(queryset: QuerySet[Competition]) -> QuerySet[Competition]:
+    return queryset.annotate(
+        project_count=Count("projects", distinct=True),
+        pending_projects_count=Count(
+            "projects",
+            filter=Q(projects__status=ProjectStatus.PENDING),
+            distinct=True,
+        ),
+    )
+
+
+def _with_approved_projects(
+    queryset: QuerySet[Competition],
+) -> QuerySet[Competition]:
+    approved_projects = (
+        Project.objects.filter(status=ProjectStatus.APPROVED)
+        .select_related("main_image")
+        .order_by("title")
+        .prefetch_related(*competition_project_prefetches())
+    )
+    return queryset.select_related("winner", "winner__main_image").prefetch_related(
+        Prefetch("projects", queryset=approved_projects, to_attr="approved_projects"),
+        *competition_project_prefetches("winner"),
+    )
+
+
 @router.get("", response={200: CompetitionOverviewListResponse}, tags=["Competitions"])
+@decorate_view(conditional_get)
+@cached_response("competitions:list", CompetitionOverviewListResponse)
 def list_competitions(request: HttpRequest) -> CompetitionOverviewListResponse:
-    competitions = Competition.objects.prefetch_related("projects").all()
-    pending_count = Project.objects.filter(status=ProjectStatus.PENDING).count()
+    competitions = _with_project_counts(Competition.objects.all())
     return CompetitionOverviewListResponse(
         competitions=[
             CompetitionOverviewResponse.from_competition(c) for c in competitions
         ],
-        pending_projects_count=pending_count,
+        pending_projects_count=pending_projects_count(),
     )
 
 
 @router.get(
     "/with-projects", response={200: CompetitionListResponse}, tags=["Competitions"]
 )
+@decorate_view(conditional_get)
 def list_competitions_with_projects(request: HttpRequest) -> CompetitionListResponse:
-    competitions = (
-        Competition.objects.select_related("winner")
-        .prefetch_related(
-            "projects",
-            "projects__images",
-            "projects__tags",
-            "winner__images",
-            "winner__tags",
-        )
-        .all()
+    competitions = _with_approved_projects(
+        _with_project_counts(Competition.objects.all())
     )
-    pending_count = Project.objects.filter(status=ProjectStatus.PENDING).count()
     return CompetitionListResponse(
         competitions=[CompetitionResponse.from_competition(c) for c in competitions],
-        pending_projects_count=pending_count,
+        pending_projects_count=pending_projects_count(),
     )
 
 
@@ -69,6 +95,8 @@ def list_competitions_with_projects(request: HttpRequest) -> CompetitionListResp
     response={200: ActiveOrRecentResponse},
     tags=["Competitions"],
 )
+@decorate_view(conditional_get)
+@cached_response("competitions:active-or-most-recent", ActiveOrRecentResponse)
 def get_active_or_most_recent(request: HttpRequest) -> ActiveOrRecentResponse:
     base_qs = Competition.objects.annotate(project_count=Count("projects"))
 
@@ -88,16 +116,29 @@ def get_active_or_most_recent(request: HttpRequest) -> ActiveOrRecentResponse:
     response={200: CompetitionResponse, 404: Error},
     tags=["Competitions"],
 )
+@decorate_view(conditional_get)
 def get_competition(request: HttpRequest, competition_id: str) -> CompetitionResponse:
-    queryset = Competition.objects.select_related("winner").prefetch_related(
-        "projects",
-        "projects__images",
-        "projects__tags",
-        "winner__images",
-        "winner__tags",
-    )
+    queryset = _with_approved_projects(_with_project_counts(Competition.objects.all()))
     if is_valid_uuid(competition_id):
         competition = get_object_or_404(queryset, id=competition_id)
     else:
         competition = get_object_or_404(queryset, slug=competition_id)
     return CompetitionResponse.from_competition(competition)
+
+
+@router.get(
+    "/{competition_id}/results",
+    response={200: CompetitionResultsResponse, 403: Error, 404: Error},
+    auth=auth,
+    tags=["Competitions"],
+)
+def get_competition_results(
+    request: HttpRequest, competition_id: uuid.UUID
+) -> CompetitionResults | tuple[int, dict[str, str]]:
+    """Consensus results from the reviewers' rankings (staff only)."""
+    if not request.auth.is_staff:
+        return 403, {"detail": "Admin access required"}
+    if not Competition.objects.filter(id=competition_id).exists():
+        return 404, {"detail": "Competition not found"}
+
+    return competition_results(competition_id)
@@ -267,6 +267,7 @@ def complete_upload(
         image.is_main = True
 
     image.save()
+    project.refresh_main_image()
     return image
 
 
@@ -296,6 +297,7 @@ def set_main_image(
     # Set new main image
     image.is_main = True
     image.save()
+    project.refresh_main_image()
 
     return image
 
@@ -328,4 +330,5 @@ def delete_image(
             first_image.is_main = True
             first_image.save()
 
+    project.refresh_main_image()
     return 204, None
@@ -1,7 +1,13 @@
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count, Q
 from django.http import HttpRequest
+from django.utils import timezone
 from ninja import Router
 
 from api.auth.security import auth
+from api.cache import invalidate_competition_results
 from api.schemas.errors import Error
 from api.schemas.my_review import (
     RankingUpdateRequest,
@@ -21,6 +27,7 @@ from apps.projects.models import (
     ProjectStatus,
     ReviewStatus,
 )
+from apps.users.models import User
 
 router = Router()
 
@@ -36,8 +43,15 @@ EXCLUDED_PROJECT_STATUSES = [ProjectStatus.REJECTED, ProjectStatus.ICE_BOX]
 )
 def list_my_review_competitions(request: HttpRequest) -> ReviewCompetitionListResponse:
     """List all competitions the current user is assigned to review."""
-    assignments = CompetitionReviewer.objects.filter(user=request.auth).select_related(
-        "competition"
+    assignments = (
+        CompetitionReviewer.objects.filter(user=request.auth)
+        .select_related("competition")
+        .annotate(
+            project_count=Count(
+                "competition__projects",
+                filter=~Q(competition__projects__status__in=EXCLUDED_PROJECT_STATUSES),
+            )
+        )
     )
 
     competitions = [
@@ -47,9 +61,7 @@ def list_my_review_competitions(request: HttpRequest) -> ReviewCompetitionListRe
             start_date=a.competition.start_date,
             end_date=a.competition.end_date,
             image_url=a.competition.image_url,
-            project_count=a.competition.projects.exclude(
-                status__in=EXCLUDED_PROJECT_STATUSES
-            ).count(),
+            project_count=a.project_count,
             my_review_status=a.status,
         )
         for a in assignments
@@ -76,10 +88,7 @@ def get_my_review_competition(
     if not assignment:
         return 404, Error(detail="Competition not found")
 
-    competition = Competition.objects.prefetch_related(
-        "projects",
-        "projects__images",
-    ).get(id=competition_id)
+    competition = Competition.objects.get(id=competition_id)
 
     rankings = {
         r.project_id: r.position
@@ -95,10 +104,12 @@ def get_my_review_competition(
             title=p.title,
             description=p.description,
             website_url=p.website_url,
-            main_image_url=ReviewProjectResponse.resolve_main_image_url(p),
+            main_image_url=p.main_image_url,
             my_ranking=rankings.get(p.id),
         )
-        for p in competition.projects.exclude(status__in=EXCLUDED_PROJECT_STATUSES)
+        for p in competition.projects.exclude(
+            status__in=EXCLUDED_PROJECT_STATUSES
+        ).select_related("main_image")
     ]
 
     return ReviewCompetitionDetailResponse(
@@ -123,49 +134,93 @@ def update_rankings(
     payload: RankingUpdateRequest,
 ) -> SuccessResponse | tuple[int, Error]:
     """Update rankings for projects in a competition."""
-    assignment = CompetitionReviewer.objects.filter(
-        user=request.auth,
-        competition_id=competition_id,
-    ).first()
+    project_ids = payload.project_ids
+    if len(set(project_ids)) != len(project_ids):
+        return 400, Error(detail="Each project can only be ranked once")
+
+    with transaction.atomic():
+        # Locking the assignment serializes concurrent saves by one reviewer.
+        assignment = (
+            CompetitionReviewer.objects.select_for_update()
+            .filter(user=request.auth, competition_id=competition_id)
+            .first()
+        )
 
-    if not assignment:
-        return 404, Error(detail="Competition not found")
+        if not assignment:
+            return 404, Error(detail="Competition not found")
 
-    if assignment.status == ReviewStatus.COMPLETED:
-        return 400, Error(detail="Cannot update rankings for a completed review")
+        if assignment.status == ReviewStatus.COMPLETED:
+            return 400, Error(detail="Cannot update rankings for a completed review")
 
-    competition_project_ids = set(
-        Competition.objects.filter(id=competition_id)
-        .exclude(projects__status__in=EXCLUDED_PROJECT_STATUSES)
-        .values_list("projects__id", flat=True)
-    )
-    submitted_project_ids = set(payload.project_ids)
-
-    invalid_ids = submitted_project_ids - competition_project_ids
-    if invalid_ids:
-        return 400, Error(
-            detail="One or more projects do not belong to this competition"
+        rankable = (
+            Project.objects.filter(id__in=project_ids, competitions=competition_id)
+            .exclude(status__in=EXCLUDED_PROJECT_STATUSES)
+            .count()
         )
+        if rankable != len(project_ids):
+            return 400, Error(
+                detail="One or more projects do not belong to this competition"
+            )
 
-    # Delete existing rankings and create new ones
-    ProjectRanking.objects.filter(
-        reviewer=request.auth,
-        competition_id=competition_id,
-    ).delete()
+        if _apply_ranking(request.auth, assignment.competition_id, project_ids):
+            # These bulk writes skip the signal hooks; drop cached results.
+            # Only after the commit, or a concurrent read could cache the old
+            # rankings again.
+            transaction.on_commit(
+                lambda: invalidate_competition_results([assignment.competition_id])
+            )
+
+    return SuccessResponse()
 
-    ProjectRanking.objects.bulk_create(
-        [
+
+def _apply_ranking(
+    reviewer: User, competition_id: UUID, project_ids: list[UUID]
+) -> bool:
+    """Bring the reviewer's rankings in line with project_ids, in that order.
+
+    Only rows that change are written. (reviewer, competition, position) is
+    unique and checked row by row, so rows changing position are first
+    parked above every position in use and then moved to their new one.
+    Returns whether anything changed.
+    """
+    positions = {
+        project_id: position for position, project_id in enumerate(project_ids, start=1)
+    }
+    existing = list(
+        ProjectRanking.objects.filter(reviewer=reviewer, competition_id=competition_id)
+    )
+    removed = [r.id for r in existing if r.project_id not in positions]
+    moved = [
+        r
+        for r in existing
+        if r.project_id in positions and r.position != positions[r.project_id]
+    ]
+    ranked = {r.project_id for r in existing}
+    added = [project_id for project_id in project_ids if project_id not in ranked]
+
+    if removed:
+        ProjectRanking.objects.filter(id__in=removed).delete()
+    if moved:
+        now = timezone.now()
+        parked_above = max([len(project_ids), *(r.position for r in existing)])
+        for offset, ranking in enumerate(moved, start=1):
+            ranking.position = parked_above + offset
+        ProjectRanking.objects.bulk_update(moved, ["position"])
+        for ranking in moved:
+            ranking.position = positions[ranking.project_id]
+            ranking.updated_at = now
+        ProjectRanking.objects.bulk_update(moved, ["position", "updated_at"])
+    if added:
+        ProjectRanking.objects.bulk_create(
             ProjectRanking(
-                reviewer=request.auth,
+                reviewer=reviewer,
                 competition_id=competition_id,
                 project_id=project_id,
-                position=position,
+                position=positions[project_id],
             )
-            for position, project_id in enumerate(payload.project_ids, start=1)
-        ]
-    )
-
-    return SuccessResponse()
+            for project_id in added
+        )
+    return bool(removed or moved or added)
 
 
 @router.put(
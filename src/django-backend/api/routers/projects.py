@@ -1,15 +1,21 @@
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from ninja import Query, Router
+from ninja.decorators import decorate_view
 
 from api.auth.jwt import get_user_from_token
+from api.cache import cached_response, pending_projects_count
+from api.conditional import conditional_get
 from api.schemas.errors import Error
 from api.schemas.project import ProjectListResponse, ProjectResponse
+from api.view_buffer import record_view
 from apps.projects.models import Project, ProjectStatus
+from project_showcase.middleware import get_client_ip
 from services import REPO
-from services.project.exceptions import ProjectNotFoundError
+from services.project.exceptions import InvalidCursorError, ProjectNotFoundError
 
 if TYPE_CHECKING:
     from apps.users.models import User
@@ -17,7 +23,8 @@ if TYPE_CHECKING:
 router = Router()
 
 
-@router.get("", response={200: ProjectListResponse}, tags=["Projects"])
+@router.get("", response={200: ProjectListResponse, 400: Error}, tags=["Projects"])
+@decorate_view(conditional_get)
 def list_projects(
     request: HttpRequest,
     tags: list[str] | None = Query(None),
@@ -27,21 +34,30 @@ def list_projects(
     search: str | None = Query(None),
     page: int = Query(1),
     per_page: int = Query(20),
-) -> dict[str, Any]:
-    result = REPO.project.list_approved(
-        tags=tags,
-        tech_stack=tech_stack,
-        search=search,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        page=page,
-        per_page=per_page,
-    )
-    result["pending_projects_count"] = REPO.project.count_pending()
+    cursor: str | None = Query(None),
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    # Passing cursor (empty for the first page) switches to keyset pagination:
+    # follow next_cursor instead of incrementing page.
+    try:
+        result = REPO.project.list_approved(
+            tags=tags,
+            tech_stack=tech_stack,
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            page=page,
+            per_page=per_page,
+            cursor=cursor,
+        )
+    except InvalidCursorError as exc:
+        return 400, {"detail": str(exc)}
+    result["pending_projects_count"] = pending_projects_count()
     return result
 
 
 @router.get("/featured", response={200: list[ProjectResponse]}, tags=["Projects"])
+@decorate_view(conditional_get)
+@cached_response("projects:featured", list[ProjectResponse])
 def get_featured_projects(
     request: HttpRequest,
 ) -> QuerySet[Project]:
@@ -49,6 +65,8 @@ def get_featured_projects(
 
 
 @router.get("/trending", response={200: list[ProjectResponse]}, tags=["Projects"])
+@decorate_view(conditional_get)
+@cached_response("projects:trending", list[ProjectResponse])
 def get_trending_projects(
     request: HttpRequest,
 ) -> QuerySet[Project]:
@@ -69,6 +87,7 @@ def _get_user_from_request(request: HttpRequest) -> "User | None":
     response={200: ProjectResponse, 404: Error},
     tags=["Projects"],
 )
+@decorate_view(conditional_get)
 def get_project(
     request: HttpRequest,
     project_id: str,
@@ -88,3 +107,17 @@ def get_project(
         return project
 
     return 404, {"detail": "Project not found"}
+
+
+@router.post("/{project_id}/views", response={202: None}, tags=["Projects"])
+def record_project_view(request: HttpRequest, project_id: UUID) -> tuple[int, None]:
+    """Count a page view. Written later in batches, see api/view_buffer.py."""
+    viewer_ip = get_client_ip(request)
+    # Without a valid address the view cannot be stored or told apart.
+    if viewer_ip:
+        record_view(
+            str(project_id),
+            viewer_ip,
+            request.headers.get("User-Agent", ""),
+        )
+    return 202, None
@@ -6,8 +6,11 @@ from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.text import slugify
 from ninja import Query, Router
+from ninja.decorators import decorate_view
 
 from api.auth.security import auth
+from api.cache import cached_response
+from api.conditional import conditional_get
 from api.schemas.errors import Error
 from api.schemas.tag import (
     TagCategoryResponse,
@@ -23,18 +26,22 @@ router = Router()
 
 
 @router.get("", response={200: list[TagResponse]}, tags=["Tags"])
+@decorate_view(conditional_get)
 def list_tags(request: HttpRequest) -> QuerySet[Tag]:
     """List all approved and pending tags (excludes rejected)."""
     return Tag.objects.exclude(status=TagStatus.REJECTED)
 
 
 @router.get("/categories", response={200: list[TagCategoryResponse]}, tags=["Tags"])
+@decorate_view(conditional_get)
 def list_categories(request: HttpRequest) -> QuerySet[TagCategory]:
     """List all active tag categories."""
     return TagCategory.objects.filter(is_active=True)
 
 
 @router.get("/grouped", response={200: list[TagGroupedResponse]}, tags=["Tags"])
+@decorate_view(conditional_get)
+@cached_response("tags:grouped", list[TagGroupedResponse])
 def list_tags_grouped(
     request: HttpRequest,
     with_projects: bool = Query(False),  # noqa: FBT001, FBT003
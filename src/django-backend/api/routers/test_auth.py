@@ -269,6 +269,62 @@ class TestGetCurrentUser:
         )
 
 
+class TestAuthenticatedUserCache:
+    def test_repeat_requests_skip_the_user_lookup(
+        self, client, user, auth_headers, django_assert_num_queries
+    ) -> None:
+        client.get("/api/auth/me", **auth_headers)
+
+        with django_assert_num_queries(0):
+            response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.json(), has_entries(id=str(user.id)))
+
+    def test_deactivated_user_is_rejected(self, client, user, auth_headers) -> None:
+        client.get("/api/auth/me", **auth_headers)
+
+        user.is_active = False
+        user.save()
+        response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.status_code, equal_to(401))
+
+    def test_profile_update_is_visible_immediately(
+        self, client, user, auth_headers
+    ) -> None:
+        client.get("/api/auth/me", **auth_headers)
+
+        client.put(
+            "/api/auth/me",
+            data=json.dumps({"first_name": "Renamed"}),
+            content_type="application/json",
+            **auth_headers,
+        )
+        response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.json(), has_entries(first_name="Renamed"))
+
+    def test_group_change_is_visible_immediately(
+        self, client, user, auth_headers
+    ) -> None:
+        client.get("/api/auth/me", **auth_headers)
+
+        reviewers, _ = Group.objects.get_or_create(name="reviewers")
+        reviewers.user_set.add(user)
+        response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.json(), has_entries(groups=["reviewers"]))
+
+    def test_disabled_by_zero_ttl(
+        self, client, auth_headers, settings, django_assert_num_queries
+    ) -> None:
+        settings.AUTH_USER_CACHE_TTL = 0
+        client.get("/api/auth/me", **auth_headers)
+
+        with django_assert_num_queries(2):
+            client.get("/api/auth/me", **auth_headers)
+
+
 class TestUpdateCurrentUser:
     def test_update_first_name(self, client, user, auth_headers) -> None:
         response = client.put(
@@ -377,3 +433,23 @@ class TestUpdateCurrentUser:
         assert_that(user.first_name, equal_to("Original"))
         assert_that(user.last_name, equal_to("Name"))
         assert_that(user.info, equal_to("Updated info"))
+
+    def test_update_keeps_columns_changed_since_the_user_was_cached(
+        self,
+        client,
+        user,
+        auth_headers,
+    ) -> None:
+        client.get("/api/auth/me", **auth_headers)
+        User.objects.filter(pk=user.pk).update(is_staff=True)
+
+        client.put(
+            "/api/auth/me",
+            data=json.dumps({"first_name": "Renamed"}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        user.refresh_from_db()
+        assert_that(user.first_name, equal_to("Renamed"))
+        assert_that(user.is_staff, equal_to(True))
@@ -1,10 +1,27 @@
+import json
+import uuid
 from unittest.mock import PropertyMock, patch
 
 import pytest
 from hamcrest import assert_that, contains_inanyorder, equal_to, has_entries, has_length
 
-from apps.projects.models import Competition, CompetitionStatus, ProjectStatus
-from tests.factories import CompetitionFactory, ProjectFactory, TagFactory
+from api.auth.jwt import create_access_token
+from api.cache import response_cache_version
+from apps.projects.models import (
+    Competition,
+    CompetitionStatus,
+    ProjectRanking,
+    ProjectStatus,
+)
+from tests.factories import (
+    CompetitionFactory,
+    CompetitionReviewerFactory,
+    ProjectFactory,
+    ProjectImageFactory,
+    ProjectRankingFactory,
+    TagFactory,
+    UserFactory,
+)
 
 
 @pytest.mark.django_db
@@ -286,6 +303,79 @@ class TestCompetitionProjectTags:
         assert_that(project_data["tags"][0]["slug"], equal_to("dev-tools"))
 
 
+@pytest.mark.django_db
+class TestCompetitionProjectMainImage:
+    def test_uses_main_uploaded_image(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        ProjectImageFactory(project=project, display_order=0)
+        main = ProjectImageFactory(project=project, display_order=1, is_main=True)
+        competition = CompetitionFactory(projects=[project])
+
+        response = client.get(f"/api/competitions/{competition.id}")
+
+        assert_that(
+            response.json()["projects"][0]["main_image_url"], equal_to(main.url)
+        )
+
+    def test_falls_back_to_first_uploaded_image(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        ProjectImageFactory(project=project, is_main=True, upload_status="pending")
+        first = ProjectImageFactory(project=project, display_order=1)
+        ProjectImageFactory(project=project, display_order=2)
+        competition = CompetitionFactory(projects=[project])
+
+        response = client.get(f"/api/competitions/{competition.id}")
+
+        assert_that(
+            response.json()["projects"][0]["main_image_url"], equal_to(first.url)
+        )
+
+    def test_winner_main_image_url(self, client) -> None:
+        winner = ProjectFactory(status=ProjectStatus.APPROVED)
+        image = ProjectImageFactory(project=winner, is_main=True)
+        CompetitionFactory(projects=[winner], winner=winner)
+
+        response = client.get("/api/competitions/with-projects")
+
+        assert_that(
+            response.json()["competitions"][0]["winner"]["main_image_url"],
+            equal_to(image.url),
+        )
+
+
+def _add_competition_projects(competition, count: int) -> None:
+    for _ in range(count):
+        project = ProjectFactory(status=ProjectStatus.APPROVED, tags=[TagFactory()])
+        ProjectImageFactory(project=project, is_main=True)
+        ProjectImageFactory(project=project)
+        competition.projects.add(project)
+
+
+@pytest.mark.django_db
+class TestCompetitionQueryCount:
+    def test_get_competition_query_count_is_constant(
+        self, client, query_budget
+    ) -> None:
+        competition = CompetitionFactory()
+
+        def grow(size: int) -> None:
+            _add_competition_projects(competition, size - competition.projects.count())
+
+        query_budget(grow, lambda _: client.get(f"/api/competitions/{competition.id}"))
+
+    @pytest.mark.parametrize(
+        "url", ["/api/competitions", "/api/competitions/with-projects"]
+    )
+    def test_list_query_count_is_constant(self, client, query_budget, url) -> None:
+        def grow(size: int) -> None:
+            while Competition.objects.count() < size:
+                competition = CompetitionFactory(winner=ProjectFactory())
+                _add_competition_projects(competition, 2)
+                competition.projects.add(ProjectFactory(status=ProjectStatus.PENDING))
+
+        query_budget(grow, lambda _: client.get(url))
+
+
 @pytest.mark.django_db
 class TestCompetitionImage:
     def test_list_competitions_includes_image_url_when_image_exists(
@@ -541,3 +631,173 @@ class TestActiveOrMostRecent:
         recent = response.json()["recent"]
         assert "winner" not in recent
         assert "pending_projects_count" not in recent
+
+    def test_competition_change_invalidates_cached_response(self, client) -> None:
+        competition = CompetitionFactory(status=CompetitionStatus.PENDING)
+        assert_that(
+            client.get("/api/competitions/active-or-most-recent").json()["active"],
+            equal_to(None),
+        )
+
+        competition.status = CompetitionStatus.ACCEPTING_APPLICATIONS
+        competition.save()
+        response = client.get("/api/competitions/active-or-most-recent")
+
+        assert_that(response.json()["active"]["slug"], equal_to(competition.slug))
+
+
+@pytest.mark.django_db
+class TestCompetitionResults:
+    def _headers(self, user):
+        return {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(user.id)}"}
+
+    def _competition_with_rankings(self):
+        first, second = ProjectFactory.create_batch(2)
+        competition = CompetitionFactory(projects=[first, second])
+        reviewer = UserFactory()
+        for position, project in enumerate([first, second], start=1):
+            ProjectRankingFactory(
+                competition=competition,
+                reviewer=reviewer,
+                project=project,
+                position=position,
+            )
+        return competition, reviewer, first, second
+
+    def test_returns_consensus_ranking_to_staff(self, client) -> None:
+        competition, reviewer, first, second = self._competition_with_rankings()
+        staff = UserFactory(is_staff=True)
+
+        response = client.get(
+            f"/api/competitions/{competition.id}/results", **self._headers(staff)
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        data = response.json()
+        assert_that(
+            [(p["project_id"], p["position"]) for p in data["projects"]],
+            equal_to([(str(first.id), 1), (str(second.id), 2)]),
+        )
+        assert_that(
+            data["reviewers"],
+            contains_inanyorder(
+                has_entries(reviewer_id=str(reviewer.id), ranked=2, agreement=None)
+            ),
+        )
+        assert_that(data["agreement"], equal_to(None))
+
+    def test_requires_staff(self, client, auth_headers) -> None:
+        competition = CompetitionFactory()
+
+        response = client.get(
+            f"/api/competitions/{competition.id}/results", **auth_headers
+        )
+
+        assert_that(response.status_code, equal_to(403))
+
+    def test_returns_404_for_unknown_competition(self, client) -> None:
+        staff = UserFactory(is_staff=True)
+
+        response = client.get(
+            f"/api/competitions/{uuid.uuid4()}/results", **self._headers(staff)
+        )
+
+        assert_that(response.status_code, equal_to(404))
+
+    def test_ranking_change_invalidates_cached_results_on_commit(
+        self, client, django_capture_on_commit_callbacks
+    ) -> None:
+        competition, reviewer, first, second = self._competition_with_rankings()
+        CompetitionReviewerFactory(user=reviewer, competition=competition)
+        staff = UserFactory(is_staff=True)
+        url = f"/api/competitions/{competition.id}/results"
+        client.get(url, **self._headers(staff))
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            client.put(
+                f"/api/my/reviews/competitions/{competition.id}/rankings",
+                data=json.dumps({"project_ids": [str(second.id), str(first.id)]}),
+                content_type="application/json",
+                **self._headers(reviewer),
+            )
+        before_commit = client.get(url, **self._headers(staff))
+        for callback in callbacks:
+            callback()
+        response = client.get(url, **self._headers(staff))
+
+        assert_that(
+            before_commit.json()["projects"][0]["project_id"], equal_to(str(first.id))
+        )
+        assert_that(
+            response.json()["projects"][0]["project_id"], equal_to(str(second.id))
+        )
+
+    def test_project_leaving_between_ranking_saves(
+        self, client, django_capture_on_commit_callbacks
+    ) -> None:
+        competition, reviewer, first, second = self._competition_with_rankings()
+        third = ProjectFactory()
+        competition.projects.add(third)
+        CompetitionReviewerFactory(user=reviewer, competition=competition)
+        staff = UserFactory(is_staff=True)
+        rankings_url = f"/api/my/reviews/competitions/{competition.id}/rankings"
+
+        def save_ranking(*projects):
+            with django_capture_on_commit_callbacks(execute=True):
+                return client.put(
+                    rankings_url,
+                    data=json.dumps({"project_ids": [str(p.id) for p in projects]}),
+                    content_type="application/json",
+                    **self._headers(reviewer),
+                )
+
+        save_ranking(first, second, third)
+        with django_capture_on_commit_callbacks(execute=True):
+            competition.projects.remove(second)
+        results = client.get(
+            f"/api/competitions/{competition.id}/results", **self._headers(staff)
+        ).json()
+        assert_that(
+            [(p["project_id"], p["mean_rank"]) for p in results["projects"]],
+            equal_to([(str(first.id), 1), (str(third.id), 2)]),
+        )
+
+        response = save_ranking(third, first)
+        results = client.get(
+            f"/api/competitions/{competition.id}/results", **self._headers(staff)
+        ).json()
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            [(p["project_id"], p["position"]) for p in results["projects"]],
+            equal_to([(str(third.id), 1), (str(first.id), 2)]),
+        )
+        assert_that(
+            sorted(
+                ProjectRanking.objects.filter(reviewer=reviewer).values_list(
+                    "position", flat=True
+                )
+            ),
+            equal_to([1, 2]),
+        )
+
+    def test_ranking_change_keeps_other_cached_responses(self) -> None:
+        competition, _, _, _ = self._competition_with_rankings()
+        ranking = ProjectRanking.objects.filter(competition=competition).first()
+        version = response_cache_version()
+
+        ranking.position = 10
+        ranking.save()
+
+        assert_that(response_cache_version(), equal_to(version))
+
+    def test_deleted_reviewer_drops_out_of_cached_results(self, client) -> None:
+        competition, reviewer, _, _ = self._competition_with_rankings()
+        staff = UserFactory(is_staff=True)
+        url = f"/api/competitions/{competition.id}/results"
+        client.get(url, **self._headers(staff))
+
+        reviewer.delete()
+        response = client.get(url, **self._headers(staff))
+
+        assert_that(response.json()["reviewers"], has_length(0))
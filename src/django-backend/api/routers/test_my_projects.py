@@ -5,7 +5,12 @@ from datetime import date
 from hamcrest import assert_that, equal_to, has_entries, has_length, is_, none
 
 from apps.projects.models import CompetitionStatus, Project, ProjectStatus
-from tests.factories import CompetitionFactory, ProjectFactory
+from tests.factories import (
+    CompetitionFactory,
+    ProjectFactory,
+    ProjectImageFactory,
+    TagFactory,
+)
 
 
 class TestListMyProjects:
@@ -23,6 +28,16 @@ class TestListMyProjects:
         assert_that(response.status_code, equal_to(200))
         assert_that(response.json(), has_length(3))
 
+    def test_list_my_projects_query_count_is_constant(
+        self, client, user, auth_headers, query_budget
+    ) -> None:
+        def grow(size: int) -> None:
+            while user.projects.count() < size:
+                project = ProjectFactory(owner=user, tags=[TagFactory()])
+                ProjectImageFactory(project=project)
+
+        query_budget(grow, lambda _: client.get("/api/my/projects", **auth_headers))
+
 
 class TestCreateProject:
     def test_create_project_with_url(self, client, user, auth_headers) -> None:
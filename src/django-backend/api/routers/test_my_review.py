@@ -180,6 +180,22 @@ class TestGetMyReviewCompetition:
         assert_that(project1_data["my_ranking"], equal_to(1))
         assert_that(project2_data["my_ranking"], equal_to(None))
 
+    def test_includes_main_image_url(self, client, user, auth_headers) -> None:
+        project = ProjectFactory()
+        ProjectImageFactory(project=project, display_order=0)
+        main = ProjectImageFactory(project=project, display_order=1, is_main=True)
+        competition = CompetitionFactory(projects=[project])
+        CompetitionReviewerFactory(user=user, competition=competition)
+
+        response = client.get(
+            f"/api/my/reviews/competitions/{competition.id}", **auth_headers
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json()["projects"][0]["main_image_url"], equal_to(main.url)
+        )
+
     def test_does_not_show_other_reviewers_rankings(self, client, db) -> None:
         reviewer1 = UserFactory()
         reviewer2 = UserFactory()
@@ -364,6 +380,110 @@ class TestUpdateRankings:
             ),
         )
 
+    def _put_rankings(self, client, competition, projects, headers):
+        return client.put(
+            f"/api/my/reviews/competitions/{competition.id}/rankings",
+            data=json.dumps({"project_ids": [str(p.id) for p in projects]}),
+            content_type="application/json",
+            **headers,
+        )
+
+    def _rankings(self, user, competition):
+        return {
+            r.project_id: r
+            for r in ProjectRanking.objects.filter(
+                reviewer=user, competition=competition
+            )
+        }
+
+    def test_only_rewrites_moved_rankings(self, client, user, auth_headers) -> None:
+        first, second, third = ProjectFactory.create_batch(3)
+        competition = CompetitionFactory(projects=[first, second, third])
+        CompetitionReviewerFactory(user=user, competition=competition)
+        self._put_rankings(client, competition, [first, second, third], auth_headers)
+        before = self._rankings(user, competition)
+
+        response = self._put_rankings(
+            client, competition, [second, first, third], auth_headers
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        after = self._rankings(user, competition)
+        assert_that(
+            {project_id: r.position for project_id, r in after.items()},
+            equal_to({second.id: 1, first.id: 2, third.id: 3}),
+        )
+        # Rows are updated in place, and the unmoved one is not touched.
+        assert_that(
+            {project_id: r.id for project_id, r in after.items()},
+            equal_to({project_id: r.id for project_id, r in before.items()}),
+        )
+        assert_that(after[third.id].updated_at, equal_to(before[third.id].updated_at))
+
+    def test_adds_and_removes_rankings(self, client, user, auth_headers) -> None:
+        first, second, third = ProjectFactory.create_batch(3)
+        competition = CompetitionFactory(projects=[first, second, third])
+        CompetitionReviewerFactory(user=user, competition=competition)
+        self._put_rankings(client, competition, [first, second], auth_headers)
+
+        response = self._put_rankings(client, competition, [third, first], auth_headers)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            {
+                project_id: r.position
+                for project_id, r in self._rankings(user, competition).items()
+            },
+            equal_to({third.id: 1, first.id: 2}),
+        )
+
+    def test_unchanged_ranking_writes_nothing(
+        self, client, user, auth_headers, django_assert_max_num_queries
+    ) -> None:
+        projects = ProjectFactory.create_batch(3)
+        competition = CompetitionFactory(projects=projects)
+        CompetitionReviewerFactory(user=user, competition=competition)
+        self._put_rankings(client, competition, projects, auth_headers)
+
+        with django_assert_max_num_queries(8) as captured:
+            self._put_rankings(client, competition, projects, auth_headers)
+
+        writes = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+        assert_that(writes, equal_to([]))
+
+    def test_returns_400_for_duplicate_projects(
+        self, client, user, auth_headers
+    ) -> None:
+        project = ProjectFactory()
+        competition = CompetitionFactory(projects=[project])
+        CompetitionReviewerFactory(user=user, competition=competition)
+
+        response = self._put_rankings(
+            client, competition, [project, project], auth_headers
+        )
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(
+            response.json()["detail"],
+            equal_to("Each project can only be ranked once"),
+        )
+
+    def test_rejected_project_does_not_block_ranking_others(
+        self, client, user, auth_headers
+    ) -> None:
+        approved = ProjectFactory(status=ProjectStatus.APPROVED)
+        rejected = ProjectFactory(status=ProjectStatus.REJECTED)
+        competition = CompetitionFactory(projects=[approved, rejected])
+        CompetitionReviewerFactory(user=user, competition=competition)
+
+        response = self._put_rankings(client, competition, [approved], auth_headers)
+
+        assert_that(response.status_code, equal_to(200))
+
     def test_returns_success_response(self, client, user, auth_headers) -> None:
         project = ProjectFactory()
         competition = CompetitionFactory(projects=[project])
@@ -253,6 +253,8 @@ class TestCompleteUpload:
         assert_that(response.status_code, equal_to(200))
         image.refresh_from_db()
         assert_that(image.is_main, is_(True))
+        project.refresh_from_db()
+        assert_that(project.main_image_id, equal_to(image.id))
 
     def test_fails_if_file_not_in_storage(
         self,
@@ -354,6 +356,35 @@ class TestDeleteImage:
         assert_that(response.status_code, equal_to(204))
         second_image.refresh_from_db()
         assert_that(second_image.is_main, is_(True))
+        project.refresh_from_db()
+        assert_that(project.main_image_id, equal_to(second_image.id))
+
+    def test_clears_main_image_when_last_image_deleted(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        image = ProjectImage.objects.create(
+            project=project,
+            storage_key="test/only.png",
+            original_filename="only.png",
+            content_type="image/png",
+            file_size=1024,
+            upload_status=UploadStatus.UPLOADED,
+            is_main=True,
+        )
+        project.refresh_main_image()
+
+        response = client.delete(
+            f"/api/my/projects/{project.id}/images/{image.id}",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(204))
+        project.refresh_from_db()
+        assert_that(project.main_image, equal_to(None))
 
 
 class TestSetMainImage:
@@ -394,6 +425,8 @@ class TestSetMainImage:
         image2.refresh_from_db()
         assert_that(image1.is_main, is_(False))
         assert_that(image2.is_main, is_(True))
+        project.refresh_from_db()
+        assert_that(project.main_image_id, equal_to(image2.id))
 
 
 class TestImageAuthorization:
@@ -1,9 +1,19 @@
 import pytest
-from hamcrest import assert_that, equal_to, has_entries
+from django.contrib.admin.sites import AdminSite
+from django.contrib.messages.storage.fallback import FallbackStorage
+from hamcrest import assert_that, equal_to, has_entries, has_length
 
 from api.auth.jwt import create_access_token
-from apps.projects.models import ProjectStatus
-from tests.factories import ProjectFactory, UserFactory
+from api.view_buffer import flush_views
+from apps.projects.admin import ProjectAdmin
+from apps.projects.models import Project, ProjectStatus, ProjectView, UploadStatus
+from apps.tags.models import TagStatus
+from tests.factories import (
+    ProjectFactory,
+    ProjectImageFactory,
+    TagFactory,
+    UserFactory,
+)
 
 
 @pytest.mark.django_db
@@ -19,6 +29,212 @@ class TestListProjects:
         assert_that(response.status_code, equal_to(200))
         assert_that(response.json()["pending_projects_count"], equal_to(2))
 
+    def test_pending_projects_count_is_shared_between_requests(
+        self, client, django_assert_num_queries
+    ) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+        client.get("/api/projects")
+
+        # Total count and the (empty) page - no pending count.
+        with django_assert_num_queries(2):
+            client.get("/api/projects", {"page": 2})
+
+    def test_pending_projects_count_follows_new_submissions(
+        self, client, django_capture_on_commit_callbacks
+    ) -> None:
+        client.get("/api/projects")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProjectFactory(status=ProjectStatus.PENDING)
+        response = client.get("/api/projects")
+
+        assert_that(response.json()["pending_projects_count"], equal_to(1))
+
+    def test_list_projects_follows_next_cursor(self, client) -> None:
+        for _ in range(3):
+            ProjectFactory(status=ProjectStatus.APPROVED)
+
+        first = client.get("/api/projects", {"per_page": 2, "cursor": ""}).json()
+        second = client.get(
+            "/api/projects", {"per_page": 2, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert_that(first["total"], equal_to(None))
+        assert_that(len(first["projects"]), equal_to(2))
+        assert_that(len(second["projects"]), equal_to(1))
+        assert_that(second["next_cursor"], equal_to(None))
+
+    def test_list_projects_rejects_invalid_cursor(self, client) -> None:
+        response = client.get("/api/projects", {"cursor": "garbage"})
+
+        assert_that(response.status_code, equal_to(400))
+
+
+def _add_projects(count: int, **kwargs) -> list[Project]:
+    projects = []
+    for _ in range(count):
+        project = ProjectFactory(
+            status=ProjectStatus.APPROVED,
+            tags=[TagFactory(), TagFactory(status=TagStatus.REJECTED)],
+            **kwargs,
+        )
+        ProjectImageFactory(project=project)
+        ProjectImageFactory(project=project, upload_status=UploadStatus.PENDING)
+        projects.append(project)
+    return projects
+
+
+@pytest.mark.django_db
+class TestProjectQueryCount:
+    def test_list_query_count_is_constant(self, client, query_budget) -> None:
+        projects = []
+
+        def grow(size: int) -> None:
+            projects.extend(_add_projects(size - len(projects)))
+
+        query_budget(grow, lambda _: client.get("/api/projects", {"per_page": 100}))
+
+    def test_detail_query_count_does_not_grow_with_tags_or_images(
+        self, client, query_budget
+    ) -> None:
+        (project,) = _add_projects(1)
+
+        def grow(size: int) -> None:
+            while project.tags.count() < size:
+                project.tags.add(TagFactory())
+                ProjectImageFactory(project=project)
+
+        query_budget(grow, lambda _: client.get(f"/api/projects/{project.id}"))
+
+    def test_list_hides_rejected_tags_and_unfinished_uploads(self, client) -> None:
+        _add_projects(1)
+
+        (project,) = client.get("/api/projects").json()["projects"]
+
+        assert_that(project["tags"], has_length(1))
+        assert_that(project["images"], has_length(1))
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def test_returns_weak_etag(self, client) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+
+        response = client.get("/api/projects")
+
+        assert_that(response.status_code, equal_to(200))
+        assert response["ETag"].startswith('W/"')
+
+    def test_matching_etag_returns_not_modified_without_running_the_route(
+        self, client, django_assert_num_queries
+    ) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+        etag = client.get("/api/projects")["ETag"]
+
+        with django_assert_num_queries(0):
+            response = client.get("/api/projects", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(304))
+        assert_that(response["ETag"], equal_to(etag))
+        assert_that(response.content, equal_to(b""))
+
+    def test_etag_depends_on_filters(self, client) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+        etag = client.get("/api/projects")["ETag"]
+
+        response = client.get(
+            "/api/projects", {"search": "no-such-project"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert_that(response.status_code, equal_to(200))
+
+    def test_etag_changes_when_a_project_changes(
+        self, client, django_capture_on_commit_callbacks
+    ) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        etag = client.get("/api/projects")["ETag"]
+
+        project.title = "Renamed"
+        with django_capture_on_commit_callbacks(execute=True):
+            project.save()
+        response = client.get("/api/projects", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response.json()["projects"][0]["title"], equal_to("Renamed"))
+
+    def test_etag_changes_when_the_owner_changes(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED, is_featured=True)
+        etag = client.get("/api/projects/featured")["ETag"]
+
+        project.owner.first_name = "Renamed"
+        project.owner.save()
+        response = client.get("/api/projects/featured", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response.json()[0]["owner"]["first_name"], equal_to("Renamed"))
+
+    def test_not_found_has_no_etag(self, client) -> None:
+        response = client.get("/api/projects/00000000-0000-0000-0000-000000000000")
+
+        assert_that(response.status_code, equal_to(404))
+        assert not response.has_header("ETag")
+
+
+@pytest.mark.django_db
+class TestFeaturedProjectsCache:
+    def test_serves_repeat_requests_from_cache(
+        self, client, django_assert_num_queries
+    ) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED, is_featured=True)
+        first = client.get("/api/projects/featured").json()
+
+        with django_assert_num_queries(0):
+            second = client.get("/api/projects/featured").json()
+
+        assert_that(second, equal_to(first))
+
+    def test_project_save_invalidates_cache(
+        self, client, django_capture_on_commit_callbacks
+    ) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED, is_featured=True)
+        client.get("/api/projects/featured")
+
+        project.title = "Renamed"
+        with django_capture_on_commit_callbacks(execute=True):
+            project.save()
+        response = client.get("/api/projects/featured")
+
+        assert_that(response.json()[0]["title"], equal_to("Renamed"))
+
+    def test_admin_feature_action_invalidates_cache(self, client, rf) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        assert_that(client.get("/api/projects/featured").json(), equal_to([]))
+
+        request = rf.post("/admin/projects/project/")
+        request.session = "session"
+        request._messages = FallbackStorage(request)  # noqa: SLF001
+        ProjectAdmin(Project, AdminSite()).feature_projects(
+            request, Project.objects.filter(pk=project.pk)
+        )
+        response = client.get("/api/projects/featured")
+
+        assert_that([p["id"] for p in response.json()], equal_to([str(project.id)]))
+
+
+@pytest.mark.django_db
+class TestTrendingProjects:
+    def test_orders_by_trending_score_then_visitors(self, client) -> None:
+        steady = ProjectFactory(status=ProjectStatus.APPROVED, monthly_visitors=500)
+        rising = ProjectFactory(status=ProjectStatus.APPROVED, trending_score=12)
+        quiet = ProjectFactory(status=ProjectStatus.APPROVED, monthly_visitors=5)
+
+        response = client.get("/api/projects/trending")
+
+        assert_that(
+            [p["id"] for p in response.json()],
+            equal_to([str(rising.id), str(steady.id), str(quiet.id)]),
+        )
+
 
 @pytest.mark.django_db
 class TestGetPublicProject:
@@ -154,3 +370,109 @@ class TestGetPublicProject:
                 title=project.title,
             ),
         )
+
+
+@pytest.mark.django_db
+class TestRecordProjectView:
+    def test_buffers_views_without_queries(
+        self, client, django_assert_num_queries
+    ) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        with django_assert_num_queries(0):
+            response = client.post(f"/api/projects/{project.id}/views")
+
+        assert_that(response.status_code, equal_to(202))
+        assert_that(ProjectView.objects.count(), equal_to(0))
+
+    def test_flush_writes_one_view_per_visitor(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        other = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        client.post(f"/api/projects/{project.id}/views", HTTP_USER_AGENT="Firefox")
+        client.post(f"/api/projects/{project.id}/views")
+        client.post(f"/api/projects/{project.id}/views", REMOTE_ADDR="10.0.0.9")
+        client.post(f"/api/projects/{other.id}/views")
+
+        assert_that(flush_views(), equal_to(3))
+        assert_that(
+            set(ProjectView.objects.values_list("project_id", "viewer_ip")),
+            equal_to(
+                {
+                    (project.id, "127.0.0.1"),
+                    (project.id, "10.0.0.9"),
+                    (other.id, "127.0.0.1"),
+                }
+            ),
+        )
+        assert_that(
+            ProjectView.objects.get(viewer_ip="127.0.0.1", project=project).user_agent,
+            equal_to("Firefox"),
+        )
+
+    def test_uses_ip_appended_by_the_trusted_proxy(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        client.post(
+            f"/api/projects/{project.id}/views",
+            HTTP_X_FORWARDED_FOR="198.51.100.1, 203.0.113.7",
+        )
+        flush_views()
+
+        assert_that(ProjectView.objects.get().viewer_ip, equal_to("203.0.113.7"))
+
+    def test_skips_trusted_proxies(self, client, settings) -> None:
+        settings.TRUSTED_PROXY_COUNT = 2
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        client.post(
+            f"/api/projects/{project.id}/views",
+            HTTP_X_FORWARDED_FOR="198.51.100.1, 203.0.113.7, 10.0.0.1",
+        )
+        flush_views()
+
+        assert_that(ProjectView.objects.get().viewer_ip, equal_to("203.0.113.7"))
+
+    def test_invalid_ip_is_not_recorded(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        response = client.post(
+            f"/api/projects/{project.id}/views", HTTP_X_FORWARDED_FOR="unknown"
+        )
+        client.post(f"/api/projects/{project.id}/views", REMOTE_ADDR="10.0.0.1")
+        flush_views()
+
+        assert_that(response.status_code, equal_to(202))
+        assert_that(
+            list(ProjectView.objects.values_list("viewer_ip", flat=True)),
+            equal_to(["10.0.0.1"]),
+        )
+
+    def test_flushes_when_buffer_is_full(self, client, settings) -> None:
+        settings.VIEW_BUFFER_SIZE = 2
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        client.post(f"/api/projects/{project.id}/views", REMOTE_ADDR="10.0.0.1")
+        assert_that(ProjectView.objects.count(), equal_to(0))
+        client.post(f"/api/projects/{project.id}/views", REMOTE_ADDR="10.0.0.2")
+
+        assert_that(ProjectView.objects.count(), equal_to(2))
+
+    def test_first_batch_refreshes_monthly_visitors(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        client.post(f"/api/projects/{project.id}/views", REMOTE_ADDR="10.0.0.1")
+        client.post(f"/api/projects/{project.id}/views", REMOTE_ADDR="10.0.0.2")
+        flush_views()
+
+        project.refresh_from_db()
+        assert_that(project.monthly_visitors, equal_to(2))
+
+    def test_unknown_project_is_discarded_on_flush(self, client) -> None:
+        response = client.post(
+            "/api/projects/00000000-0000-0000-0000-000000000000/views"
+        )
+        flush_views()
+
+        assert_that(response.status_code, equal_to(202))
+        assert_that(ProjectView.objects.count(), equal_to(0))
@@ -0,0 +1,634 @@
+"""Query budgets: no route may run more queries as the dataset grows.
+
+Each test grows the data a route renders (projects, tags, competitions,
+rankings...) to every size in QUERY_BUDGET_SIZES and lets the query_budget
+fixture compare the query counts. Routes that paginate, limit or aggregate
+pass large=True to grow past their page sizes and limits.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from api.auth.jwt import create_access_token, create_refresh_token, create_reset_token
+from apps.projects.models import (
+    CompetitionStatus,
+    ProjectStatus,
+    ReviewStatus,
+    UploadStatus,
+)
+from apps.tags.models import TagStatus
+from services import HANDLERS
+from services.storage import storage_service
+from tests.factories import (
+    CompetitionFactory,
+    CompetitionReviewerFactory,
+    EmailVerificationCodeFactory,
+    PasswordResetCodeFactory,
+    ProjectFactory,
+    ProjectImageFactory,
+    ProjectRankingFactory,
+    ProjectViewFactory,
+    TagCategoryFactory,
+    TagFactory,
+    UserFactory,
+)
+
+
+def _headers(user) -> dict[str, str]:
+    return {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(user.id)}"}
+
+
+def _put_json(client, url: str, payload: dict, **headers):
+    return client.put(
+        url, data=json.dumps(payload), content_type="application/json", **headers
+    )
+
+
+def _post_json(client, url: str, payload: dict, **headers):
+    return client.post(
+        url, data=json.dumps(payload), content_type="application/json", **headers
+    )
+
+
+def _full_project(**kwargs):
+    """A project with everything a project response renders."""
+    project = ProjectFactory(tags=[TagFactory()], tech_stack=["Django"], **kwargs)
+    ProjectImageFactory(project=project, is_main=True)
+    ProjectImageFactory(project=project, upload_status=UploadStatus.PENDING)
+    return project
+
+
+class _Grower:
+    """Grows a list by calling make() until it holds size items."""
+
+    def __init__(self, make) -> None:
+        self.make = make
+        self.items = []
+
+    def __call__(self, size: int) -> list:
+        while len(self.items) < size:
+            self.items.append(self.make())
+        return self.items
+
+
+@pytest.mark.django_db
+class TestProjectRoutes:
+    def test_list(self, client, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(status=ProjectStatus.APPROVED))
+
+        query_budget(
+            grow, lambda _: client.get("/api/projects", {"per_page": 100}), large=True
+        )
+
+    def test_list_with_filters(self, client, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(status=ProjectStatus.APPROVED))
+
+        query_budget(
+            grow,
+            lambda _: client.get(
+                "/api/projects",
+                {"per_page": 100, "tech_stack": "django", "sort_by": "title"},
+            ),
+            large=True,
+        )
+
+    def test_featured(self, client, query_budget) -> None:
+        grow = _Grower(
+            lambda: _full_project(status=ProjectStatus.APPROVED, is_featured=True)
+        )
+
+        query_budget(grow, lambda _: client.get("/api/projects/featured"), large=True)
+
+    def test_trending(self, client, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(status=ProjectStatus.APPROVED))
+
+        query_budget(grow, lambda _: client.get("/api/projects/trending"), large=True)
+
+    def test_detail(self, client, query_budget) -> None:
+        project = _full_project(status=ProjectStatus.APPROVED)
+
+        def grow_tags_and_images(size: int) -> None:
+            while project.tags.count() < size:
+                project.tags.add(TagFactory())
+                ProjectImageFactory(project=project)
+
+        query_budget(
+            grow_tags_and_images, lambda _: client.get(f"/api/projects/{project.id}")
+        )
+
+    def test_record_view(self, client, query_budget) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        grow = _Grower(lambda: ProjectViewFactory(project=project))
+
+        count = query_budget(
+            grow, lambda _: client.post(f"/api/projects/{project.id}/views")
+        )
+
+        assert count == 0
+
+
+@pytest.mark.django_db
+class TestMyProjectRoutes:
+    def test_list(self, client, user, auth_headers, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(owner=user))
+
+        query_budget(grow, lambda _: client.get("/api/my/projects", **auth_headers))
+
+    def test_create(self, client, auth_headers, query_budget) -> None:
+        CompetitionFactory(status=CompetitionStatus.ACCEPTING_APPLICATIONS)
+        grow = _Grower(TagFactory)
+
+        query_budget(
+            grow,
+            lambda tags: _post_json(
+                client,
+                "/api/my/projects",
+                {
+                    "website_url": "https://example.com",
+                    "tech_stack": [f"Tech {tag.name}" for tag in tags],
+                    "tag_ids": [str(tag.id) for tag in tags],
+                },
+                **auth_headers,
+            ),
+        )
+
+    def test_detail(self, client, user, auth_headers, query_budget) -> None:
+        project = _full_project(owner=user)
+        grow = _Grower(lambda: project.tags.add(TagFactory()))
+
+        query_budget(
+            grow, lambda _: client.get(f"/api/my/projects/{project.id}", **auth_headers)
+        )
+
+    def test_update(self, client, user, auth_headers, query_budget) -> None:
+        project = _full_project(owner=user)
+
+        # A fresh set each time, so every update drops and adds rows.
+        query_budget(
+            TagFactory.create_batch,
+            lambda tags: _put_json(
+                client,
+                f"/api/my/projects/{project.id}",
+                {
+                    "website_url": "https://example.com",
+                    "tech_stack": [f"Tech {tag.name}" for tag in tags],
+                    "tag_ids": [str(tag.id) for tag in tags],
+                },
+                **auth_headers,
+            ),
+        )
+
+    def test_delete(self, client, user, auth_headers, query_budget) -> None:
+        def project_with_related(size: int):
+            project = ProjectFactory(
+                owner=user, tags=TagFactory.create_batch(size // 10 + 1)
+            )
+            ProjectImageFactory.create_batch(size // 10 + 1, project=project)
+            return project
+
+        query_budget(
+            project_with_related,
+            lambda project: client.delete(
+                f"/api/my/projects/{project.id}", **auth_headers
+            ),
+        )
+
+    def test_resubmit(self, client, user, auth_headers, query_budget) -> None:
+        others = _Grower(lambda: _full_project(owner=user))
+
+        def grow(size: int):
+            others(size)
+            return _full_project(owner=user, status=ProjectStatus.REJECTED)
+
+        query_budget(
+            grow,
+            lambda project: client.post(
+                f"/api/my/projects/{project.id}/resubmit", **auth_headers
+            ),
+        )
+
+
+@pytest.mark.django_db
+class TestProjectImageRoutes:
+    @pytest.fixture(autouse=True)
+    def _fake_storage(self):
+        presigned = {
+            "upload_url": "https://s3.test/put",
+            "method": "PUT",
+            "headers": {},
+        }
+        with (
+            patch.object(
+                storage_service,
+                "generate_presigned_upload_url",
+                return_value=presigned,
+            ),
+            patch.object(storage_service, "object_exists", return_value=True),
+            patch.object(storage_service, "delete_object"),
+        ):
+            yield
+
+    def test_upload_url(self, client, user, auth_headers, query_budget) -> None:
+        project = ProjectFactory(owner=user)
+        grow = _Grower(lambda: _full_project(owner=user))
+
+        query_budget(
+            grow,
+            lambda _: _post_json(
+                client,
+                f"/api/my/projects/{project.id}/images/upload-url",
+                {
+                    "filename": "shot.png",
+                    "content_type": "image/png",
+                    "file_size": 1024,
+                },
+                **auth_headers,
+            ),
+        )
+
+    def test_complete_upload(self, client, user, auth_headers, query_budget) -> None:
+        project = ProjectFactory(owner=user)
+        uploaded = _Grower(lambda: ProjectImageFactory(project=project))
+
+        def grow(size: int):
+            uploaded(size)
+            return ProjectImageFactory(
+                project=project, upload_status=UploadStatus.PENDING
+            )
+
+        query_budget(
+            grow,
+            lambda image: _post_json(
+                client,
+                f"/api/my/projects/{project.id}/images/{image.id}/complete",
+                {"width": 100, "height": 100},
+                **auth_headers,
+            ),
+        )
+
+    def test_set_main_image(self, client, user, auth_headers, query_budget) -> None:
+        project = ProjectFactory(owner=user)
+        grow = _Grower(lambda: ProjectImageFactory(project=project))
+
+        query_budget(
+            grow,
+            lambda images: _post_json(
+                client,
+                f"/api/my/projects/{project.id}/images/main",
+                {"image_id": str(images[-1].id)},
+                **auth_headers,
+            ),
+        )
+
+    def test_delete_image(self, client, user, auth_headers, query_budget) -> None:
+        project = ProjectFactory(owner=user)
+        uploaded = _Grower(lambda: ProjectImageFactory(project=project))
+
+        def grow(size: int):
+            uploaded(size)
+            return ProjectImageFactory(project=project, is_main=True)
+
+        query_budget(
+            grow,
+            lambda image: client.delete(
+                f"/api/my/projects/{project.id}/images/{image.id}", **auth_headers
+            ),
+        )
+
+
+@pytest.mark.django_db
+class TestTagRoutes:
+    def test_list(self, client, query_budget) -> None:
+        query_budget(_Grower(TagFactory), lambda _: client.get("/api/tags"))
+
+    def test_categories(self, client, query_budget) -> None:
+        grow = _Grower(TagCategoryFactory)
+
+        query_budget(grow, lambda _: client.get("/api/tags/categories"))
+
+    def test_grouped(self, client, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(status=ProjectStatus.APPROVED))
+
+        query_budget(
+            grow,
+            lambda _: client.get("/api/tags/grouped", {"with_projects": True}),
+            large=True,
+        )
+
+    def test_suggest(self, client, auth_headers, query_budget) -> None:
+        category = TagCategoryFactory()
+        grow = _Grower(lambda: TagFactory(category=category))
+
+        query_budget(
+            grow,
+            lambda tags: _post_json(
+                client,
+                "/api/tags/suggest",
+                {"name": f"Suggested {len(tags)}", "category_id": str(category.id)},
+                **auth_headers,
+            ),
+        )
+
+    def test_pending(self, client, query_budget) -> None:
+        headers = _headers(UserFactory(is_staff=True))
+        grow = _Grower(lambda: TagFactory(status=TagStatus.PENDING))
+
+        query_budget(grow, lambda _: client.get("/api/tags/admin/pending", **headers))
+
+    @pytest.mark.parametrize("action", ["approve", "reject"])
+    def test_review(self, client, query_budget, action) -> None:
+        headers = _headers(UserFactory(is_staff=True))
+        projects = _Grower(lambda: ProjectFactory(status=ProjectStatus.APPROVED))
+
+        def tag_on_projects(size: int):
+            tag = TagFactory(status=TagStatus.PENDING)
+            tag.projects.add(*projects(size))
+            return tag
+
+        query_budget(
+            tag_on_projects,
+            lambda tag: client.put(f"/api/tags/admin/{tag.id}/{action}", **headers),
+        )
+
+
+def _competition_with_projects(size: int, **kwargs):
+    competition = CompetitionFactory(**kwargs)
+    competition.projects.add(
+        *(_full_project(status=ProjectStatus.APPROVED) for _ in range(size))
+    )
+    return competition
+
+
+@pytest.mark.django_db
+class TestCompetitionRoutes:
+    @pytest.mark.parametrize(
+        "url", ["/api/competitions", "/api/competitions/with-projects"]
+    )
+    def test_list(self, client, query_budget, url) -> None:
+        grow = _Grower(
+            lambda: _competition_with_projects(
+                1, winner=_full_project(status=ProjectStatus.APPROVED)
+            )
+        )
+
+        query_budget(grow, lambda _: client.get(url), large=True)
+
+    def test_active_or_most_recent(self, client, query_budget) -> None:
+        active = CompetitionFactory(status=CompetitionStatus.ACCEPTING_APPLICATIONS)
+        grow = _Grower(lambda: active.projects.add(_full_project()))
+
+        query_budget(
+            grow,
+            lambda _: client.get("/api/competitions/active-or-most-recent"),
+            large=True,
+        )
+
+    def test_detail(self, client, query_budget) -> None:
+        competition = CompetitionFactory()
+        grow = _Grower(
+            lambda: competition.projects.add(
+                _full_project(status=ProjectStatus.APPROVED)
+            )
+        )
+
+        query_budget(
+            grow,
+            lambda _: client.get(f"/api/competitions/{competition.slug}"),
+            large=True,
+        )
+
+
+@pytest.mark.django_db
+class TestMyReviewRoutes:
+    def test_list_competitions(self, client, user, auth_headers, query_budget) -> None:
+        grow = _Grower(
+            lambda: CompetitionReviewerFactory(
+                user=user, competition=_competition_with_projects(2)
+            )
+        )
+
+        query_budget(
+            grow, lambda _: client.get("/api/my/reviews/competitions", **auth_headers)
+        )
+
+    def test_competition_detail(self, client, user, auth_headers, query_budget) -> None:
+        competition = CompetitionReviewerFactory(user=user).competition
+
+        def rank_new_project() -> None:
+            project = _full_project(status=ProjectStatus.APPROVED)
+            competition.projects.add(project)
+            ProjectRankingFactory(
+                reviewer=user, competition=competition, project=project
+            )
+
+        query_budget(
+            _Grower(rank_new_project),
+            lambda _: client.get(
+                f"/api/my/reviews/competitions/{competition.id}", **auth_headers
+            ),
+        )
+
+    def test_update_rankings(self, client, user, auth_headers, query_budget) -> None:
+        competition = CompetitionReviewerFactory(user=user).competition
+
+        def entry():
+            project = ProjectFactory(status=ProjectStatus.APPROVED)
+            competition.projects.add(project)
+            # Already ranked, as when a reviewer reorders their list.
+            ProjectRankingFactory(
+                reviewer=user,
+                competition=competition,
+                project=project,
+                position=competition.projects.count(),
+            )
+            return project
+
+        query_budget(
+            _Grower(entry),
+            lambda projects: _put_json(
+                client,
+                f"/api/my/reviews/competitions/{competition.id}/rankings",
+                {"project_ids": [str(p.id) for p in reversed(projects)]},
+                **auth_headers,
+            ),
+        )
+
+    def test_update_status(self, client, user, auth_headers, query_budget) -> None:
+        competition = CompetitionReviewerFactory(user=user).competition
+        grow = _Grower(lambda: competition.projects.add(ProjectFactory()))
+
+        query_budget(
+            grow,
+            lambda _: _put_json(
+                client,
+                f"/api/my/reviews/competitions/{competition.id}/status",
+                {"status": ReviewStatus.IN_PROGRESS},
+                **auth_headers,
+            ),
+        )
+
+    def test_project_detail(self, client, user, auth_headers, query_budget) -> None:
+        project = _full_project(status=ProjectStatus.APPROVED)
+        CompetitionReviewerFactory(
+            user=user, competition=CompetitionFactory(projects=[project])
+        )
+
+        def grow_tags_and_images(size: int) -> None:
+            while project.tags.count() < size:
+                project.tags.add(TagFactory())
+                ProjectImageFactory(project=project)
+
+        query_budget(
+            grow_tags_and_images,
+            lambda _: client.get(
+                f"/api/my/reviews/projects/{project.id}", **auth_headers
+            ),
+        )
+
+
+@pytest.mark.django_db
+class TestUserRoutes:
+    def test_public_profile(self, client, user, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(owner=user))
+
+        query_budget(grow, lambda _: client.get(f"/api/users/{user.id}"))
+
+
+@pytest.mark.django_db
+class TestAuthRoutes:
+    """Auth routes touch one user; grow the user table around them."""
+
+    @pytest.fixture(autouse=True)
+    def _no_emails(self):
+        with (
+            patch.object(HANDLERS.email, "send_verification_email"),
+            patch.object(HANDLERS.email, "send_password_reset_email"),
+        ):
+            yield
+
+    def test_register(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        query_budget(
+            users,
+            lambda existing: _post_json(
+                client,
+                "/api/auth/register",
+                {
+                    "email": f"new{len(existing)}@example.com",
+                    "password": "testpassword123",
+                    "kennitala": f"99{len(existing):08d}",
+                },
+            ),
+        )
+
+    def test_login(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        query_budget(
+            lambda size: users(size)[-1],
+            lambda user: _post_json(
+                client,
+                "/api/auth/login",
+                {"email": user.email, "password": "testpassword123"},
+            ),
+        )
+
+    def test_refresh(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        query_budget(
+            lambda size: users(size)[-1],
+            lambda user: _post_json(
+                client,
+                "/api/auth/refresh",
+                {"refresh_token": create_refresh_token(user.id)},
+            ),
+        )
+
+    def test_me(self, client, user, auth_headers, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(owner=user))
+
+        query_budget(grow, lambda _: client.get("/api/auth/me", **auth_headers))
+
+    def test_update_me(self, client, user, auth_headers, query_budget) -> None:
+        grow = _Grower(lambda: _full_project(owner=user))
+
+        query_budget(
+            grow,
+            lambda _: _put_json(
+                client, "/api/auth/me", {"info": "Hello"}, **auth_headers
+            ),
+        )
+
+    def test_verify_email(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        def unverified_user_with_code(size: int):
+            users(size)
+            return EmailVerificationCodeFactory(user=UserFactory(is_verified=False))
+
+        query_budget(
+            unverified_user_with_code,
+            lambda code: _post_json(
+                client,
+                "/api/auth/verify-email",
+                {"code": code.code},
+                **_headers(code.user),
+            ),
+        )
+
+    def test_resend_verification(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        def unverified_user(size: int):
+            users(size)
+            return UserFactory(is_verified=False)
+
+        query_budget(
+            unverified_user,
+            lambda user: client.post("/api/auth/resend-verification", **_headers(user)),
+        )
+
+    def test_forgot_password(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        query_budget(
+            lambda size: users(size)[-1],
+            lambda user: _post_json(
+                client, "/api/auth/forgot-password", {"email": user.email}
+            ),
+        )
+
+    def test_forgot_password_verify(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        def reset_code(size: int):
+            users(size)
+            return PasswordResetCodeFactory()
+
+        query_budget(
+            reset_code,
+            lambda code: _post_json(
+                client,
+                "/api/auth/forgot-password/verify",
+                {"email": code.user.email, "code": code.code},
+            ),
+        )
+
+    def test_reset_password(self, client, query_budget) -> None:
+        users = _Grower(UserFactory)
+
+        query_budget(
+            lambda size: users(size)[-1],
+            lambda user: _post_json(
+                client,
+                "/api/auth/reset-password",
+                {
+                    "reset_token": create_reset_token(user.id),
+                    "new_password": "anotherpassword123",
+                },
+            ),
+        )
@@ -1,5 +1,7 @@
 import json
+import warnings
 
+from django.core.cache.backends.base import CacheKeyWarning
 from hamcrest import (
     assert_that,
     equal_to,
@@ -115,6 +117,23 @@ class TestListTagsGrouped:
         assert str(empty_category.id) not in category_ids
         assert str(category_with_tags.id) in category_ids
 
+    def test_new_tag_invalidates_cached_response(self, client, db) -> None:
+        category = TagCategory.objects.first()
+        client.get("/api/tags/grouped")
+
+        new_tag = TagFactory(category=category)
+        response = client.get("/api/tags/grouped")
+
+        tag_ids = [t["id"] for group in response.json() for t in group["tags"]]
+        assert_that(tag_ids, has_item(str(new_tag.id)))
+
+    def test_cache_keys_are_valid_memcached_keys(self, client, db) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CacheKeyWarning)
+            response = client.get("/api/tags/grouped", {"with_projects": True})
+
+        assert_that(response.status_code, equal_to(200))
+
 
 class TestSuggestTag:
     def test_creates_pending_tag(self, client, auth_headers, db) -> None:
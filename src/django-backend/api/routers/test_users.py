@@ -137,3 +137,20 @@ class TestPublicProfile:
                 info="",
             ),
         )
+
+    def test_get_public_profile_honours_if_none_match(self, client, user) -> None:
+        etag = client.get(f"/api/users/{user.id}")["ETag"]
+
+        response = client.get(f"/api/users/{user.id}", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(304))
+
+    def test_get_public_profile_etag_changes_with_profile(self, client, user) -> None:
+        etag = client.get(f"/api/users/{user.id}")["ETag"]
+
+        user.info = "Updated"
+        user.save()
+        response = client.get(f"/api/users/{user.id}", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response.json(), has_entries(info="Updated"))
@@ -5,7 +5,9 @@ from uuid import UUID  # noqa: TC003 - needed at runtime for ninja path param
 
 from django.http import HttpRequest
 from ninja import Router
+from ninja.decorators import decorate_view
 
+from api.conditional import conditional_get
 from api.schemas.errors import Error
 from api.schemas.user import PublicUserProfile
 from services import REPO
@@ -22,6 +24,7 @@ router = Router()
     response={200: PublicUserProfile, 404: Error},
     tags=["Users"],
 )
+@decorate_view(conditional_get)
 def get_public_profile(
     request: HttpRequest,
     user_id: UUID,
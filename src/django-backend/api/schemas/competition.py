@@ -4,9 +4,10 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
+from django.db.models import Prefetch
 from ninja import Schema
 
-from apps.projects.models import ProjectStatus
+from apps.tags.models import Tag
 
 from .tag import TagWithCategoryResponse
 
@@ -17,6 +18,23 @@ class CompetitionStatusEnum(str, Enum):
     CLOSED = "closed"
 
 
+def competition_project_prefetches(prefix: str = "") -> list[Prefetch]:
+    """Prefetches that let CompetitionProjectResponse serialize without queries.
+
+    ``prefix`` is the lookup path to the projects (e.g. ``"winner"``), or empty
+    when prefetching on a Project queryset directly. The projects themselves
+    should be loaded with ``select_related("main_image")``.
+    """
+    lookup = f"{prefix}__" if prefix else ""
+    return [
+        Prefetch(
+            f"{lookup}tags",
+            queryset=Tag.objects.select_related("category"),
+            to_attr="prefetched_tags",
+        ),
+    ]
+
+
 class CompetitionProjectResponse(Schema):
     id: UUID
     title: str
@@ -25,11 +43,11 @@ class CompetitionProjectResponse(Schema):
 
     @classmethod
     def from_project(cls, project: Any) -> "CompetitionProjectResponse":
-        main_image = project.images.filter(
-            upload_status="uploaded", is_main=True
-        ).first()
-        if not main_image:
-            main_image = project.images.filter(upload_status="uploaded").first()
+        # Projects loaded through competition_project_prefetches() carry their
+        # tags in memory; anything else falls back to querying.
+        tags = getattr(project, "prefetched_tags", None)
+        if tags is None:
+            tags = list(project.tags.select_related("category").all())
 
         return cls(
             id=project.id,
@@ -45,9 +63,9 @@ class CompetitionProjectResponse(Schema):
                     category_slug=tag.category.slug if tag.category else None,
                     status=tag.status,
                 )
-                for tag in project.tags.select_related("category").all()
+                for tag in tags
             ],
-            main_image_url=main_image.url if main_image else None,
+            main_image_url=project.main_image_url,
         )
 
 
@@ -68,11 +86,11 @@ class CompetitionResponse(Schema):
 
     @classmethod
     def from_competition(cls, competition: Any) -> "CompetitionResponse":
-        approved_projects = list(
-            competition.projects.filter(status=ProjectStatus.APPROVED)
-            .order_by("title")
-            .prefetch_related("images")
-        )
+        """Build from a competition annotated with project counts.
+
+        Expects ``project_count`` and ``pending_projects_count`` annotations and
+        an ``approved_projects`` prefetch (see the competitions router).
+        """
         return cls(
             id=competition.id,
             name=competition.name,
@@ -83,18 +101,17 @@ class CompetitionResponse(Schema):
             prize_amount=competition.prize_amount,
             status=competition.status,
             image_url=competition.image_url,
-            project_count=competition.projects.count(),
+            project_count=competition.project_count,
             projects=[
-                CompetitionProjectResponse.from_project(p) for p in approved_projects
+                CompetitionProjectResponse.from_project(p)
+                for p in competition.approved_projects
             ],
             winner=(
                 CompetitionProjectResponse.from_project(competition.winner)
                 if competition.winner
                 else None
             ),
-            pending_projects_count=competition.projects.filter(
-                status=ProjectStatus.PENDING
-            ).count(),
+            pending_projects_count=competition.pending_projects_count,
         )
 
 
@@ -121,10 +138,8 @@ class CompetitionOverviewResponse(Schema):
             prize_amount=competition.prize_amount,
             status=competition.status,
             image_url=competition.image_url,
-            project_count=competition.projects.count(),
-            pending_projects_count=competition.projects.filter(
-                status=ProjectStatus.PENDING
-            ).count(),
+            project_count=competition.project_count,
+            pending_projects_count=competition.pending_projects_count,
         )
 
 
@@ -163,3 +178,27 @@ class CompetitionSummaryResponse(Schema):
 class ActiveOrRecentResponse(Schema):
     active: CompetitionSummaryResponse | None = None
     recent: CompetitionSummaryResponse | None = None
+
+
+class ProjectResultResponse(Schema):
+    project_id: UUID
+    title: str
+    position: int
+    borda_score: int
+    mean_rank: float
+    ranked_by: int
+
+
+class ReviewerAgreementResponse(Schema):
+    reviewer_id: UUID
+    email: str
+    ranked: int
+    agreement: float | None = None
+
+
+class CompetitionResultsResponse(Schema):
+    """Consensus ranking of a competition's projects across its reviewers."""
+
+    projects: list[ProjectResultResponse]
+    reviewers: list[ReviewerAgreementResponse]
+    agreement: float | None = None
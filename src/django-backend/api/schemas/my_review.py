@@ -41,13 +41,6 @@ class ReviewProjectResponse(Schema):
     main_image_url: str | None = None
     my_ranking: int | None = None
 
-    @staticmethod
-    def resolve_main_image_url(obj: Any) -> str | None:
-        main_image = obj.images.filter(upload_status="uploaded", is_main=True).first()
-        if not main_image:
-            main_image = obj.images.filter(upload_status="uploaded").first()
-        return main_image.url if main_image else None
-
 
 class ReviewCompetitionDetailResponse(Schema):
     """Competition detail with projects and reviewer's rankings."""
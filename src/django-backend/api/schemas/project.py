@@ -63,15 +63,24 @@ class ProjectResponse(Schema):
     images: list[ProjectImageResponse] = []
     won_competitions: list[WonCompetitionInfo] = []
 
+    # uploaded_images and visible_tags are prefetched by the project queries;
+    # projects loaded any other way fall back to a query each.
+
     @staticmethod
     def resolve_images(obj: Any) -> list[Any]:
         """Only return uploaded images."""
+        uploaded = getattr(obj, "uploaded_images", None)
+        if uploaded is not None:
+            return uploaded
         return list(obj.images.filter(upload_status="uploaded"))
 
     @staticmethod
     def resolve_tags(obj: Any) -> list[Any]:
         """Only return non-rejected tags."""
-        return list(obj.tags.exclude(status="rejected"))
+        visible = getattr(obj, "visible_tags", None)
+        if visible is not None:
+            return visible
+        return list(obj.tags.exclude(status="rejected").select_related("category"))
 
     @staticmethod
     def resolve_won_competitions(obj: Any) -> list[Any]:
@@ -124,10 +133,12 @@ class SetMainImageRequest(Schema):
 
 class ProjectListResponse(Schema):
     projects: list[ProjectResponse]
-    total: int
-    page: int
+    # total, page and pages are null when paginating by cursor
+    total: int | None
+    page: int | None
     per_page: int
-    pages: int
+    pages: int | None
+    next_cursor: str | None = None
     pending_projects_count: int
 
 
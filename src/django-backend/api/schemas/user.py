@@ -29,7 +29,8 @@ class UserResponse(Schema):
 
     @staticmethod
     def resolve_groups(obj: Any) -> list[str]:
-        return list(obj.groups.values_list("name", flat=True))
+        # all() so a prefetched user (see api/auth/user_cache.py) needs no query.
+        return [group.name for group in obj.groups.all()]
 
 
 class UserUpdate(Schema):
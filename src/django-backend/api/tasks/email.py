@@ -4,6 +4,7 @@ from uuid import UUID
 
 from django_tasks import task
 
+from apps.emails.models import BroadcastEmail
 from apps.projects.models import Project
 from apps.users.models import User
 
@@ -30,3 +31,27 @@ def send_project_approved_email(project_id: str) -> None:
 
     project = Project.objects.select_related("owner").get(id=UUID(project_id))
     HANDLERS.email.send_project_approved_email(project)
+
+
+@task()
+def send_project_approved_emails(project_ids: list[str]) -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    projects = list(
+        Project.objects.select_related("owner")
+        .filter(id__in=[UUID(project_id) for project_id in project_ids])
+        .order_by("id")
+    )
+    HANDLERS.email.send_project_approved_emails(projects)
+
+
+@task()
+def send_broadcast(broadcast_id: str) -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    broadcast = BroadcastEmail.objects.select_related("sent_by").get(
+        id=UUID(broadcast_id)
+    )
+    if broadcast.is_sent:
+        return
+    HANDLERS.email.send_broadcast(broadcast, broadcast.sent_by)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django_tasks import task
+
+from api.cache import invalidate_response_cache
+from services.project.handler_interface import RecordViewInput
+
+
+@task()
+def record_project_views(views: list[dict[str, str]]) -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    HANDLERS.project.record_views(
+        [
+            RecordViewInput(
+                project_id=UUID(view["project_id"]),
+                viewer_ip=view["viewer_ip"],
+                user_agent=view["user_agent"],
+            )
+            for view in views
+        ]
+    )
+    # There is no scheduler, so recorded traffic drives the periodic rollups.
+    # add() only succeeds for the first batch of each interval.
+    interval = settings.VISITOR_ROLLUP_INTERVAL
+    if cache.add(f"visitor-rollup:{int(time.time() // interval)}", 1, interval):
+        refresh_visitor_counts.enqueue()
+        refresh_trending_scores.enqueue()
+
+
+@task()
+def refresh_visitor_counts() -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    if HANDLERS.project.refresh_visitor_counts():
+        # Listings show and sort by monthly_visitors.
+        invalidate_response_cache()
+
+
+@task()
+def refresh_trending_scores() -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    if HANDLERS.project.refresh_trending_scores():
+        # The trending listing is ordered by trending_score.
+        invalidate_response_cache()
@@ -3,15 +3,21 @@ from __future__ import annotations
 from django_tasks import task
 
 
+@task()
+def revalidate_paths(paths: list[str]) -> None:
+    """Send paths collected by api/revalidation.py to the frontend at once."""
+    from services import HANDLERS  # noqa: PLC0415
+
+    HANDLERS.web_ui.revalidate_paths(paths)
+
+
 @task()
 def revalidate_project(project_id: str) -> None:
+    """Deprecated: kept for one release so already-queued tasks still run.
+
+    New code goes through api.revalidation.revalidate_project.
+    """
+    from api.revalidation import project_paths  # noqa: PLC0415
     from services import HANDLERS  # noqa: PLC0415
 
-    HANDLERS.web_ui.revalidate_paths(
-        [
-            "/",
-            "/projects",
-            f"/projects/{project_id}",
-            "/competitions",
-        ]
-    )
+    HANDLERS.web_ui.revalidate_paths(project_paths(project_id))
@@ -0,0 +1,105 @@
+"""Write-behind buffer for project page views.
+
+Recording a view only appends to an in-process buffer, so traffic bursts add
+no database work to the request path. The buffer is handed to a background
+task in one batch once it holds VIEW_BUFFER_SIZE distinct views or its oldest
+view is VIEW_BUFFER_MAX_AGE seconds old, and once more when the process exits.
+Repeat hits from one address are collapsed in the buffer and by the
+(project, viewer_ip) unique constraint when the batch is inserted.
+
+Views still buffered when a process is killed are lost; that is the trade
+for keeping them off the request path.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections
+
+from api.tasks.project_views import record_project_views
+
+logger = logging.getLogger(__name__)
+
+# Bounds the memory a single buffered view can take.
+USER_AGENT_MAX_LENGTH = 512
+
+
+class ViewBuffer:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], str] = {}
+        self._timer: threading.Timer | None = None
+
+    def add(self, project_id: str, viewer_ip: str, user_agent: str) -> None:
+        with self._lock:
+            self._pending.setdefault(
+                (project_id, viewer_ip), user_agent[:USER_AGENT_MAX_LENGTH]
+            )
+            full = len(self._pending) >= settings.VIEW_BUFFER_SIZE
+            if not full and self._timer is None:
+                self._timer = threading.Timer(
+                    settings.VIEW_BUFFER_MAX_AGE, self._flush_in_background
+                )
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Enqueue everything buffered so far; returns the number of views."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return 0
+        try:
+            record_project_views.enqueue(
+                [
+                    {
+                        "project_id": project_id,
+                        "viewer_ip": viewer_ip,
+                        "user_agent": user_agent,
+                    }
+                    for (project_id, viewer_ip), user_agent in pending.items()
+                ]
+            )
+        except Exception:
+            logger.exception("Failed to enqueue %d project views", len(pending))
+        return len(pending)
+
+    def clear(self) -> None:
+        """Drop buffered views without recording them."""
+        with self._lock:
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own connections; do not leak them.
+            connections.close_all()
+
+
+_buffer = ViewBuffer()
+atexit.register(_buffer.flush)
+
+
+def record_view(project_id: str, viewer_ip: str, user_agent: str) -> None:
+    _buffer.add(project_id, viewer_ip, user_agent)
+
+
+def flush_views() -> int:
+    return _buffer.flush()
+
+
+def clear_views() -> None:
+    _buffer.clear()
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import TYPE_CHECKING
 
 from django.contrib import admin, messages
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import path, reverse
 from django.utils.html import format_html
 
+from api.tasks import email as email_tasks
 from services import HANDLERS, REPO
 
 from .models import BroadcastEmail, BroadcastEmailImage, BroadcastEmailRecipient
@@ -88,7 +90,7 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         obj: BroadcastEmail | None = None,
     ) -> tuple[str, ...]:
         always_readonly = ("sent_at", "sent_by", "created_by")
-        if obj and obj.is_sent:
+        if obj and (obj.is_sent or obj.is_sending):
             return (
                 "subject",
                 "body_markdown",
@@ -103,7 +105,7 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         request: HttpRequest,
         obj: BroadcastEmail | None = None,
     ) -> list[type]:
-        if obj and obj.is_sent:
+        if obj and (obj.is_sent or obj.is_sending):
             return [BroadcastEmailRecipientInline]
         if obj:
             return [BroadcastEmailImageInline]
@@ -114,7 +116,7 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         request: HttpRequest,
         obj: BroadcastEmail | None = None,
     ) -> bool:
-        if obj and obj.is_sent:
+        if obj and (obj.is_sent or obj.is_sending):
             return False
         return super().has_delete_permission(request, obj)
 
@@ -138,6 +140,13 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
                 "#16a34a",
                 "Sent",
             )
+        if obj.is_sending:
+            return format_html(
+                '<span style="background:{};color:#fff;padding:3px 8px;'
+                'border-radius:4px;font-size:11px;">{}</span>',
+                "#d97706",
+                "Sending",
+            )
         return format_html(
             '<span style="background:{};color:#fff;padding:3px 8px;'
             'border-radius:4px;font-size:11px;">{}</span>',
@@ -149,6 +158,8 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
     def recipient_count(self, obj: BroadcastEmail) -> int:
         if obj.is_sent:
             return obj.delivery_records.count()
+        if obj.is_sending:
+            return obj.recipient_total
         return REPO.email.resolve_broadcast_recipients(obj).count()
 
     def get_urls(self) -> list:
@@ -163,6 +174,11 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
                 self.admin_site.admin_view(self.send_view),
                 name="emails_broadcastemail_send",
             ),
+            path(
+                "<uuid:pk>/progress/",
+                self.admin_site.admin_view(self.progress_view),
+                name="emails_broadcastemail_progress",
+            ),
         ]
         return custom_urls + super().get_urls()
 
@@ -203,15 +219,18 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
             )
 
         if request.method == "POST":
-            success_count, failure_count = HANDLERS.email.send_broadcast(
-                broadcast, request.user
-            )
-            messages.success(
-                request,
-                f"Email sent to {success_count} recipient(s)"
-                + (f" ({failure_count} failed)" if failure_count else "")
-                + ".",
-            )
+            # A broadcast that is already sending was interrupted (or is
+            # still going); queueing it again resumes from the recipients
+            # without a delivery record.
+            if broadcast.is_sending:
+                messages.success(request, "Resumed sending in the background.")
+            else:
+                total = HANDLERS.email.queue_broadcast(broadcast, request.user)
+                messages.success(
+                    request,
+                    f"Sending to {total} recipient(s) in the background.",
+                )
+            email_tasks.send_broadcast.enqueue(str(broadcast.pk))
             return redirect(
                 reverse(
                     "admin:emails_broadcastemail_change",
@@ -231,6 +250,10 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
             context,
         )
 
+    def progress_view(self, request: HttpRequest, pk: str) -> JsonResponse:
+        broadcast = get_object_or_404(BroadcastEmail, pk=pk)
+        return JsonResponse(asdict(REPO.email.get_broadcast_progress(broadcast)))
+
     def change_view(
         self,
         request: HttpRequest,
@@ -242,6 +265,11 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         obj = self.get_object(request, object_id)
         if obj:
             extra_context["show_broadcast_buttons"] = not obj.is_sent
+            extra_context["is_sending"] = obj.is_sending
+            extra_context["progress_url"] = reverse(
+                "admin:emails_broadcastemail_progress",
+                args=[obj.pk],
+            )
             extra_context["preview_url"] = reverse(
                 "admin:emails_broadcastemail_preview",
                 args=[obj.pk],
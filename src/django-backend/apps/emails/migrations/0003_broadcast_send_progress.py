@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("emails", "0002_add_broadcastemailimage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="broadcastemail",
+            name="recipient_total",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="broadcastemail",
+            name="send_requested_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -41,6 +41,9 @@ class BroadcastEmail(models.Model):
         null=True,
         related_name="broadcast_emails_created",
     )
+    # Set when an admin queues the send; sent_at once every recipient is done.
+    send_requested_at = models.DateTimeField(null=True, blank=True)
+    recipient_total = models.PositiveIntegerField(default=0)
     sent_at = models.DateTimeField(null=True, blank=True)
     sent_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -57,13 +60,22 @@ class BroadcastEmail(models.Model):
         ordering = ["-created_at"]
 
     def __str__(self) -> str:
-        status = "Sent" if self.sent_at else "Draft"
+        if self.is_sent:
+            status = "Sent"
+        elif self.is_sending:
+            status = "Sending"
+        else:
+            status = "Draft"
         return f"[{status}] {self.subject}"
 
     @property
     def is_sent(self) -> bool:
         return self.sent_at is not None
 
+    @property
+    def is_sending(self) -> bool:
+        return self.send_requested_at is not None and self.sent_at is None
+
 
 class BroadcastEmailRecipient(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
 import logging
+from itertools import batched
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.contrib import admin
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.html import format_html
+from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
 
+from api.cache import (
+    competition_results,
+    invalidate_competition_results,
+    invalidate_response_cache,
+)
+from api.revalidation import revalidate_project
 from api.tasks import email as email_tasks
-from api.tasks import web_ui as web_ui_tasks
+from services import REPO
 
 from .models import (
     Competition,
@@ -25,6 +34,7 @@ from .models import (
 )
 
 if TYPE_CHECKING:
+    from django.forms import BaseInlineFormSet, ModelForm
     from django.utils.safestring import SafeString
 
 logger = logging.getLogger(__name__)
@@ -100,7 +110,6 @@ class ProjectAdmin(admin.ModelAdmin):
         "status",
         "is_featured",
         "monthly_visitors",
-        "view_count",
         "submission_month",
         "created_at",
     )
@@ -114,7 +123,15 @@ class ProjectAdmin(admin.ModelAdmin):
     )
     search_fields = ("title", "description", "owner__email", "owner__username")
     ordering = ("-created_at",)
-    readonly_fields = ("id", "view_count", "created_at", "updated_at", "approved_at")
+    readonly_fields = (
+        "id",
+        # Recomputed from visitor sketches by the rollup task.
+        "monthly_visitors",
+        "unique_visitors",
+        "created_at",
+        "updated_at",
+        "approved_at",
+    )
     filter_horizontal = ("tags",)
     inlines = [ProjectImageInline, ProjectViewInline]
 
@@ -147,7 +164,10 @@ class ProjectAdmin(admin.ModelAdmin):
                 ),
             },
         ),
-        ("Metrics", {"fields": ("monthly_visitors", "view_count", "submission_month")}),
+        (
+            "Metrics",
+            {"fields": ("monthly_visitors", "unique_visitors", "submission_month")},
+        ),
         ("Ownership", {"fields": ("owner",)}),
         (
             "System",
@@ -172,18 +192,30 @@ class ProjectAdmin(admin.ModelAdmin):
             return obj.owner.opt_in_to_external_promotions
         return None
 
-    @admin.display(description="Total Views")
-    def view_count(self, obj: Project) -> int:
-        return obj.views.count()
+    @admin.display(description="Unique visitors (all time)")
+    def unique_visitors(self, obj: Project) -> int:
+        return REPO.project.count_unique_visitors(obj.id)
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Project]:
         return (
             super()
             .get_queryset(request)
             .select_related("owner", "approved_by")
-            .prefetch_related("tags", "views")
+            .prefetch_related("tags")
         )
 
+    def save_related(
+        self,
+        request: HttpRequest,
+        form: ModelForm,
+        formsets: list[BaseInlineFormSet],
+        change: bool,  # noqa: FBT001
+    ) -> None:
+        super().save_related(request, form, formsets, change)
+        # Images may have been deleted through the inline.
+        form.instance.refresh_main_image()
+        form.instance.sync_technologies()
+
     actions = [
         "approve_projects",
         "reject_projects",
@@ -205,19 +237,20 @@ class ProjectAdmin(admin.ModelAdmin):
             approved_by=request.user,
             approved_at=timezone.now(),
         )
-        for project in pending:
-            try:
-                email_tasks.send_project_approved_email.enqueue(str(project.id))
-            except Exception:
-                logger.exception(
-                    "Failed to send approval email for project %s", project.id
-                )
+        # Queryset updates bypass the post_save hooks.
+        invalidate_response_cache()
+        # One task per EMAIL_BATCH_SIZE projects, each sending its batch over
+        # a single SMTP session.
+        project_ids = [str(project.id) for project in pending]
+        for batch in batched(project_ids, settings.EMAIL_BATCH_SIZE):
             try:
-                web_ui_tasks.revalidate_project.enqueue(str(project.id))
+                email_tasks.send_project_approved_emails.enqueue(list(batch))
             except Exception:
                 logger.exception(
-                    "Failed to enqueue revalidation for project %s", project.id
+                    "Failed to enqueue approval emails for %d projects", len(batch)
                 )
+        for project in pending:
+            revalidate_project(project.id)
         self.message_user(request, f"{updated} projects were approved.")
 
     @admin.action(description="Reject selected projects")
@@ -231,13 +264,9 @@ class ProjectAdmin(admin.ModelAdmin):
             status=ProjectStatus.REJECTED,
             approved_by=request.user,
         )
+        invalidate_response_cache()
         for project in pending:
-            try:
-                web_ui_tasks.revalidate_project.enqueue(str(project.id))
-            except Exception:
-                logger.exception(
-                    "Failed to enqueue revalidation for project %s", project.id
-                )
+            revalidate_project(project.id)
         self.message_user(request, f"{updated} projects were rejected.")
 
     @admin.action(description="Feature selected projects")
@@ -247,6 +276,7 @@ class ProjectAdmin(admin.ModelAdmin):
         queryset: QuerySet[Project],
     ) -> None:
         updated = queryset.update(is_featured=True)
+        invalidate_response_cache()
         self.message_user(request, f"{updated} projects were featured.")
 
     @admin.action(description="Unfeature selected projects")
@@ -256,6 +286,7 @@ class ProjectAdmin(admin.ModelAdmin):
         queryset: QuerySet[Project],
     ) -> None:
         updated = queryset.update(is_featured=False)
+        invalidate_response_cache()
         self.message_user(request, f"{updated} projects were unfeatured.")
 
 
@@ -376,6 +407,33 @@ class ProjectImageAdmin(admin.ModelAdmin):
     def get_queryset(self, request: HttpRequest) -> QuerySet[ProjectImage]:
         return super().get_queryset(request).select_related("project", "project__owner")
 
+    def save_model(
+        self,
+        request: HttpRequest,
+        obj: ProjectImage,
+        form: ModelForm,
+        change: bool,  # noqa: FBT001
+    ) -> None:
+        super().save_model(request, obj, form, change)
+        if change and "project" in form.changed_data:
+            Project.objects.get(pk=form.initial["project"]).refresh_main_image()
+        obj.project.refresh_main_image()
+
+    def delete_model(self, request: HttpRequest, obj: ProjectImage) -> None:
+        project = obj.project
+        super().delete_model(request, obj)
+        project.refresh_main_image()
+
+    def delete_queryset(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[ProjectImage],
+    ) -> None:
+        projects = list(Project.objects.filter(images__in=queryset).distinct())
+        super().delete_queryset(request, queryset)
+        for project in projects:
+            project.refresh_main_image()
+
 
 class CompetitionReviewerInline(admin.TabularInline):
     model = CompetitionReviewer
@@ -400,7 +458,7 @@ class CompetitionAdmin(admin.ModelAdmin):
     autocomplete_fields = ("winner",)
     inlines = [CompetitionReviewerInline]
     ordering = ("-start_date",)
-    readonly_fields = ("image_preview",)
+    readonly_fields = ("image_preview", "results")
 
     fieldsets = (
         (
@@ -419,6 +477,10 @@ class CompetitionAdmin(admin.ModelAdmin):
             "Projects",
             {"fields": ("projects",)},
         ),
+        (
+            "Results",
+            {"fields": ("results",)},
+        ),
     )
 
     @admin.display(description="Image")
@@ -439,6 +501,31 @@ class CompetitionAdmin(admin.ModelAdmin):
             )
         return mark_safe('<span style="color: #999;">No image uploaded</span>')
 
+    @admin.display(description="Consensus ranking")
+    def results(self, obj: Competition) -> SafeString | str:
+        if obj.pk is None:
+            return "-"
+        results = competition_results(obj.pk)
+        if not results.projects:
+            return "No rankings yet"
+        rows = format_html_join(
+            "",
+            "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>",
+            (
+                (p.position, p.title, p.borda_score, p.mean_rank, p.ranked_by)
+                for p in results.projects
+            ),
+        )
+        agreement = "-" if results.agreement is None else f"{results.agreement:.2f}"
+        return format_html(
+            "<table><thead><tr><th>#</th><th>Project</th><th>Borda score</th>"
+            "<th>Mean rank</th><th>Ranked by</th></tr></thead>"
+            "<tbody>{}</tbody></table>"
+            "<p>Reviewer agreement (mean Kendall tau): {}</p>",
+            rows,
+            agreement,
+        )
+
     @admin.display(description="Winner", ordering="winner__title")
     def winner_name(self, obj: Competition) -> str:
         return obj.winner.title if obj.winner else "-"
@@ -480,3 +567,18 @@ class ProjectRankingAdmin(admin.ModelAdmin):
     )
     autocomplete_fields = ("reviewer", "competition", "project")
     ordering = ("competition", "reviewer", "position")
+
+    def delete_model(self, request: HttpRequest, obj: ProjectRanking) -> None:
+        super().delete_model(request, obj)
+        transaction.on_commit(
+            lambda: invalidate_competition_results([obj.competition_id])
+        )
+
+    def delete_queryset(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[ProjectRanking],
+    ) -> None:
+        competition_ids = set(queryset.values_list("competition_id", flat=True))
+        super().delete_queryset(request, queryset)
+        transaction.on_commit(lambda: invalidate_competition_results(competition_ids))
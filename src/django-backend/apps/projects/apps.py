@@ -6,13 +6,39 @@ class ProjectsConfig(AppConfig):
     name = "apps.projects"
 
     def ready(self) -> None:
-        from django.db.models.signals import post_delete, post_save  # noqa: PLC0415
+        from django.db.models.signals import (  # noqa: PLC0415
+            m2m_changed,
+            post_delete,
+            post_save,
+        )
 
-        from apps.projects.models import Project  # noqa: PLC0415
+        from api.cache import (  # noqa: PLC0415
+            on_cached_data_changed,
+            on_ranking_saved,
+        )
+        from apps.projects.models import (  # noqa: PLC0415
+            Competition,
+            Project,
+            ProjectImage,
+            ProjectRanking,
+        )
         from apps.projects.signals import (  # noqa: PLC0415
             on_project_deleted,
+            on_project_image_changed,
             on_project_saved,
+            on_project_tags_changed,
         )
 
         post_save.connect(on_project_saved, sender=Project)
         post_delete.connect(on_project_deleted, sender=Project)
+        post_save.connect(on_project_image_changed, sender=ProjectImage)
+        post_delete.connect(on_project_image_changed, sender=ProjectImage)
+        m2m_changed.connect(on_project_tags_changed, sender=Project.tags.through)
+
+        # Other data rendered by cached responses (see api/cache.py).
+        post_save.connect(on_cached_data_changed, sender=Competition)
+        post_delete.connect(on_cached_data_changed, sender=Competition)
+        m2m_changed.connect(on_cached_data_changed, sender=Competition.projects.through)
+        # Competition results. No post_delete receiver: it would turn off fast
+        # deletes of rankings; the deleting code invalidates instead.
+        post_save.connect(on_ranking_saved, sender=ProjectRanking)
@@ -0,0 +1,78 @@
+"""HyperLogLog sketches for counting distinct visitors.
+
+A sketch estimates how many distinct values were added to it (standard error
+about 1.6% at the precision used here) in a fixed 4 KiB of registers, however
+many values that is. Sketches merge losslessly, so daily sketches can be
+combined into counts for any range of days. Serialized sketches are
+zlib-compressed; a sketch of a handful of visitors takes a few dozen bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+PRECISION = 12
+REGISTER_COUNT = 1 << PRECISION
+_HASH_BITS = 64
+_RANK_BITS = _HASH_BITS - PRECISION
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTER_COUNT)
+# One flag per byte-wide register, used for register-wise max on big ints.
+_HIGH_BITS = int.from_bytes(b"\x80" * REGISTER_COUNT)
+
+
+class HyperLogLog:
+    def __init__(self, registers: bytes | None = None) -> None:
+        if registers is not None and len(registers) != REGISTER_COUNT:
+            msg = f"Expected {REGISTER_COUNT} registers, got {len(registers)}"
+            raise ValueError(msg)
+        self.registers = bytearray(registers or REGISTER_COUNT)
+
+    def add(self, value: str) -> None:
+        digest = hashlib.blake2b(value.encode(), digest_size=_HASH_BITS // 8).digest()
+        hashed = int.from_bytes(digest)
+        index = hashed >> _RANK_BITS
+        rank = _RANK_BITS - (hashed & ((1 << _RANK_BITS) - 1)).bit_length() + 1
+        self.registers[index] = max(self.registers[index], rank)
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Fold other into this sketch (register-wise maximum)."""
+        # Registers never exceed 64, so a byte-wise a - b on (a | 0x80) never
+        # borrows across registers and its high bit is set exactly where
+        # a >= b. That turns the maximum into a few big-int operations
+        # instead of a Python loop over every register.
+        a = int.from_bytes(self.registers)
+        b = int.from_bytes(other.registers)
+        a_wins = ((((a | _HIGH_BITS) - b) & _HIGH_BITS) >> 7) * 0xFF
+        merged = (a & a_wins) | (b & ~a_wins)
+        self.registers = bytearray(merged.to_bytes(REGISTER_COUNT))
+
+    def count(self) -> int:
+        registers = bytes(self.registers)
+        harmonic = sum(registers.count(r) * 2.0**-r for r in set(registers))
+        estimate = _ALPHA * REGISTER_COUNT**2 / harmonic
+        zeros = registers.count(0)
+        if estimate <= 2.5 * REGISTER_COUNT and zeros:
+            # Linear counting is more accurate while many registers are empty.
+            estimate = REGISTER_COUNT * math.log(REGISTER_COUNT / zeros)
+        return round(estimate)
+
+    def to_bytes(self) -> bytes:
+        return zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> HyperLogLog:
+        return cls(zlib.decompress(data))
+
+    @classmethod
+    def union(cls, serialized: Iterable[bytes]) -> HyperLogLog:
+        """Merge serialized sketches, e.g. a project's daily sketches."""
+        sketch = cls()
+        for data in serialized:
+            sketch.merge(cls.from_bytes(data))
+        return sketch
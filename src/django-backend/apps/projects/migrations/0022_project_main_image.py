@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_main_image(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectImage = apps.get_model("projects", "ProjectImage")
+    for project in Project.objects.all().iterator():
+        main_image = (
+            ProjectImage.objects.filter(project=project, upload_status="uploaded")
+            .order_by("-is_main", "display_order", "created_at")
+            .first()
+        )
+        if main_image:
+            Project.objects.filter(pk=project.pk).update(main_image=main_image)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0021_add_tagline_to_project"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="main_image",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="projects.projectimage",
+            ),
+        ),
+        migrations.RunPython(populate_main_image, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:42
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+# Icelandic character transliteration for search normalization
+ICELANDIC_TRANSLITERATION = {
+    "á": "a",
+    "ð": "d",
+    "é": "e",
+    "í": "i",
+    "ó": "o",
+    "ú": "u",
+    "ý": "y",
+    "þ": "th",
+    "æ": "ae",
+    "ö": "o",
+    "Á": "A",
+    "Ð": "D",
+    "É": "E",
+    "Í": "I",
+    "Ó": "O",
+    "Ú": "U",
+    "Ý": "Y",
+    "Þ": "Th",
+    "Æ": "Ae",
+    "Ö": "O",
+}
+
+SEARCH_FIELDS = ("title", "tagline", "description", "long_description")
+
+
+def normalize_search_text(text: str) -> str:
+    for icelandic, ascii_equiv in ICELANDIC_TRANSLITERATION.items():
+        text = text.replace(icelandic, ascii_equiv)
+    return text.lower()
+
+
+def populate_search_index(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    is_postgres = schema_editor.connection.vendor == "postgresql"
+    for project in Project.objects.all().iterator():
+        title, tagline, description, long_description = (
+            normalize_search_text(getattr(project, field) or "")
+            for field in SEARCH_FIELDS
+        )
+        update = {
+            "search_document": "\n".join(
+                (title, tagline, description, long_description)
+            )
+        }
+        if is_postgres:
+            update["search_vector"] = (
+                SearchVector(models.Value(title), config="simple", weight="A")
+                + SearchVector(models.Value(tagline), config="simple", weight="B")
+                + SearchVector(
+                    models.Value(description),
+                    models.Value(long_description),
+                    config="simple",
+                    weight="C",
+                )
+            )
+        Project.objects.filter(pk=project.pk).update(**update)
+
+
+def create_search_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE INDEX projects_search_vector_gin "
+            "ON projects USING gin (search_vector)"
+        )
+
+
+def drop_search_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS projects_search_vector_gin")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0022_project_main_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+        # GIN indexes are PostgreSQL-only; SQLite searches search_document.
+        migrations.RunPython(create_search_vector_index, drop_search_vector_index),
+    ]
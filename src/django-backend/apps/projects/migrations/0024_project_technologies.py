@@ -0,0 +1,57 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:44
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def normalize_technology(name):
+    return " ".join(name.split()).casefold()[:100]
+
+
+def populate_technologies(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectTechnology = apps.get_model("projects", "ProjectTechnology")
+    for project in Project.objects.all().iterator():
+        names = {normalize_technology(name) for name in project.tech_stack or []}
+        names.discard("")
+        ProjectTechnology.objects.bulk_create(
+            ProjectTechnology(project=project, name=name) for name in names
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0023_project_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectTechnology",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("name", models.CharField(db_index=True, max_length=100)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="technologies",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "project_technologies",
+                "unique_together": {("project", "name")},
+            },
+        ),
+        migrations.RunPython(populate_technologies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:11
+
+import uuid
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.projects.hll import HyperLogLog
+
+
+def populate_visitor_sketches(apps, schema_editor):
+    ProjectView = apps.get_model("projects", "ProjectView")
+    ProjectVisitorSketch = apps.get_model("projects", "ProjectVisitorSketch")
+    sketches = defaultdict(HyperLogLog)
+    for project_id, viewer_ip, created_at in ProjectView.objects.values_list(
+        "project_id", "viewer_ip", "created_at"
+    ).iterator():
+        sketches[project_id, created_at.date()].add(viewer_ip)
+    ProjectVisitorSketch.objects.bulk_create(
+        (
+            ProjectVisitorSketch(
+                project_id=project_id, day=day, registers=sketch.to_bytes()
+            )
+            for (project_id, day), sketch in sketches.items()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0024_project_technologies"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="projectview",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.CreateModel(
+            name="ProjectVisitorSketch",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("day", models.DateField(db_index=True)),
+                ("registers", models.BinaryField()),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="visitor_sketches",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "project_visitor_sketches",
+                "unique_together": {("project", "day")},
+            },
+        ),
+        migrations.RunPython(populate_visitor_sketches, migrations.RunPython.noop),
+    ]
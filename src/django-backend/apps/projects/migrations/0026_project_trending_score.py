@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0025_project_visitor_sketches"),
+        ("tags", "0004_assign_colors_and_default_tags"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="trending_score",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status", "approved")),
+                fields=["-trending_score", "-monthly_visitors"],
+                name="projects_trending_idx",
+            ),
+        ),
+    ]
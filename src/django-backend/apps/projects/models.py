@@ -2,7 +2,8 @@ import uuid
 from typing import Any
 
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import connection, models
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -40,6 +41,41 @@ def transliterate_icelandic(text: str) -> str:
     return text
 
 
+def normalize_search_text(text: str) -> str:
+    """Normalize text for search so that e.g. "Þórsmörk" matches "thorsmork"."""
+    return transliterate_icelandic(text).lower()
+
+
+TECHNOLOGY_MAX_LENGTH = 100
+
+
+def normalize_technology(name: str) -> str:
+    """Normalize a tech_stack entry for exact, case-insensitive matching."""
+    return " ".join(name.split()).casefold()[:TECHNOLOGY_MAX_LENGTH]
+
+
+# Fields indexed for search, in decreasing order of weight.
+SEARCH_FIELDS = ("title", "tagline", "description", "long_description")
+# Fields rendered on public pages and API responses (by attname). Saves that
+# change none of them schedule no cache invalidation or revalidation.
+PUBLIC_FIELDS = (
+    *SEARCH_FIELDS,
+    "website_url",
+    "github_url",
+    "demo_url",
+    "tech_stack",
+    "monthly_visitors",
+    "status",
+    "is_featured",
+    "approved_at",
+    "owner_id",
+    "main_image_id",
+)
+
+
+_NOT_LOADED = object()
+
+
 class ProjectStatus(models.TextChoices):
     PENDING = "pending", "Pending"
     APPROVED = "approved", "Approved"
@@ -58,6 +94,9 @@ class Project(models.Model):
     demo_url = models.URLField(max_length=2083, blank=True, null=True)
     tech_stack = models.JSONField(default=list, blank=True)
     monthly_visitors = models.PositiveIntegerField(default=0)
+    # Time-decayed recent activity, refreshed in the background (see
+    # services/project/django_impl/trending.py).
+    trending_score = models.FloatField(default=0, editable=False)
     status = models.CharField(
         max_length=20,
         choices=ProjectStatus.choices,
@@ -84,21 +123,156 @@ class Project(models.Model):
         blank=True,
         related_name="approved_projects",
     )
+    # Denormalized thumbnail: the main uploaded image, else the first uploaded
+    # one. Kept in sync by refresh_main_image().
+    main_image = models.ForeignKey(
+        "ProjectImage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
 
     # Many-to-Many
     tags = models.ManyToManyField(Tag, related_name="projects", blank=True)
 
+    # Search index, maintained on save. search_document is the normalized text
+    # of SEARCH_FIELDS (used directly on SQLite); on PostgreSQL search_vector
+    # holds the weighted tsvector and has a GIN index (see migration 0023).
+    search_document = models.TextField(blank=True, default="", editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         db_table = "projects"
         ordering = ["-created_at"]
+        indexes = [
+            # Serves list_trending's top-K read straight from the index.
+            models.Index(
+                fields=["-trending_score", "-monthly_visitors"],
+                condition=models.Q(status="approved"),
+                name="projects_trending_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
 
     def save(self, *args: Any, **kwargs: Any) -> None:
+        update_fields = kwargs.get("update_fields")
+        changed = self.changed_public_fields()
+        if update_fields is not None:
+            changed &= {self._meta.get_field(name).attname for name in update_fields}
+        # Read by the post_save receiver in apps/projects/signals.py.
+        self.saved_public_changes = frozenset(changed)
         if not self.submission_month:
             self.submission_month = timezone.now().strftime("%Y-%m")
+        reindex = update_fields is None or not set(SEARCH_FIELDS).isdisjoint(
+            update_fields
+        )
+        if reindex:
+            self.search_document = self.build_search_document()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_document"}
         super().save(*args, **kwargs)
+        if reindex and connection.vendor == "postgresql":
+            Project.objects.filter(pk=self.pk).update(
+                search_vector=self.build_search_vector()
+            )
+        self.snapshot_public_fields()
+
+    @classmethod
+    def from_db(
+        cls, db: str, field_names: Any, values: Any, *args: Any, **kwargs: Any
+    ) -> "Project":
+        # Forward what newer Django passes along, such as fetch_mode.
+        instance = super().from_db(db, field_names, values, *args, **kwargs)
+        instance.snapshot_public_fields()
+        return instance
+
+    def snapshot_public_fields(self) -> None:
+        # Lists are copied: tech_stack can be changed in place.
+        self._loaded_public_values = {
+            field: value[:] if isinstance(value, list) else value
+            for field in PUBLIC_FIELDS
+            if (value := self.__dict__.get(field, _NOT_LOADED)) is not _NOT_LOADED
+        }
+
+    def changed_public_fields(self) -> set[str]:
+        """Public fields changed since load; every loaded one when unsaved."""
+        loaded = getattr(self, "_loaded_public_values", {})
+        return {
+            field
+            for field in PUBLIC_FIELDS
+            if field in self.__dict__
+            and self.__dict__[field] != loaded.get(field, _NOT_LOADED)
+        }
+
+    def refresh_from_db(self, *args: Any, **kwargs: Any) -> None:
+        super().refresh_from_db(*args, **kwargs)
+        self.snapshot_public_fields()
+
+    def build_search_document(self) -> str:
+        return "\n".join(
+            normalize_search_text(getattr(self, field) or "") for field in SEARCH_FIELDS
+        )
+
+    def build_search_vector(self) -> SearchVector:
+        """Weighted tsvector expression (PostgreSQL only) for this project."""
+        title, tagline, description, long_description = (
+            models.Value(normalize_search_text(getattr(self, field) or ""))
+            for field in SEARCH_FIELDS
+        )
+        return (
+            SearchVector(title, config="simple", weight="A")
+            + SearchVector(tagline, config="simple", weight="B")
+            + SearchVector(description, long_description, config="simple", weight="C")
+        )
+
+    @property
+    def main_image_url(self) -> str | None:
+        return self.main_image.url if self.main_image else None
+
+    def sync_technologies(self) -> None:
+        """Bring the ProjectTechnology rows in line with tech_stack."""
+        wanted = {normalize_technology(name) for name in self.tech_stack or []}
+        wanted.discard("")
+        existing = set(self.technologies.values_list("name", flat=True))
+        if stale := existing - wanted:
+            self.technologies.filter(name__in=stale).delete()
+        if missing := wanted - existing:
+            ProjectTechnology.objects.bulk_create(
+                ProjectTechnology(project=self, name=name) for name in missing
+            )
+
+    def refresh_main_image(self) -> None:
+        """Recompute main_image after this project's images have changed."""
+        self.main_image = (
+            self.images.filter(upload_status=UploadStatus.UPLOADED)
+            .order_by("-is_main", "display_order", "created_at")
+            .first()
+        )
+        # Queryset update: this is bookkeeping, not an edit of the project.
+        Project.objects.filter(pk=self.pk).update(main_image=self.main_image)
+
+
+class ProjectTechnology(models.Model):
+    """Normalized tech_stack entry, indexed for exact technology filters."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="technologies",
+    )
+    name = models.CharField(max_length=TECHNOLOGY_MAX_LENGTH, db_index=True)
+
+    class Meta:
+        db_table = "project_technologies"
+        unique_together = ["project", "name"]
+
+    def __str__(self) -> str:
+        return f"{self.project} - {self.name}"
 
 
 class ProjectView(models.Model):
@@ -110,7 +284,8 @@ class ProjectView(models.Model):
     )
     viewer_ip = models.GenericIPAddressField()
     user_agent = models.TextField(blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Indexed for expiry; distinct counts come from ProjectVisitorSketch.
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
         db_table = "project_views"
@@ -120,6 +295,26 @@ class ProjectView(models.Model):
         return f"{self.project} - {self.viewer_ip}"
 
 
+class ProjectVisitorSketch(models.Model):
+    """HyperLogLog sketch (see hll.py) of a project's distinct visitors on a day."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="visitor_sketches",
+    )
+    day = models.DateField(db_index=True)
+    registers = models.BinaryField()
+
+    class Meta:
+        db_table = "project_visitor_sketches"
+        unique_together = ["project", "day"]
+
+    def __str__(self) -> str:
+        return f"{self.project} - {self.day}"
+
+
 class UploadStatus(models.TextChoices):
     PENDING = "pending", "Pending Upload"
     UPLOADED = "uploaded", "Uploaded"
@@ -1,25 +1,71 @@
+"""Receivers scheduling cache invalidation and frontend revalidation.
+
+Only changes to what public pages show count: project saves touching
+PUBLIC_FIELDS, image changes and tag changes. The work runs once the
+transaction commits, so rolled-back writes cost nothing.
+"""
+
 from __future__ import annotations
 
-import logging
 from typing import TYPE_CHECKING, Any
 
-from api.tasks.web_ui import revalidate_project
+from django.db import transaction
+
+from api.cache import invalidate_response_cache
+from api.revalidation import PROJECT_LISTING_PATHS, revalidate, revalidate_project
 
 if TYPE_CHECKING:
-    from apps.projects.models import Project
+    from collections.abc import Iterable
+    from uuid import UUID
+
+    from apps.projects.models import Project, ProjectImage
+
+
+def _projects_changed(project_ids: Iterable[UUID]) -> None:
+    project_ids = list(project_ids)
 
-logger = logging.getLogger(__name__)
+    def run() -> None:
+        invalidate_response_cache()
+        revalidate(PROJECT_LISTING_PATHS)
+        for project_id in project_ids:
+            revalidate_project(project_id)
 
+    transaction.on_commit(run)
 
-def on_project_saved(sender: type, instance: Project, **kwargs: Any) -> None:
-    try:
-        revalidate_project.enqueue(str(instance.id))
-    except Exception:
-        logger.exception("Failed to enqueue revalidation for project %s", instance.id)
+
+def on_project_saved(
+    sender: type,
+    instance: Project,
+    created: bool,  # noqa: FBT001
+    **kwargs: Any,
+) -> None:
+    if created or instance.saved_public_changes:
+        _projects_changed([instance.id])
 
 
 def on_project_deleted(sender: type, instance: Project, **kwargs: Any) -> None:
-    try:
-        revalidate_project.enqueue(str(instance.id))
-    except Exception:
-        logger.exception("Failed to enqueue revalidation for project %s", instance.id)
+    _projects_changed([instance.id])
+
+
+def on_project_image_changed(
+    sender: type, instance: ProjectImage, **kwargs: Any
+) -> None:
+    _projects_changed([instance.project_id])
+
+
+def on_project_tags_changed(
+    sender: type,
+    instance: Any,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set | None,
+    **kwargs: Any,
+) -> None:
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        _projects_changed([instance.pk])
+    else:
+        # tag.projects changes: pk_set holds the projects, or is None when
+        # clear() removed them all, in which case only listings are known.
+        _projects_changed(pk_set or [])
@@ -9,6 +9,8 @@ from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.html import format_html
 
+from api.cache import invalidate_response_cache
+
 from .models import Tag, TagCategory, TagStatus
 
 if TYPE_CHECKING:
@@ -154,6 +156,7 @@ class TagAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now(),
         )
+        invalidate_response_cache()
         self.message_user(
             request,
             f"{updated} tag(s) approved.",
@@ -171,6 +174,7 @@ class TagAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now(),
         )
+        invalidate_response_cache()
         self.message_user(
             request,
             f"{updated} tag(s) rejected and removed from projects.",
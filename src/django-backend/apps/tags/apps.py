@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class TagsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tags"
+
+    def ready(self) -> None:
+        from django.db.models.signals import post_delete, post_save  # noqa: PLC0415
+
+        from api.cache import on_cached_data_changed  # noqa: PLC0415
+        from apps.tags.models import Tag, TagCategory  # noqa: PLC0415
+
+        for model in (Tag, TagCategory):
+            post_save.connect(on_cached_data_changed, sender=model)
+            post_delete.connect(on_cached_data_changed, sender=model)
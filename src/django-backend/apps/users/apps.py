@@ -4,3 +4,27 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.users"
+
+    def ready(self) -> None:
+        from django.contrib.auth.models import Group  # noqa: PLC0415
+        from django.db.models.signals import (  # noqa: PLC0415
+            m2m_changed,
+            post_delete,
+            post_save,
+        )
+
+        from apps.users.models import User  # noqa: PLC0415
+        from apps.users.signals import (  # noqa: PLC0415
+            on_group_changed,
+            on_user_changed,
+            on_user_groups_changed,
+        )
+
+        # Keep api/auth/user_cache.py from serving stale users. A delete also
+        # drops every cached response, so competition results lose the
+        # rankings cascaded from a deleted reviewer.
+        post_save.connect(on_user_changed, sender=User)
+        post_delete.connect(on_user_changed, sender=User)
+        m2m_changed.connect(on_user_groups_changed, sender=User.groups.through)
+        post_save.connect(on_group_changed, sender=Group)
+        post_delete.connect(on_group_changed, sender=Group)
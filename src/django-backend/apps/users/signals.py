@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from api.auth.user_cache import clear_user_cache, invalidate_user
+from api.cache import invalidate_response_cache
+
+if TYPE_CHECKING:
+    from apps.users.models import User
+
+# Fields cached responses show for project owners (PublicUserProfile).
+PUBLIC_PROFILE_FIELDS = frozenset({"first_name", "last_name", "info"})
+
+
+def on_user_changed(
+    sender: type,
+    instance: User,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: Any,
+) -> None:
+    invalidate_user(instance.pk)
+    if kwargs.get("created"):
+        return
+    if update_fields is None or not PUBLIC_PROFILE_FIELDS.isdisjoint(update_fields):
+        invalidate_response_cache()
+
+
+def on_user_groups_changed(
+    sender: type,
+    instance: Any,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set | None,
+    **kwargs: Any,
+) -> None:
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user(instance.pk)
+    elif pk_set:
+        # group.user_set changes: pk_set holds the users.
+        for user_id in pk_set:
+            invalidate_user(user_id)
+    else:
+        # group.user_set.clear() does not say which users it removed.
+        clear_user_cache()
+
+
+def on_group_changed(sender: type, **kwargs: Any) -> None:
+    # Cached users carry their group names.
+    clear_user_cache()
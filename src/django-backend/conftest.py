@@ -1,9 +1,19 @@
+from http import HTTPStatus
+
 import pytest
+from django.core.cache import caches
 from django.core.files.storage import InMemoryStorage
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 
 from api.auth.jwt import create_access_token, create_refresh_token
+from api.auth.user_cache import clear_user_cache
+from api.cache import RESPONSE_CACHE_ALIAS
+from api.revalidation import clear_revalidation
+from api.view_buffer import clear_views
 from apps.emails.models import BroadcastEmailImage
+from services.email.django_impl.delivery import get_email_delivery
 from tests.factories import ProjectFactory, TagFactory, UserFactory
 
 
@@ -12,6 +22,12 @@ def _allow_admin_ip(settings):
     settings.ADMIN_ALLOWED_IPS = ["127.0.0.1"]
 
 
+@pytest.fixture(autouse=True)
+def _use_fast_password_hasher(settings):
+    # Factories set a password on every user they create.
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
 @pytest.fixture(autouse=True)
 def _use_immediate_task_backend(settings):
     settings.TASKS = {
@@ -21,6 +37,19 @@ def _use_immediate_task_backend(settings):
     }
 
 
+@pytest.fixture(autouse=True)
+def _use_local_response_cache(settings):
+    # The shared database cache would add queries to every cached route and
+    # need database access in tests that never touch the response cache.
+    settings.CACHES = {
+        **settings.CACHES,
+        RESPONSE_CACHE_ALIAS: {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "responses",
+        },
+    }
+
+
 @pytest.fixture(autouse=True)
 def _use_in_memory_storage(settings):
     settings.STORAGES = {
@@ -40,6 +69,77 @@ def _use_in_memory_storage(settings):
     BroadcastEmailImage.image.field.storage = InMemoryStorage()
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    yield
+    caches["default"].clear()
+    caches[RESPONSE_CACHE_ALIAS].clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_user_cache():
+    yield
+    clear_user_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_revalidation():
+    yield
+    clear_revalidation()
+
+
+@pytest.fixture(autouse=True)
+def _clear_view_buffer():
+    yield
+    clear_views()
+
+
+@pytest.fixture(autouse=True)
+def _close_email_connections():
+    yield
+    # Pooled connections belong to whatever EMAIL_BACKEND the test used.
+    get_email_delivery().close()
+
+
+# Dataset sizes every query-budget test runs at. Routes that paginate, limit
+# or aggregate also run at LARGE_QUERY_BUDGET_SIZES, which cross their page
+# sizes and limits.
+QUERY_BUDGET_SIZES = (2, 10)
+LARGE_QUERY_BUDGET_SIZES = (5, 100)
+
+
+@pytest.fixture
+def query_budget():
+    """Fail when a request's query count grows with the size of the dataset.
+
+    query_budget(grow, call) calls grow(size) for each of QUERY_BUDGET_SIZES
+    (LARGE_QUERY_BUDGET_SIZES with large=True) to bring the data up to that
+    size, then counts the queries run by call(state), where state is whatever
+    grow returned. call must return a successful response. Returns the
+    (constant) query count.
+    """
+
+    def check(grow, call, *, large: bool = False) -> int:
+        sizes = LARGE_QUERY_BUDGET_SIZES if large else QUERY_BUDGET_SIZES
+        counts = {}
+        for size in sizes:
+            state = grow(size)
+            # Measure every call with a cold authenticated-user cache.
+            clear_user_cache()
+            with CaptureQueriesContext(connection) as ctx:
+                response = call(state)
+            if response.status_code >= HTTPStatus.BAD_REQUEST:
+                pytest.fail(
+                    f"Request failed ({response.status_code}): {response.content}"
+                )
+            counts[size] = len(ctx.captured_queries)
+        if len(set(counts.values())) != 1:
+            pytest.fail(f"Query count grows with dataset size: {counts}")
+        return counts[sizes[0]]
+
+    return check
+
+
 @pytest.fixture
 def client():
     return Client()
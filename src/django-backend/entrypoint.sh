@@ -7,6 +7,7 @@ echo "[entrypoint] Starting at $(date -u '+%Y-%m-%d %H:%M:%S UTC')"
 echo "[entrypoint] Running migrations..."
 MIGRATE_START=$(date +%s)
 uv run python manage.py migrate --noinput
+uv run python manage.py createcachetable
 MIGRATE_END=$(date +%s)
 echo "[entrypoint] Migrations completed in $((MIGRATE_END - MIGRATE_START))s"
 
@@ -58,3 +58,13 @@ def post_fork(server, worker) -> None:  # noqa: ANN001
     from project_showcase.otel import init_otel  # noqa: PLC0415
 
     init_otel()
+
+
+def post_worker_init(worker) -> None:  # noqa: ANN001
+    """Compile the MJML email templates before the worker takes requests."""
+    del worker  # unused but required by gunicorn
+    from services.email.django_impl.compiled_templates import (  # noqa: PLC0415
+        precompile_email_templates,
+    )
+
+    precompile_email_templates()
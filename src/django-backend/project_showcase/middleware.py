@@ -1,3 +1,4 @@
+import ipaddress
 from collections.abc import Callable
 from typing import Any
 
@@ -5,6 +6,26 @@ from django.conf import settings
 from django.http import Http404, HttpRequest, HttpResponse
 
 
+def get_client_ip(request: HttpRequest) -> str:
+    """Client IP as seen by the outermost trusted proxy, "" if not a valid IP.
+
+    Each proxy appends the address it received the request from to
+    X-Forwarded-For, so behind TRUSTED_PROXY_COUNT proxies (Scaleway) the
+    client is that many entries from the right. Entries further left come
+    from the client and can be anything.
+    """
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    hops = [hop.strip() for hop in x_forwarded_for.split(",") if hop.strip()]
+    if hops and settings.TRUSTED_PROXY_COUNT:
+        address = hops[-min(settings.TRUSTED_PROXY_COUNT, len(hops))]
+    else:
+        address = request.META.get("REMOTE_ADDR", "")
+    try:
+        return str(ipaddress.ip_address(address))
+    except ValueError:
+        return ""
+
+
 class AdminIPMiddleware:
     """Restrict /admin access to allowed IP addresses."""
 
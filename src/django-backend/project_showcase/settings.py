@@ -36,6 +36,11 @@ DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 ADMIN_ALLOWED_IPS = [
     ip.strip() for ip in os.getenv("ADMIN_ALLOWED_IPS", "").split(",") if ip.strip()
 ]
+# Proxies in front of the app that append to X-Forwarded-For (see
+# get_client_ip in project_showcase/middleware.py); 0 uses REMOTE_ADDR. Only
+# view tracking uses it: ADMIN_ALLOWED_IPS is still checked against the first
+# X-Forwarded-For entry.
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "1"))
 ALLOWED_HOSTS = (
     os.getenv("ALLOWED_HOSTS", "").split(",") if os.getenv("ALLOWED_HOSTS") else ["*"]
 )
@@ -50,6 +55,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "ninja",
     "storages",
@@ -202,6 +208,54 @@ TASKS = {
     },
 }
 
+# Caches
+# The "responses" cache backs api/cache.py. It defaults to the database cache
+# (created by `manage.py createcachetable` in entrypoint.sh) so that entries
+# and invalidations are shared by every gunicorn worker and the task worker.
+# "locmem" is per process and only valid when a single process serves the
+# API and runs the tasks.
+_RESPONSE_CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "RESPONSE_CACHE_LOCATION", str(BASE_DIR / ".cache" / "responses")
+        ),
+    },
+    "db": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "response_cache",
+    },
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "responses": {
+        **_RESPONSE_CACHE_BACKENDS[os.getenv("RESPONSE_CACHE_BACKEND", "db")],
+        "TIMEOUT": int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300")),
+    },
+}
+
+# Project view tracking (api/view_buffer.py): views are buffered per process
+# and written in batches once this many are pending or the oldest is this
+# many seconds old.
+VIEW_BUFFER_SIZE = int(os.getenv("VIEW_BUFFER_SIZE", "500"))
+VIEW_BUFFER_MAX_AGE = float(os.getenv("VIEW_BUFFER_MAX_AGE", "10"))
+# Recorded views also feed daily HyperLogLog sketches of distinct visitors.
+# Every VISITOR_ROLLUP_INTERVAL seconds monthly_visitors is recomputed from
+# them and raw ProjectView rows older than the retention are deleted.
+VISITOR_ROLLUP_INTERVAL = int(os.getenv("VISITOR_ROLLUP_INTERVAL", "3600"))
+PROJECT_VIEW_RETENTION_DAYS = int(os.getenv("PROJECT_VIEW_RETENTION_DAYS", "30"))
+
+# Broadcast emails are sent by a background task that works through the
+# recipients this many at a time, recording each chunk's deliveries at once.
+BROADCAST_CHUNK_SIZE = int(os.getenv("BROADCAST_CHUNK_SIZE", "100"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -215,6 +269,10 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", SECRET_KEY)
 JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = 7
+# Authenticated users are cached per process for this many seconds
+# (api/auth/user_cache.py); 0 disables the cache. Saves invalidate the
+# process they happen in, other workers pick changes up on expiry.
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "30"))
 
 # CORS Settings
 CORS_ALLOW_ALL_ORIGINS = DEBUG
@@ -270,8 +328,23 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True").lower() == "true"
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "noreply@naglasupan.is")
 ADMIN_FROM_EMAIL = os.getenv("ADMIN_FROM_EMAIL", "alex@naglasupan.is")
+# Outgoing mail is sent over a pool of reused connections
+# (services/email/django_impl/delivery.py): up to EMAIL_POOL_SIZE sessions
+# in parallel, EMAIL_BATCH_SIZE messages per session checkout, at most
+# EMAIL_RATE_LIMIT messages per second (0 = unlimited), and transient
+# failures retried EMAIL_MAX_RETRIES times with exponential backoff.
+EMAIL_POOL_SIZE = int(os.getenv("EMAIL_POOL_SIZE", "4"))
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "50"))
+EMAIL_RATE_LIMIT = float(os.getenv("EMAIL_RATE_LIMIT", "0"))
+EMAIL_MAX_RETRIES = int(os.getenv("EMAIL_MAX_RETRIES", "3"))
+EMAIL_RETRY_BACKOFF = float(os.getenv("EMAIL_RETRY_BACKOFF", "1.0"))
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "30"))
 FRONTEND_URL = os.getenv("FRONTEND_URL", "https://naglasupan.is")
 REVALIDATION_SECRET = os.getenv("REVALIDATION_SECRET", "")
+# Frontend paths to revalidate are collected for this many seconds and sent
+# in one deduplicated request (api/revalidation.py); 0 sends each at once.
+REVALIDATION_WINDOW = float(os.getenv("REVALIDATION_WINDOW", "2"))
+REVALIDATION_MAX_PATHS = int(os.getenv("REVALIDATION_MAX_PATHS", "200"))
 
 # Logging configuration - JSON format for Grafana/Cockpit filtering
 LOGGING = {
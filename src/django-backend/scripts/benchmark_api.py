@@ -0,0 +1,438 @@
+#!/usr/bin/env python
+"""Offline latency benchmark for the Ninja API.
+
+Drives every router in api/main.py in-process through Django's test client
+against the configured database - normally one built by generate_dataset.py -
+and reports p50/p95/p99 latency, queries per request and bytes per response.
+Every request runs inside a transaction that is rolled back, so write routes
+leave the dataset unchanged and runs stay comparable. The response cache is
+forced to local memory so that its entries survive those rollbacks.
+
+With --compare, results are diffed against a stored baseline and the script
+exits non-zero when a scenario got slower than --threshold allows or issues
+more queries than before.
+
+Usage:
+    uv run python scripts/benchmark_api.py --output baseline.json
+    uv run python scripts/benchmark_api.py --compare baseline.json
+    # or
+    make bench BENCH_ARGS="--compare baseline.json"
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DJANGO_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DJANGO_BACKEND_DIR))
+DEFAULT_PASSWORD = "123"
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_showcase.settings")
+# Requests run in rolled-back transactions, which would also roll back the
+# writes of the database response cache and leave warm runs cold.
+os.environ["RESPONSE_CACHE_BACKEND"] = "locmem"
+
+import django
+
+django.setup()
+
+import django.test.utils
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from api.auth.jwt import create_access_token, create_refresh_token
+from api.cache import invalidate_response_cache
+from apps.projects.models import (
+    Competition,
+    CompetitionReviewer,
+    Project,
+    ProjectRanking,
+    ProjectStatus,
+    ReviewStatus,
+)
+from apps.tags.models import Tag, TagStatus
+from apps.users.models import User
+
+DEFAULT_ITERATIONS = 50
+DEFAULT_WARMUP = 3
+DEFAULT_THRESHOLD = 0.2
+# Latency deltas below this are noise on any machine.
+NOISE_FLOOR_MS = 1.0
+# Password hashing is deliberately slow; a few samples are enough.
+LOGIN_ITERATIONS = 5
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    path: str
+    method: str = "GET"
+    user: User | None = None
+    body: dict[str, Any] | None = None
+    # Send the ETag from a first response back as If-None-Match.
+    revalidate: bool = False
+    iterations: int | None = None
+
+
+@dataclass
+class Fixtures:
+    """Representative rows from the dataset that the scenarios point at."""
+
+    project: Project
+    owner: User
+    competition: Competition
+    reviewer: User
+    review_competition: Competition
+    review_order: list[str]
+    tag: Tag | None
+    staff: User | None
+
+
+def load_fixtures() -> Fixtures:
+    project = (
+        Project.objects.filter(status=ProjectStatus.APPROVED)
+        .select_related("owner")
+        .order_by("-monthly_visitors", "id")
+        .first()
+    )
+    competition = (
+        Competition.objects.annotate(entries=Count("projects"))
+        .order_by("-entries", "id")
+        .first()
+    )
+    assignment = (
+        CompetitionReviewer.objects.filter(status=ReviewStatus.IN_PROGRESS)
+        .select_related("user", "competition")
+        .order_by("id")
+        .first()
+    )
+    if project is None or competition is None or assignment is None:
+        sys.exit(
+            "Dataset is missing projects, competitions or an in-progress "
+            "reviewer. Run scripts/generate_dataset.py first."
+        )
+    review_order = [
+        str(project_id)
+        for project_id in ProjectRanking.objects.filter(
+            reviewer=assignment.user, competition=assignment.competition
+        )
+        .order_by("-position")
+        .values_list("project_id", flat=True)
+    ]
+    tag = (
+        Tag.objects.filter(status=TagStatus.APPROVED)
+        .annotate(uses=Count("projects"))
+        .order_by("-uses", "id")
+        .first()
+    )
+    return Fixtures(
+        project=project,
+        owner=project.owner,
+        competition=competition,
+        reviewer=assignment.user,
+        review_competition=assignment.competition,
+        review_order=review_order,
+        tag=tag,
+        staff=User.objects.filter(is_staff=True, is_active=True).first(),
+    )
+
+
+def build_scenarios(fx: Fixtures) -> list[Scenario]:
+    project_id = fx.project.id
+    scenarios = [
+        Scenario("health", "/api/health"),
+        Scenario(
+            "auth.login",
+            "/api/auth/login",
+            method="POST",
+            body={"email": fx.owner.email, "password": DEFAULT_PASSWORD},
+            iterations=LOGIN_ITERATIONS,
+        ),
+        Scenario(
+            "auth.refresh",
+            "/api/auth/refresh",
+            method="POST",
+            body={"refresh_token": create_refresh_token(fx.owner.id)},
+        ),
+        Scenario("auth.me", "/api/auth/me", user=fx.owner),
+        Scenario(
+            "auth.update_me",
+            "/api/auth/me",
+            method="PUT",
+            user=fx.owner,
+            body={"info": "Benchmark run"},
+        ),
+        Scenario("projects.list", "/api/projects"),
+        Scenario("projects.list_not_modified", "/api/projects", revalidate=True),
+        Scenario("projects.list_page_50", "/api/projects?page=50"),
+        Scenario("projects.list_cursor", "/api/projects?cursor="),
+        Scenario("projects.list_search", "/api/projects?search=glacier+data"),
+        Scenario("projects.list_tech_stack", "/api/projects?tech_stack=python"),
+        Scenario("projects.list_sorted", "/api/projects?sort_by=title&sort_order=asc"),
+        Scenario("projects.featured", "/api/projects/featured"),
+        Scenario("projects.trending", "/api/projects/trending"),
+        Scenario("projects.detail", f"/api/projects/{project_id}"),
+        Scenario(
+            "projects.record_view", f"/api/projects/{project_id}/views", method="POST"
+        ),
+        Scenario("my_projects.list", "/api/my/projects", user=fx.owner),
+        Scenario("my_projects.detail", f"/api/my/projects/{project_id}", user=fx.owner),
+        Scenario("my_review.list", "/api/my/reviews/competitions", user=fx.reviewer),
+        Scenario(
+            "my_review.detail",
+            f"/api/my/reviews/competitions/{fx.review_competition.id}",
+            user=fx.reviewer,
+        ),
+        Scenario(
+            "my_review.update_rankings",
+            f"/api/my/reviews/competitions/{fx.review_competition.id}/rankings",
+            method="PUT",
+            user=fx.reviewer,
+            body={"project_ids": fx.review_order},
+        ),
+        Scenario("tags.list", "/api/tags"),
+        Scenario("tags.categories", "/api/tags/categories"),
+        Scenario("tags.grouped", "/api/tags/grouped"),
+        Scenario("competitions.list", "/api/competitions"),
+        Scenario("competitions.with_projects", "/api/competitions/with-projects"),
+        Scenario(
+            "competitions.active_or_most_recent",
+            "/api/competitions/active-or-most-recent",
+        ),
+        Scenario("competitions.detail", f"/api/competitions/{fx.competition.slug}"),
+        Scenario("users.profile", f"/api/users/{fx.owner.id}"),
+    ]
+    if fx.review_order:
+        scenarios.append(
+            Scenario(
+                "my_review.project",
+                f"/api/my/reviews/projects/{fx.review_order[0]}",
+                user=fx.reviewer,
+            )
+        )
+    if fx.tag is not None:
+        scenarios.append(
+            Scenario("projects.list_tag", f"/api/projects?tags={fx.tag.slug}")
+        )
+    if fx.staff is not None:
+        scenarios.append(
+            Scenario("tags.admin_pending", "/api/tags/admin/pending", user=fx.staff)
+        )
+    return sorted(scenarios, key=lambda s: s.name)
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def send(client: Client, scenario: Scenario, headers: dict[str, str]) -> Any:
+    body = json.dumps(scenario.body) if scenario.body is not None else None
+    return client.generic(
+        scenario.method,
+        scenario.path,
+        data=body or "",
+        content_type="application/json",
+        headers=headers,
+    )
+
+
+def run_scenario(
+    client: Client, scenario: Scenario, iterations: int, warmup: int, *, cold: bool
+) -> dict[str, Any]:
+    headers = {}
+    if scenario.user is not None:
+        headers["Authorization"] = f"Bearer {create_access_token(scenario.user.id)}"
+    if scenario.revalidate:
+        headers["If-None-Match"] = send(client, scenario, headers).get("ETag", "")
+    iterations = min(iterations, scenario.iterations or iterations)
+
+    timings: list[float] = []
+    queries: list[int] = []
+    for i in range(warmup + iterations):
+        if cold:
+            invalidate_response_cache()
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = send(client, scenario, headers)
+                elapsed = (time.perf_counter() - start) * 1000
+            # Keep the dataset identical for every iteration and every run.
+            transaction.set_rollback(True)
+        if response.status_code >= 400:  # noqa: PLR2004
+            return {"error": f"HTTP {response.status_code}: {response.content[:200]!r}"}
+        if i >= warmup:
+            timings.append(elapsed)
+            queries.append(len(captured))
+
+    return {
+        "method": scenario.method,
+        "path": scenario.path,
+        "status": response.status_code,
+        "iterations": iterations,
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "queries": max(queries),
+        "bytes": len(response.content),
+    }
+
+
+def dataset_summary() -> dict[str, int]:
+    return {
+        "users": User.objects.count(),
+        "projects": Project.objects.count(),
+        "tags": Tag.objects.count(),
+        "competitions": Competition.objects.count(),
+        "rankings": ProjectRanking.objects.count(),
+    }
+
+
+def print_results(results: dict[str, dict[str, Any]]) -> None:
+    print(
+        f"{'scenario':<38} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'queries':>8} {'bytes':>9}"
+    )
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<38} ERROR {result['error']}")
+            continue
+        print(
+            f"{name:<38} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+            f"{result['p99_ms']:>9.2f} {result['queries']:>8} {result['bytes']:>9}"
+        )
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Print per-scenario deltas against baseline and return the regressions."""
+    regressions = []
+    print(
+        f"\n{'scenario':<38} {'p95 base':>9} {'p95 now':>9} {'delta':>8} "
+        f"{'queries':>10} {'bytes':>8}"
+    )
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or "error" in base or "error" in result:
+            print(f"{name:<38} (no comparable baseline)")
+            continue
+        delta = result["p95_ms"] - base["p95_ms"]
+        ratio = delta / base["p95_ms"] if base["p95_ms"] else 0.0
+        flags = []
+        if ratio > threshold and delta > NOISE_FLOOR_MS:
+            flags.append(f"p95 +{ratio:.0%}")
+        if result["queries"] > base["queries"]:
+            flags.append(f"queries {base['queries']} -> {result['queries']}")
+        if flags:
+            regressions.append(f"{name}: {', '.join(flags)}")
+        print(
+            f"{name:<38} {base['p95_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+            f"{ratio:>+8.0%} {base['queries']:>4} -> {result['queries']:<3} "
+            f"{result['bytes'] - base['bytes']:>+8}"
+            f"{'  REGRESSION' if flags else ''}"
+        )
+    if missing := sorted(baseline.keys() - results.keys()):
+        print(f"\nNot run, present in baseline: {', '.join(missing)}")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help=f"measured requests per scenario (default: {DEFAULT_ITERATIONS})",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=DEFAULT_WARMUP,
+        help=f"unmeasured requests per scenario (default: {DEFAULT_WARMUP})",
+    )
+    parser.add_argument(
+        "--only", help="only run scenarios whose name contains this text"
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="invalidate the response cache before every request",
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON here")
+    parser.add_argument(
+        "--compare", type=Path, help="baseline JSON from an earlier --output run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed relative p95 slowdown before failing --compare "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    args = parser.parse_args()
+    if args.iterations < 1 or args.warmup < 0:
+        parser.error("--iterations must be positive and --warmup non-negative")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    # Test client host, in-memory email backend.
+    django.test.utils.setup_test_environment()
+    client = Client()
+    scenarios = [
+        s
+        for s in build_scenarios(load_fixtures())
+        if not args.only or args.only in s.name
+    ]
+
+    print(f"=== Benchmarking {len(scenarios)} scenarios ===\n")
+    results = {
+        scenario.name: run_scenario(
+            client, scenario, args.iterations, args.warmup, cold=args.cold
+        )
+        for scenario in scenarios
+    }
+    print_results(results)
+
+    report = {
+        "meta": {
+            "database": connection.vendor,
+            "dataset": dataset_summary(),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "cold_cache": args.cold,
+            "python": sys.version.split()[0],
+            "django": django.get_version(),
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+    failed = [name for name, result in results.items() if "error" in result]
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        failed += compare(results, baseline, args.threshold)
+    if failed:
+        print("\nFailed:")
+        for line in failed:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,530 @@
+#!/usr/bin/env python
+"""Generate a large synthetic dataset for load tests and benchmarks.
+
+Unlike seed_db.py, which creates a handful of hand-written rows for demos,
+this builds realistic volumes with bulk_create: at --scale 1 that is 50k
+users, 100k projects, 3k tags, 24 competitions with hundreds of entries each,
+full reviewer rankings and about 2M project views with matching daily
+visitor sketches.
+
+Output is deterministic for a given --seed and --anchor (a fixed date, not
+today, by default): ids, text, relationships and timestamps (offsets back from
+the anchor date) are all drawn from one seeded RNG, so benchmark runs against
+the same arguments compare like with like. Refuses to run twice against the
+same database.
+
+Usage:
+    uv run python scripts/generate_dataset.py --scale 0.1
+    # or
+    make dataset SCALE=0.1
+"""
+
+import argparse
+import contextlib
+import ipaddress
+import math
+import os
+import random
+import sys
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime, timedelta
+from itertools import batched
+from pathlib import Path
+
+DJANGO_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DJANGO_BACKEND_DIR))
+DEFAULT_PASSWORD = "123"
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_showcase.settings")
+
+import django
+
+django.setup()
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.postgres.search import SearchVector
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce, Lower
+from django.utils.text import slugify
+
+from api.cache import invalidate_response_cache
+from apps.projects.hll import HyperLogLog
+from apps.projects.models import (
+    Competition,
+    CompetitionReviewer,
+    CompetitionStatus,
+    Project,
+    ProjectImage,
+    ProjectRanking,
+    ProjectStatus,
+    ProjectTechnology,
+    ProjectView,
+    ProjectVisitorSketch,
+    ReviewStatus,
+    UploadStatus,
+    normalize_technology,
+)
+from apps.tags.models import Tag, TagCategory, TagStatus, generate_tag_color
+from apps.users.models import User
+from services.project.django_impl.trending import refresh_trending_scores
+from services.project.django_impl.visitors import refresh_monthly_visitors
+
+MARKER_EMAIL = "dataset-marker@naglasupan.is"
+EMAIL_DOMAIN = "dataset.example.com"
+BATCH_SIZE = 2000
+# Fixed so that runs on different days generate the same rows.
+DEFAULT_ANCHOR = date(2026, 1, 1)
+
+# Row counts at --scale 1.
+USER_COUNT = 50_000
+PROJECT_COUNT = 100_000
+TAG_COUNT = 3_000
+COMPETITION_COUNT = 24
+PROJECT_VIEW_COUNT = 2_000_000
+REVIEWERS_PER_COMPETITION = 5
+ENTRIES_PER_COMPETITION = (200, 500)
+
+STATUS_WEIGHTS = {
+    ProjectStatus.APPROVED: 85,
+    ProjectStatus.PENDING: 10,
+    ProjectStatus.REJECTED: 5,
+}
+FEATURED_RATE = 0.01
+VERIFIED_RATE = 0.9
+APPROVED_TAG_RATE = 0.9
+TAGS_PER_PROJECT = (0, 6)
+IMAGES_PER_PROJECT = (0, 3)
+HISTORY_DAYS = 3 * 365
+
+FIRST_NAMES = [
+    "Anna", "Bjarki", "Dagny", "Einar", "Freyja", "Gunnar", "Helga", "Ingvar",
+    "Katrin", "Leifur", "Margret", "Nonni", "Olof", "Pall", "Ragnar", "Sigrun",
+    "Thora", "Unnur", "Valur", "Yrsa",
+]  # fmt: skip
+LAST_NAMES = [
+    "Sigurdsson", "Thorsson", "Helgadottir", "Jonsson", "Magnusdottir",
+    "Olafsson", "Bjornsdottir", "Kristjansson", "Gudmundsdottir", "Haraldsson",
+    "Einarsdottir", "Stefansson",
+]  # fmt: skip
+# ASCII only, so Lower() in SQL matches normalize_search_text().
+WORDS = [
+    "aurora", "basalt", "cloud", "data", "engine", "fjord", "geyser", "glacier",
+    "harbor", "insight", "lava", "market", "network", "ocean", "puffin", "quest",
+    "realtime", "saga", "tracker", "tundra", "volcano", "weather", "wool",
+    "api", "booking", "chat", "dashboard", "events", "finance", "health",
+    "learning", "maps", "music", "open", "platform", "recipes", "search",
+    "shop", "social", "travel",
+]  # fmt: skip
+TECHNOLOGIES = [
+    "Python", "Django", "React", "TypeScript", "Node.js", "PostgreSQL",
+    "Redis", "Docker", "AWS", "Go", "Rust", "Svelte", "Vue", "Next.js",
+    "Kotlin", "Swift", "GraphQL", "MongoDB", "Tailwind", "Vercel",
+]  # fmt: skip
+IMAGE_KEYS = [
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/dd2537c6c91b/3.png",
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/60a9fb3a7ccc/4.png",
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/474347497f65/5.png",
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/c2986b0f7af8/6.png",
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/276193cb521a/7.png",
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/be3ba26a557a/8.png",
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/6bf5cb291c7b/9.png",
+    "projects/898b8389-9afd-4786-ace5-2d99e6899c74/313c1c7241b8/10.png",
+]
+
+
+def scaled(count: int, scale: float) -> int:
+    return max(1, round(count * scale))
+
+
+def bulk_insert(model: type[models.Model], rows: Iterable[models.Model]) -> int:
+    """bulk_create rows in fixed-size batches without materializing them all."""
+    total = 0
+    for batch in batched(rows, BATCH_SIZE):
+        model.objects.bulk_create(batch)  # type: ignore[attr-defined]
+        total += len(batch)
+    return total
+
+
+@contextlib.contextmanager
+def explicit_timestamps(*model_classes: type[models.Model]) -> Iterator[None]:
+    """Let generated created_at/updated_at values through bulk_create.
+
+    auto_now/auto_now_add would otherwise stamp every row with the wall clock,
+    breaking both determinism and realistic history.
+    """
+    saved = []
+    for model in model_classes:
+        for field in model._meta.concrete_fields:  # noqa: SLF001
+            if isinstance(field, models.DateField):
+                saved.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class DatasetGenerator:
+    def __init__(self, scale: float, seed: int, anchor: datetime) -> None:
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.anchor = anchor
+        self.users: list[uuid.UUID] = []
+        self.tags: list[uuid.UUID] = []
+        self.approved: list[uuid.UUID] = []
+        self.counts: dict[str, int] = {}
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def timestamp(self, max_days: int = HISTORY_DAYS) -> datetime:
+        return self.anchor - timedelta(seconds=self.rng.randrange(max_days * 86400))
+
+    def sentence(self, low: int, high: int) -> str:
+        words = self.rng.choices(WORDS, k=self.rng.randint(low, high))
+        return " ".join(words).capitalize()
+
+    def run(self) -> dict[str, int]:
+        with transaction.atomic():
+            with explicit_timestamps(
+                User,
+                Tag,
+                Project,
+                ProjectImage,
+                ProjectView,
+                Competition,
+                ProjectRanking,
+            ):
+                self.create_users()
+                self.create_tags()
+                self.create_projects()
+                self.create_views()
+                self.create_competitions()
+            # Scores depend on both visits and rankings, so compute them last.
+            refresh_trending_scores(self.anchor)
+            User.objects.create(email=MARKER_EMAIL, is_active=False)
+        invalidate_response_cache()
+        return self.counts
+
+    def create_users(self) -> None:
+        print("Creating users...")
+        password = make_password(DEFAULT_PASSWORD, salt="generateddataset")
+
+        def rows() -> Iterator[User]:
+            for i in range(scaled(USER_COUNT, self.scale)):
+                user_id = self.uuid()
+                self.users.append(user_id)
+                created_at = self.timestamp()
+                yield User(
+                    id=user_id,
+                    email=f"user{i:06d}@{EMAIL_DOMAIN}",
+                    password=password,
+                    first_name=self.rng.choice(FIRST_NAMES),
+                    last_name=self.rng.choice(LAST_NAMES),
+                    kennitala=f"9{i:09d}",
+                    is_verified=self.rng.random() < VERIFIED_RATE,
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+
+        self.counts["users"] = bulk_insert(User, rows())
+
+    def create_tags(self) -> None:
+        print("Creating tags...")
+        categories = list(TagCategory.objects.values_list("id", "slug"))
+
+        def rows() -> Iterator[Tag]:
+            for i in range(scaled(TAG_COUNT, self.scale)):
+                tag_id = self.uuid()
+                name = f"{self.rng.choice(WORDS)}-{i:05d}"
+                category_id, category_slug = (
+                    self.rng.choice(categories) if categories else (None, None)
+                )
+                status = (
+                    TagStatus.APPROVED
+                    if self.rng.random() < APPROVED_TAG_RATE
+                    else TagStatus.PENDING
+                )
+                if status == TagStatus.APPROVED:
+                    self.tags.append(tag_id)
+                created_at = self.timestamp()
+                yield Tag(
+                    id=tag_id,
+                    name=name,
+                    slug=slugify(name),
+                    color=generate_tag_color(name, category_slug),
+                    category_id=category_id,
+                    status=status,
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+
+        self.counts["tags"] = bulk_insert(Tag, rows())
+
+    def create_projects(self) -> None:
+        print("Creating projects...")
+        admin_id = User.objects.filter(is_staff=True).values_list("id", flat=True)
+        approved_by = admin_id.first()
+        technologies: list[ProjectTechnology] = []
+        tag_links: list[models.Model] = []
+        images: list[ProjectImage] = []
+        statuses = list(STATUS_WEIGHTS)
+        weights = list(STATUS_WEIGHTS.values())
+        through = Project.tags.through
+
+        def rows() -> Iterator[Project]:
+            for _ in range(scaled(PROJECT_COUNT, self.scale)):
+                project_id = self.uuid()
+                status = self.rng.choices(statuses, weights)[0]
+                created_at = self.timestamp()
+                title = self.sentence(2, 4)
+                tech_stack = self.rng.sample(TECHNOLOGIES, self.rng.randint(1, 5))
+                project = Project(
+                    id=project_id,
+                    title=title,
+                    tagline=self.sentence(5, 10),
+                    description=self.sentence(20, 60),
+                    long_description=self.sentence(60, 200),
+                    website_url=f"https://{slugify(title)}.example.com",
+                    github_url=f"https://github.com/example/{slugify(title)}",
+                    tech_stack=tech_stack,
+                    status=status,
+                    is_featured=(
+                        status == ProjectStatus.APPROVED
+                        and self.rng.random() < FEATURED_RATE
+                    ),
+                    submission_month=created_at.strftime("%Y-%m"),
+                    created_at=created_at,
+                    updated_at=created_at,
+                    owner_id=self.rng.choice(self.users),
+                )
+                project.search_document = project.build_search_document()
+                if status == ProjectStatus.APPROVED:
+                    self.approved.append(project_id)
+                    project.approved_at = created_at + timedelta(days=1)
+                    project.approved_by_id = approved_by
+                elif status == ProjectStatus.REJECTED:
+                    project.rejection_reason = self.sentence(5, 10)
+                technologies.extend(
+                    ProjectTechnology(id=self.uuid(), project_id=project_id, name=name)
+                    for name in {normalize_technology(t) for t in tech_stack}
+                )
+                tag_count = min(self.rng.randint(*TAGS_PER_PROJECT), len(self.tags))
+                tag_links.extend(
+                    through(project_id=project_id, tag_id=tag_id)
+                    for tag_id in self.rng.sample(self.tags, tag_count)
+                )
+                for order in range(self.rng.randint(*IMAGES_PER_PROJECT)):
+                    images.append(
+                        ProjectImage(
+                            id=self.uuid(),
+                            project_id=project_id,
+                            storage_key=self.rng.choice(IMAGE_KEYS),
+                            original_filename=f"{order + 1}.png",
+                            content_type="image/png",
+                            file_size=0,
+                            is_main=order == 0,
+                            display_order=order,
+                            upload_status=UploadStatus.UPLOADED,
+                            created_at=created_at,
+                            uploaded_at=created_at,
+                        )
+                    )
+                    if order == 0:
+                        # FK constraints are deferred until the transaction
+                        # commits, so the image may be inserted afterwards.
+                        project.main_image_id = images[-1].id
+                yield project
+
+        self.counts["projects"] = bulk_insert(Project, rows())
+        self.counts["technologies"] = bulk_insert(ProjectTechnology, technologies)
+        self.counts["project tags"] = bulk_insert(through, tag_links)
+        self.counts["images"] = bulk_insert(ProjectImage, images)
+        if connection.vendor == "postgresql":
+            self.index_search_vectors()
+
+    def index_search_vectors(self) -> None:
+        """Fill search_vector in one statement, mirroring build_search_vector()."""
+        print("Indexing search vectors...")
+        Project.objects.filter(owner__email__endswith=f"@{EMAIL_DOMAIN}").update(
+            search_vector=(
+                SearchVector(Lower("title"), config="simple", weight="A")
+                + SearchVector(Lower("tagline"), config="simple", weight="B")
+                + SearchVector(
+                    Lower("description"),
+                    Lower(Coalesce("long_description", models.Value(""))),
+                    config="simple",
+                    weight="C",
+                )
+            )
+        )
+
+    def create_views(self) -> None:
+        print("Creating project views...")
+        # Zipf-like popularity: a few projects collect most of the views.
+        weights = [1 / (rank + 1) ** 0.8 for rank in range(len(self.approved))]
+        total_weight = sum(weights)
+        target = scaled(PROJECT_VIEW_COUNT, self.scale)
+        popularity = self.rng.sample(self.approved, len(self.approved))
+        sketches: list[ProjectVisitorSketch] = []
+
+        def rows() -> Iterator[ProjectView]:
+            for project_id, weight in zip(popularity, weights, strict=True):
+                count = math.ceil(target * weight / total_weight)
+                days: dict[date, HyperLogLog] = defaultdict(HyperLogLog)
+                # Consecutive addresses from a random start keep each
+                # (project, viewer_ip) pair unique.
+                start = self.rng.randrange(2**32 - count)
+                for offset in range(count):
+                    viewer_ip = str(ipaddress.IPv4Address(start + offset))
+                    created_at = self.timestamp(max_days=90)
+                    days[created_at.date()].add(viewer_ip)
+                    yield ProjectView(
+                        id=self.uuid(),
+                        project_id=project_id,
+                        viewer_ip=viewer_ip,
+                        user_agent="Mozilla/5.0 (dataset)",
+                        created_at=created_at,
+                    )
+                sketches.extend(
+                    ProjectVisitorSketch(
+                        id=self.uuid(),
+                        project_id=project_id,
+                        day=day,
+                        registers=sketch.to_bytes(),
+                    )
+                    for day, sketch in sorted(days.items())
+                )
+
+        self.counts["project views"] = bulk_insert(ProjectView, rows())
+        self.counts["visitor sketches"] = bulk_insert(ProjectVisitorSketch, sketches)
+        # Same path as the periodic rollup, so counts match the sketches.
+        refresh_monthly_visitors(self.anchor.date())
+
+    def create_competitions(self) -> None:
+        print("Creating competitions...")
+        competitions: list[Competition] = []
+        entries: list[models.Model] = []
+        reviewers: list[CompetitionReviewer] = []
+        rankings: list[ProjectRanking] = []
+        through = Competition.projects.through
+        count = min(scaled(COMPETITION_COUNT, self.scale), 999)
+        month = date(self.anchor.year, self.anchor.month, 1)
+
+        for i in range(count):
+            start = month
+            month = (month - timedelta(days=1)).replace(day=1)
+            status = (
+                CompetitionStatus.ACCEPTING_APPLICATIONS
+                if i == 0
+                else CompetitionStatus.CLOSED
+            )
+            competition_id = self.uuid()
+            name = f"Dataset competition {i + 1:03d}"
+            entry_count = min(
+                self.rng.randint(*ENTRIES_PER_COMPETITION), len(self.approved)
+            )
+            projects = self.rng.sample(self.approved, entry_count)
+            created_at = datetime.combine(start, datetime.min.time(), tzinfo=UTC)
+            competitions.append(
+                Competition(
+                    id=competition_id,
+                    name=name,
+                    slug=slugify(name),
+                    start_date=start,
+                    end_date=start + timedelta(days=27),
+                    quote=self.sentence(4, 8),
+                    status=status,
+                    winner_id=(
+                        projects[0]
+                        if status == CompetitionStatus.CLOSED and projects
+                        else None
+                    ),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+            entries.extend(
+                through(competition_id=competition_id, project_id=project_id)
+                for project_id in projects
+            )
+            for user_id in self.rng.sample(
+                self.users, min(REVIEWERS_PER_COMPETITION, len(self.users))
+            ):
+                reviewers.append(
+                    CompetitionReviewer(
+                        id=self.uuid(),
+                        user_id=user_id,
+                        competition_id=competition_id,
+                        status=(
+                            ReviewStatus.COMPLETED
+                            if status == CompetitionStatus.CLOSED
+                            else ReviewStatus.IN_PROGRESS
+                        ),
+                    )
+                )
+                order = self.rng.sample(projects, len(projects))
+                rankings.extend(
+                    ProjectRanking(
+                        id=self.uuid(),
+                        reviewer_id=user_id,
+                        competition_id=competition_id,
+                        project_id=project_id,
+                        position=position,
+                        created_at=created_at,
+                        updated_at=created_at,
+                    )
+                    for position, project_id in enumerate(order, start=1)
+                )
+
+        self.counts["competitions"] = bulk_insert(Competition, competitions)
+        self.counts["competition entries"] = bulk_insert(through, entries)
+        self.counts["reviewers"] = bulk_insert(CompetitionReviewer, reviewers)
+        self.counts["rankings"] = bulk_insert(ProjectRanking, rankings)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="fraction of the full volumes to generate (default: 1.0)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument(
+        "--anchor",
+        type=date.fromisoformat,
+        default=DEFAULT_ANCHOR,
+        help=(
+            "date generated timestamps count back from "
+            f"(default: {DEFAULT_ANCHOR.isoformat()})"
+        ),
+    )
+    args = parser.parse_args()
+    if args.scale <= 0:
+        parser.error("--scale must be positive")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    if User.objects.filter(email=MARKER_EMAIL).exists():
+        print("Generated dataset already exists. Start from an empty database:")
+        print("  uv run python manage.py flush")
+        return
+
+    print(f"=== Generating dataset (scale={args.scale}, seed={args.seed}) ===\n")
+    anchor = datetime.combine(args.anchor, datetime.min.time(), tzinfo=UTC)
+    counts = DatasetGenerator(args.scale, args.seed, anchor).run()
+
+    print("\n=== Dataset complete ===")
+    for label, count in counts.items():
+        print(f"  {label + ':':<21} {count}")
+    print(f"\nAll generated users have password: {DEFAULT_PASSWORD}")
+
+
+if __name__ == "__main__":
+    main()
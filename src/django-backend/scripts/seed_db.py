@@ -544,6 +544,7 @@ def create_projects(users: list[User], admin: User | None) -> list[Project]:
             if p["status"] == ProjectStatus.APPROVED
             else None,
         )
+        project.sync_technologies()
 
         # Assign tags
         for tag_name in p.get("tag_names", []):
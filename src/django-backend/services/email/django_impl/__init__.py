@@ -1,11 +1,11 @@
+from django.template import Context
 from django.template.loader import render_to_string
-from mjml import mjml_to_html
+
+from .compiled_templates import get_compiled_template
 
 
 def render_email(template_name: str, context: dict) -> tuple[str, str]:
-    mjml_content = render_to_string(f"email/{template_name}.mjml", context)
-    result = mjml_to_html(mjml_content)
-    html = result.html
+    html = get_compiled_template(template_name).render(Context(context))
     text = render_to_string(f"email/{template_name}.txt", context)
     return html, text
 
@@ -0,0 +1,78 @@
+"""MJML email templates compiled once into plain HTML Django templates.
+
+Compiling MJML is what makes rendering an email slow, and its output only
+depends on the template's structure, not the context. So each
+templates/email/<name>.mjml is compiled once per process with its template
+tags kept as-is: a loader wraps every tag and variable other than extends and
+block in {% verbatim %}, Django resolves the inheritance, MJML compiles the
+flattened result, and the HTML, tags included, becomes an ordinary Django
+template. Sending an email is then a plain template render.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.template import Context, Engine, engines
+from django.template.loaders import filesystem
+from mjml import mjml_to_html
+
+if TYPE_CHECKING:
+    from django.template import Template
+    from django.template.base import Origin
+
+EMAIL_TEMPLATE_DIR = "email"
+
+_TEMPLATE_SYNTAX = re.compile(r"\{\{.*?\}\}|\{%.*?%\}", re.DOTALL)
+_STRUCTURAL_TAG = re.compile(r"\{%\s*(?:extends|block|endblock)\b")
+
+
+def _protect(match: re.Match[str]) -> str:
+    tag = match.group()
+    if _STRUCTURAL_TAG.match(tag):
+        return tag
+    return f"{{% verbatim %}}{tag}{{% endverbatim %}}"
+
+
+class _ProtectingLoader(filesystem.Loader):
+    """Loads templates with everything but inheritance tags left unrendered."""
+
+    def get_contents(self, origin: Origin) -> str:
+        return _TEMPLATE_SYNTAX.sub(_protect, super().get_contents(origin))
+
+
+def _flattening_engine() -> Engine:
+    dirs = engines["django"].engine.dirs
+    return Engine(
+        dirs=dirs,
+        loaders=[(f"{__name__}._ProtectingLoader", dirs)],
+        autoescape=False,
+    )
+
+
+@cache
+def get_compiled_template(template_name: str) -> Template:
+    """The compiled HTML template for templates/email/<template_name>.mjml."""
+    flattened = (
+        _flattening_engine()
+        .get_template(f"{EMAIL_TEMPLATE_DIR}/{template_name}.mjml")
+        .render(Context())
+    )
+    html = mjml_to_html(flattened).html
+    return engines["django"].engine.from_string(html)
+
+
+def precompile_email_templates() -> list[str]:
+    """Compile every email template now instead of on its first send."""
+    names = sorted(
+        path.stem
+        for directory in engines["django"].engine.dirs
+        for path in (Path(directory) / EMAIL_TEMPLATE_DIR).glob("*.mjml")
+        if path.stem != "base"
+    )
+    for name in names:
+        get_compiled_template(name)
+    return names
@@ -0,0 +1,173 @@
+"""Pooled, concurrent delivery of outgoing mail.
+
+Opening an SMTP session (connect, STARTTLS, AUTH) costs far more than sending
+a message over it, so messages are sent over a small pool of long-lived
+connections from the configured EMAIL_BACKEND. Large sends are split into
+batches that worker threads push through their own checked-out connection,
+throttled to the provider's rate limit. Transient failures (dropped
+connections, 4xx replies, network errors) reconnect and retry with
+exponential backoff; anything else is reported per message.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.mail import get_connection
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.core.mail import EmailMessage
+    from django.core.mail.backends.base import BaseEmailBackend
+
+logger = logging.getLogger(__name__)
+
+_TRANSIENT_REPLY_CODES = range(400, 500)
+
+
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code in _TRANSIENT_REPLY_CODES
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    # Other SMTP errors (refused recipients, bad sender) will not go away on
+    # retry; plain OSErrors are timeouts and refused or reset connections.
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class RateLimiter:
+    """Spaces calls to acquire() at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class EmailDelivery:
+    def __init__(
+        self,
+        *,
+        backend: str | None = None,
+        pool_size: int = 4,
+        batch_size: int = 50,
+        rate_limit: float = 0,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        self.backend = backend
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.rate_limiter = RateLimiter(rate_limit)
+        self._idle: queue.LifoQueue[BaseEmailBackend] = queue.LifoQueue(pool_size)
+
+    def send(self, messages: Sequence[EmailMessage]) -> list[Exception | None]:
+        """Send messages; returns None or the final error for each, in order."""
+        batches = list(batched(messages, self.batch_size))
+        if len(batches) <= 1:
+            return self._send_batch(messages)
+        workers = min(self.pool_size, len(batches))
+        with ThreadPoolExecutor(workers, thread_name_prefix="email") as executor:
+            results = executor.map(self._send_batch, batches)
+            return [error for batch in results for error in batch]
+
+    def send_one(self, message: EmailMessage) -> None:
+        """Send a single message, raising its error if delivery failed."""
+        [error] = self.send([message])
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            connection.close()
+
+    def _send_batch(self, messages: Sequence[EmailMessage]) -> list[Exception | None]:
+        connection = self._checkout()
+        try:
+            return [self._send_message(connection, message) for message in messages]
+        finally:
+            self._checkin(connection)
+
+    def _send_message(
+        self, connection: BaseEmailBackend, message: EmailMessage
+    ) -> Exception | None:
+        message.connection = connection
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                # Backends close connections they opened themselves after
+                # sending, so open it here to keep the session for the next.
+                connection.open()
+                message.send(fail_silently=False)
+            except Exception as error:  # noqa: BLE001 - returned to the caller
+                if attempt == self.max_retries or not is_transient(error):
+                    return error
+                logger.warning(
+                    "Transient error sending email to %s, retrying: %s",
+                    ", ".join(message.recipients()),
+                    error,
+                )
+                # The session may be unusable now; the next attempt reopens it.
+                with suppress(OSError):
+                    connection.close()
+                time.sleep(self.retry_backoff * 2**attempt)
+            else:
+                return None
+        return None
+
+    def _checkout(self) -> BaseEmailBackend:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return get_connection(self.backend, fail_silently=False)
+
+    def _checkin(self, connection: BaseEmailBackend) -> None:
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+
+_delivery: EmailDelivery | None = None
+_delivery_lock = threading.Lock()
+
+
+def get_email_delivery() -> EmailDelivery:
+    """The process-wide delivery pool, configured from settings."""
+    global _delivery  # noqa: PLW0603
+    with _delivery_lock:
+        if _delivery is None:
+            _delivery = EmailDelivery(
+                pool_size=settings.EMAIL_POOL_SIZE,
+                batch_size=settings.EMAIL_BATCH_SIZE,
+                rate_limit=settings.EMAIL_RATE_LIMIT,
+                max_retries=settings.EMAIL_MAX_RETRIES,
+                retry_backoff=settings.EMAIL_RETRY_BACKOFF,
+            )
+        return _delivery
@@ -5,17 +5,20 @@ from typing import TYPE_CHECKING
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
 from django.utils import timezone
 
-from apps.emails.models import BroadcastEmailRecipient
+from apps.emails.models import BroadcastEmail, BroadcastEmailRecipient
 from services.email import EMAIL_LOGO_URL
 from services.email.handler_interface import EmailHandlerInterface
 
 from . import render_email
+from .delivery import get_email_delivery
 from .query import DjangoEmailQuery
 
 if TYPE_CHECKING:
-    from apps.emails.models import BroadcastEmail
+    from collections.abc import Sequence
+
     from apps.projects.models import Project
     from apps.users.models import User
 
@@ -45,7 +48,7 @@ class DjangoEmailHandler(EmailHandlerInterface):
             to=[user.email],
         )
         email.attach_alternative(html, "text/html")
-        email.send(fail_silently=False)
+        get_email_delivery().send_one(email)
 
     def send_password_reset_email(
         self,
@@ -69,9 +72,96 @@ class DjangoEmailHandler(EmailHandlerInterface):
             to=[user.email],
         )
         email.attach_alternative(html, "text/html")
-        email.send(fail_silently=False)
+        get_email_delivery().send_one(email)
 
     def send_project_approved_email(self, project: Project) -> None:
+        get_email_delivery().send_one(self._project_approved_message(project))
+
+    def send_project_approved_emails(
+        self, projects: Sequence[Project]
+    ) -> tuple[int, int]:
+        """Send the approval emails for a batch of projects in one go.
+
+        The batch shares a pooled SMTP session; a failure is logged and
+        does not stop the rest. Returns (success, failure) counts.
+        """
+        errors = get_email_delivery().send(
+            [self._project_approved_message(project) for project in projects]
+        )
+        for project, error in zip(projects, errors, strict=True):
+            if error is not None:
+                logger.error(
+                    "Failed to send approval email for project %s",
+                    project.id,
+                    exc_info=error,
+                )
+        failed = sum(error is not None for error in errors)
+        return len(errors) - failed, failed
+
+    def queue_broadcast(self, broadcast: BroadcastEmail, sent_by_user: User) -> int:
+        """Mark broadcast as sending; the caller enqueues the send itself."""
+        recipients = DjangoEmailQuery().resolve_broadcast_recipients(broadcast)
+        broadcast.recipient_total = recipients.count()
+        broadcast.send_requested_at = timezone.now()
+        broadcast.sent_by = sent_by_user
+        broadcast.save(
+            update_fields=["recipient_total", "send_requested_at", "sent_by"]
+        )
+        return broadcast.recipient_total
+
+    def send_broadcast(
+        self,
+        broadcast: BroadcastEmail,
+        sent_by_user: User,
+    ) -> tuple[int, int]:
+        """Send to every recipient without a delivery record yet.
+
+        Recipients are handled in chunks of BROADCAST_CHUNK_SIZE, each
+        recorded with one bulk insert, so an interrupted send can simply be
+        run again and picks up where it stopped. Returns the broadcast's
+        total (success, failure) counts.
+        """
+        query = DjangoEmailQuery()
+        html, text = query.render_broadcast_email(broadcast)
+        pending = (
+            query.resolve_broadcast_recipients(broadcast)
+            .exclude(broadcast_deliveries__broadcast_email=broadcast)
+            .order_by("id")
+        )
+
+        last_id = None
+        while True:
+            with transaction.atomic():
+                # Serializes concurrent runs of the same broadcast, e.g. a
+                # resume queued while the first worker is still going, so
+                # each chunk only goes to recipients nobody has sent to.
+                BroadcastEmail.objects.select_for_update().get(pk=broadcast.pk)
+                chunk = pending if last_id is None else pending.filter(id__gt=last_id)
+                users = list(chunk[: settings.BROADCAST_CHUNK_SIZE])
+                if not users:
+                    break
+                messages = [
+                    self._broadcast_message(broadcast, user, html, text)
+                    for user in users
+                ]
+                errors = get_email_delivery().send(messages)
+                BroadcastEmailRecipient.objects.bulk_create(
+                    [
+                        self._delivery_record(broadcast, user, error)
+                        for user, error in zip(users, errors, strict=True)
+                    ],
+                    ignore_conflicts=True,
+                )
+            last_id = users[-1].id
+
+        broadcast.sent_at = timezone.now()
+        broadcast.sent_by = sent_by_user
+        broadcast.save(update_fields=["sent_at", "sent_by"])
+
+        progress = query.get_broadcast_progress(broadcast)
+        return progress.delivered - progress.failed, progress.failed
+
+    def _project_approved_message(self, project: Project) -> EmailMultiAlternatives:
         owner = project.owner
         context = {
             "user_name": owner.first_name or "there",
@@ -89,48 +179,30 @@ class DjangoEmailHandler(EmailHandlerInterface):
             to=[owner.email],
         )
         email.attach_alternative(html, "text/html")
-        email.send(fail_silently=False)
+        return email
 
-    def send_broadcast(
-        self,
-        broadcast: BroadcastEmail,
-        sent_by_user: User,
-    ) -> tuple[int, int]:
-        query = DjangoEmailQuery()
-        html, text = query.render_broadcast_email(broadcast)
-        recipients = query.resolve_broadcast_recipients(broadcast)
-        success_count = 0
-        failure_count = 0
-
-        for user in recipients.iterator():
-            error_message = ""
-            success = True
-            try:
-                email = EmailMultiAlternatives(
-                    subject=f"{broadcast.subject} - Naglasúpan",
-                    body=text,
-                    from_email=settings.ADMIN_FROM_EMAIL,
-                    to=[user.email],
-                )
-                email.attach_alternative(html, "text/html")
-                email.send(fail_silently=False)
-            except Exception:
-                logger.exception("Failed to send broadcast email to %s", user.email)
-                success = False
-                failure_count += 1
-                error_message = f"Failed to send to {user.email}"
-            else:
-                success_count += 1
-
-            BroadcastEmailRecipient.objects.create(
-                broadcast_email=broadcast,
-                user=user,
-                success=success,
-                error_message=error_message,
+    def _broadcast_message(
+        self, broadcast: BroadcastEmail, user: User, html: str, text: str
+    ) -> EmailMultiAlternatives:
+        email = EmailMultiAlternatives(
+            subject=f"{broadcast.subject} - Naglasúpan",
+            body=text,
+            from_email=settings.ADMIN_FROM_EMAIL,
+            to=[user.email],
+        )
+        email.attach_alternative(html, "text/html")
+        return email
+
+    def _delivery_record(
+        self, broadcast: BroadcastEmail, user: User, error: Exception | None
+    ) -> BroadcastEmailRecipient:
+        record = BroadcastEmailRecipient(broadcast_email=broadcast, user=user)
+        if error is not None:
+            logger.error(
+                "Failed to send broadcast email to %s",
+                user.email,
+                exc_info=error,
             )
-
-        broadcast.sent_at = timezone.now()
-        broadcast.sent_by = sent_by_user
-        broadcast.save(update_fields=["sent_at", "sent_by"])
-
-        return success_count, failure_count
+            record.success = False
+            record.error_message = f"Failed to send to {user.email}"
+        return record
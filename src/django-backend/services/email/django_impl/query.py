@@ -4,10 +4,11 @@ from typing import TYPE_CHECKING
 
 import markdown
 from django.conf import settings
+from django.db.models import Count, Q
 from django.utils import timezone
 
 from services.email import EMAIL_LOGO_URL
-from services.email.query_interface import EmailQueryInterface
+from services.email.query_interface import BroadcastProgress, EmailQueryInterface
 from services.users.django_impl import DjangoUserQuery
 
 from . import render_email
@@ -40,3 +41,14 @@ class DjangoEmailQuery(EmailQueryInterface):
                 broadcast.email_type
             )
         return broadcast.individual_recipients.filter(is_active=True)
+
+    def get_broadcast_progress(self, broadcast: BroadcastEmail) -> BroadcastProgress:
+        counts = broadcast.delivery_records.aggregate(
+            delivered=Count("id"), failed=Count("id", filter=Q(success=False))
+        )
+        return BroadcastProgress(
+            total=broadcast.recipient_total,
+            delivered=counts["delivered"],
+            failed=counts["failed"],
+            done=broadcast.is_sent,
+        )
@@ -0,0 +1,145 @@
+import smtplib
+
+import pytest
+from django.core.mail import EmailMessage
+
+from services.email.django_impl.delivery import (
+    EmailDelivery,
+    RateLimiter,
+    is_transient,
+)
+from tests.smtp_server import LocalSMTPServer
+
+SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+
+
+@pytest.fixture
+def smtp_server(settings):
+    with LocalSMTPServer() as server:
+        settings.EMAIL_HOST = "127.0.0.1"
+        settings.EMAIL_PORT = server.port
+        settings.EMAIL_USE_TLS = False
+        settings.EMAIL_HOST_USER = ""
+        yield server
+
+
+def _messages(count):
+    return [
+        EmailMessage(subject=f"Message {i}", body="Hi", to=[f"user{i}@example.com"])
+        for i in range(count)
+    ]
+
+
+def _delivery(**kwargs):
+    return EmailDelivery(backend=SMTP_BACKEND, retry_backoff=0, **kwargs)
+
+
+class TestEmailDelivery:
+    def test_reuses_one_session_for_a_batch(self, smtp_server):
+        delivery = _delivery(batch_size=10)
+
+        errors = delivery.send(_messages(5))
+        delivery.close()
+
+        assert errors == [None] * 5
+        assert smtp_server.log.connections == 1
+        assert len(smtp_server.log.messages) == 5
+
+    def test_keeps_sessions_open_between_sends(self, smtp_server):
+        delivery = _delivery()
+
+        delivery.send_one(_messages(1)[0])
+        delivery.send_one(_messages(1)[0])
+        delivery.close()
+
+        assert smtp_server.log.connections == 1
+        assert len(smtp_server.log.messages) == 2
+
+    def test_sends_batches_concurrently_within_pool_size(self, smtp_server):
+        delivery = _delivery(batch_size=2, pool_size=3)
+
+        errors = delivery.send(_messages(12))
+        delivery.close()
+
+        assert errors == [None] * 12
+        assert smtp_server.log.connections <= 3
+        assert {m["To"] for m in smtp_server.log.messages} == {
+            f"user{i}@example.com" for i in range(12)
+        }
+
+    def test_retries_transient_failures(self, smtp_server):
+        smtp_server.log.mail_failures = [451, 421]
+        delivery = _delivery()
+
+        errors = delivery.send(_messages(1))
+        delivery.close()
+
+        assert errors == [None]
+        assert len(smtp_server.log.messages) == 1
+
+    def test_gives_up_after_max_retries(self, smtp_server):
+        smtp_server.log.mail_failures = [451, 451]
+        delivery = _delivery(max_retries=1)
+
+        [error] = delivery.send(_messages(1))
+        delivery.close()
+
+        assert isinstance(error, smtplib.SMTPSenderRefused)
+        assert smtp_server.log.messages == []
+
+    def test_does_not_retry_permanent_failures(self, smtp_server):
+        smtp_server.log.mail_failures = [550]
+        delivery = _delivery()
+
+        errors = delivery.send(_messages(2))
+        delivery.close()
+
+        assert isinstance(errors[0], smtplib.SMTPSenderRefused)
+        assert errors[1] is None
+        assert len(smtp_server.log.messages) == 1
+
+    def test_send_one_raises_delivery_error(self, smtp_server):
+        smtp_server.log.mail_failures = [550]
+
+        with pytest.raises(smtplib.SMTPSenderRefused):
+            _delivery().send_one(_messages(1)[0])
+
+
+class TestIsTransient:
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (smtplib.SMTPServerDisconnected(), True),
+            (smtplib.SMTPSenderRefused(451, b"busy", "a@b.c"), True),
+            (smtplib.SMTPSenderRefused(550, b"no", "a@b.c"), False),
+            (smtplib.SMTPRecipientsRefused({}), False),
+            (ConnectionRefusedError(), True),
+            (ValueError(), False),
+        ],
+    )
+    def test_classifies_errors(self, error, expected):
+        assert is_transient(error) is expected
+
+
+class TestRateLimiter:
+    def test_spaces_calls(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(
+            "services.email.django_impl.delivery.time.sleep", sleeps.append
+        )
+        limiter = RateLimiter(rate=10)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert len(sleeps) == 2
+        assert all(0 < s <= 0.2 for s in sleeps)
+
+    def test_unlimited_never_waits(self, monkeypatch):
+        monkeypatch.setattr(
+            "services.email.django_impl.delivery.time.sleep",
+            lambda _: pytest.fail("slept"),
+        )
+        limiter = RateLimiter(rate=0)
+
+        limiter.acquire()
@@ -57,6 +57,27 @@ class TestSendProjectApprovedEmail:
         assert "Awesome App" in html_content
 
 
+@pytest.mark.django_db
+class TestSendProjectApprovedEmails:
+    def test_sends_one_email_per_project(self, mailoutbox):
+        projects = ProjectFactory.create_batch(3)
+
+        assert handler.send_project_approved_emails(projects) == (3, 0)
+
+        assert [email.to for email in mailoutbox] == [
+            [project.owner.email] for project in projects
+        ]
+
+    def test_counts_failures_without_raising(self):
+        projects = ProjectFactory.create_batch(2)
+
+        with patch(
+            "services.email.django_impl.delivery.EmailDelivery.send",
+            return_value=[None, OSError("connection reset")],
+        ):
+            assert handler.send_project_approved_emails(projects) == (1, 1)
+
+
 @pytest.mark.django_db
 class TestSendBroadcast:
     def _make_broadcast_with_recipients(self, count=2, **kwargs):
@@ -163,3 +184,37 @@ class TestSendBroadcast:
         handler.send_broadcast(broadcast, admin)
 
         assert mailoutbox[0].subject == "Big News - Naglasúpan"
+
+    def test_sends_in_chunks(self, mailoutbox, settings):
+        settings.BROADCAST_CHUNK_SIZE = 2
+        broadcast, admin, users = self._make_broadcast_with_recipients(5)
+
+        assert handler.send_broadcast(broadcast, admin) == (5, 0)
+        assert {m.to[0] for m in mailoutbox} == {u.email for u in users}
+
+    def test_resumes_without_resending_delivered_recipients(self, mailoutbox):
+        broadcast, admin, users = self._make_broadcast_with_recipients(3)
+        BroadcastEmailRecipient.objects.create(broadcast_email=broadcast, user=users[0])
+
+        success_count, failure_count = handler.send_broadcast(broadcast, admin)
+
+        assert {m.to[0] for m in mailoutbox} == {users[1].email, users[2].email}
+        assert (success_count, failure_count) == (3, 0)
+
+
+@pytest.mark.django_db
+class TestQueueBroadcast:
+    def test_marks_broadcast_as_sending(self, mailoutbox):
+        admin = UserFactory(email_opt_in_platform_updates=False)
+        UserFactory.create_batch(2, email_opt_in_platform_updates=True)
+        broadcast = BroadcastEmailFactory(
+            email_type="platform_updates", created_by=admin
+        )
+
+        assert handler.queue_broadcast(broadcast, admin) == 2
+
+        broadcast.refresh_from_db()
+        assert broadcast.is_sending
+        assert broadcast.recipient_total == 2
+        assert broadcast.sent_by == admin
+        assert mailoutbox == []
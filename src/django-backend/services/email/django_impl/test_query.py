@@ -1,6 +1,8 @@
 import pytest
 
+from apps.emails.models import BroadcastEmailRecipient
 from services.email.django_impl import DjangoEmailQuery, render_email
+from services.email.query_interface import BroadcastProgress
 from tests.factories import BroadcastEmailFactory, UserFactory
 
 query = DjangoEmailQuery()
@@ -138,6 +140,22 @@ class TestResolveBroadcastRecipients:
         assert recipients.count() == 0
 
 
+@pytest.mark.django_db
+class TestGetBroadcastProgress:
+    def test_counts_deliveries_against_total(self):
+        broadcast = BroadcastEmailFactory(recipient_total=3)
+        BroadcastEmailRecipient.objects.create(
+            broadcast_email=broadcast, user=UserFactory()
+        )
+        BroadcastEmailRecipient.objects.create(
+            broadcast_email=broadcast, user=UserFactory(), success=False
+        )
+
+        progress = query.get_broadcast_progress(broadcast)
+
+        assert progress == BroadcastProgress(total=3, delivered=2, failed=1, done=False)
+
+
 class TestRenderProjectApprovedEmail:
     def test_renders_html_with_project_title(self):
         html, _ = render_email(
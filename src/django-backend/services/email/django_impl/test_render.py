@@ -1,4 +1,11 @@
+from unittest.mock import patch
+
+from django.template import Context
+from django.template.loader import render_to_string
+from mjml import mjml_to_html
+
 from . import render_email
+from .compiled_templates import get_compiled_template, precompile_email_templates
 
 
 class TestRenderEmail:
@@ -46,3 +53,48 @@ class TestRenderEmail:
         assert "112233" in text
         assert "Hi Alice" in text
         assert "15 minutes" in text
+
+
+class TestCompiledTemplates:
+    def test_matches_rendering_the_mjml_directly(self):
+        context = {
+            "code": "123456",
+            "expiry_minutes": 15,
+            "user_name": "Test <b>&",
+            "logo_url": "https://example.com/logo.png",
+            "current_year": 2025,
+        }
+        mjml = render_to_string("email/verification_code.mjml", context)
+
+        html, _ = render_email("verification_code", context)
+
+        assert html == mjml_to_html(mjml).html
+
+    def test_compiles_each_template_once(self):
+        get_compiled_template.cache_clear()
+
+        with patch(
+            "services.email.django_impl.compiled_templates.mjml_to_html",
+            wraps=mjml_to_html,
+        ) as compile_mjml:
+            for year in (2025, 2026):
+                render_email("broadcast", {"subject": "Hi", "current_year": year})
+
+        assert compile_mjml.call_count == 1
+
+    def test_keeps_template_syntax_out_of_mjml(self):
+        html = get_compiled_template("broadcast").render(
+            Context({"subject": "News", "body_html": "<em>Body</em>"})
+        )
+
+        assert "<em>Body</em>" in html
+        assert "{{" not in html
+        assert "verbatim" not in html
+
+    def test_precompiles_every_sendable_template(self):
+        assert precompile_email_templates() == [
+            "broadcast",
+            "password_reset_code",
+            "project_approved",
+            "verification_code",
+        ]
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from apps.emails.models import BroadcastEmail
     from apps.projects.models import Project
     from apps.users.models import User
@@ -18,11 +20,19 @@ class EmailHandlerInterface(ABC):
     @abstractmethod
     def send_project_approved_email(self, project: Project) -> None: ...
 
+    @abstractmethod
+    def send_project_approved_emails(
+        self, projects: Sequence[Project]
+    ) -> tuple[int, int]: ...
+
     @abstractmethod
     def send_password_reset_email(
         self, user: User, code: str, expires_minutes: int
     ) -> None: ...
 
+    @abstractmethod
+    def queue_broadcast(self, broadcast: BroadcastEmail, sent_by_user: User) -> int: ...
+
     @abstractmethod
     def send_broadcast(
         self, broadcast: BroadcastEmail, sent_by_user: User
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,9 +10,22 @@ if TYPE_CHECKING:
     from apps.emails.models import BroadcastEmail
 
 
+@dataclass
+class BroadcastProgress:
+    total: int
+    delivered: int
+    failed: int
+    done: bool
+
+
 class EmailQueryInterface(ABC):
     @abstractmethod
     def render_broadcast_email(self, broadcast: BroadcastEmail) -> tuple[str, str]: ...
 
     @abstractmethod
     def resolve_broadcast_recipients(self, broadcast: BroadcastEmail) -> QuerySet: ...
+
+    @abstractmethod
+    def get_broadcast_progress(
+        self, broadcast: BroadcastEmail
+    ) -> BroadcastProgress: ...
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
+from django.conf import settings
+from django.utils import timezone
+
 from apps.projects.models import (
     Competition,
     CompetitionStatus,
     Project,
     ProjectStatus,
+    ProjectView,
 )
 from apps.tags.models import Tag, TagStatus
 from services.project.exceptions import (
@@ -19,6 +24,8 @@ from services.project.exceptions import (
 from services.project.handler_interface import ProjectHandlerInterface
 
 from .query import get_title_from_url
+from .trending import refresh_trending_scores
+from .visitors import add_to_sketches, expire_views, refresh_monthly_visitors
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -27,6 +34,7 @@ if TYPE_CHECKING:
 
     from services.project.handler_interface import (
         CreateProjectInput,
+        RecordViewInput,
         UpdateProjectInput,
     )
 
@@ -85,6 +93,7 @@ class DjangoProjectHandler(ProjectHandlerInterface):
             project_fields["title"] = get_title_from_url(data.website_url)
 
         project = Project.objects.create(**project_fields)
+        project.sync_technologies()
 
         if valid_tags is not None:
             project.tags.set(valid_tags)
@@ -132,6 +141,7 @@ class DjangoProjectHandler(ProjectHandlerInterface):
             project.rejection_reason = None
 
         project.save()
+        project.sync_technologies()
 
         if valid_tags is not None:
             project.tags.set(valid_tags)
@@ -162,3 +172,39 @@ class DjangoProjectHandler(ProjectHandlerInterface):
         project.save()
 
         return project
+
+    def record_views(self, views: list[RecordViewInput]) -> None:
+        # Views are collected without touching the database, so drop any for
+        # projects that do not exist (or no longer do) before inserting.
+        project_ids = set(
+            Project.objects.filter(
+                id__in={view.project_id for view in views}
+            ).values_list("id", flat=True)
+        )
+        views = [view for view in views if view.project_id in project_ids]
+        # Repeat visitors hit the (project, viewer_ip) unique constraint.
+        ProjectView.objects.bulk_create(
+            [
+                ProjectView(
+                    project_id=view.project_id,
+                    viewer_ip=view.viewer_ip,
+                    user_agent=view.user_agent,
+                )
+                for view in views
+            ],
+            ignore_conflicts=True,
+        )
+        add_to_sketches(
+            ((view.project_id, view.viewer_ip) for view in views),
+            timezone.localdate(),
+        )
+
+    def refresh_visitor_counts(self) -> int:
+        changed = refresh_monthly_visitors(timezone.localdate())
+        expire_views(
+            timezone.now() - timedelta(days=settings.PROJECT_VIEW_RETENTION_DAYS)
+        )
+        return changed
+
+    def refresh_trending_scores(self) -> int:
+        return refresh_trending_scores(timezone.now())
@@ -1,18 +1,56 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
 from math import ceil
 from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
 
-from django.db.models import Q, QuerySet
-
-from apps.projects.models import Project, ProjectStatus
-from services.project.exceptions import ProjectNotFoundError
-from services.project.query_interface import ProjectQueryInterface
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch, Q, QuerySet
+
+from apps.projects.models import (
+    Project,
+    ProjectImage,
+    ProjectStatus,
+    UploadStatus,
+    normalize_technology,
+)
+from apps.tags.models import Tag, TagStatus
+from services.project.exceptions import InvalidCursorError, ProjectNotFoundError
+from services.project.query_interface import (
+    CompetitionResults,
+    ProjectQueryInterface,
+)
+
+from .results import compute_competition_results
+from .search import search_projects
+from .visitors import count_unique_visitors
+
+# Non-nullable fields that can be combined with the id for keyset pagination.
+CURSOR_SORT_FIELDS = frozenset({"created_at", "title", "monthly_visitors"})
+# Pseudo sort field ordering search results by rank, best match first.
+RELEVANCE_SORT = "relevance"
 
 
 def _base_queryset() -> QuerySet[Project]:
+    # The filtered prefetches land in the to_attr lists ProjectResponse reads,
+    # so serializing a page costs the same few queries whatever its size.
     return Project.objects.select_related("owner").prefetch_related(
-        "tags", "tags__category", "won_competitions"
+        Prefetch(
+            "tags",
+            queryset=Tag.objects.exclude(status=TagStatus.REJECTED).select_related(
+                "category"
+            ),
+            to_attr="visible_tags",
+        ),
+        Prefetch(
+            "images",
+            queryset=ProjectImage.objects.filter(upload_status=UploadStatus.UPLOADED),
+            to_attr="uploaded_images",
+        ),
+        "won_competitions",
     )
 
 
@@ -32,6 +70,41 @@ def get_title_from_url(url: str) -> str:
     return domain or "Untitled Project"
 
 
+def encode_cursor(project: Project, sort_by: str, sort_order: str) -> str:
+    """Opaque cursor pointing just past ``project`` in the given ordering."""
+    value = getattr(project, sort_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort_by, sort_order, value, str(project.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, UUID]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        cursor_sort_by, cursor_sort_order, value, project_id = payload
+        value = Project._meta.get_field(sort_by).to_python(value)  # noqa: SLF001
+        project_id = UUID(project_id)
+    except (binascii.Error, ValueError, TypeError, ValidationError):
+        msg = "Invalid cursor"
+        raise InvalidCursorError(msg) from None
+    if (cursor_sort_by, cursor_sort_order) != (sort_by, sort_order):
+        msg = "Cursor does not match the requested sort order"
+        raise InvalidCursorError(msg)
+    return value, project_id
+
+
+def _after_cursor(
+    queryset: QuerySet[Project], cursor: str, sort_by: str, sort_order: str
+) -> QuerySet[Project]:
+    value, project_id = decode_cursor(cursor, sort_by, sort_order)
+    op = "lt" if sort_order == "desc" else "gt"
+    return queryset.filter(
+        Q(**{f"{sort_by}__{op}": value})
+        | Q(**{sort_by: value, f"id__{op}": project_id}),
+    )
+
+
 class DjangoProjectQuery(ProjectQueryInterface):
     def get_by_id(self, project_id: UUID) -> Project:
         try:
@@ -55,6 +128,7 @@ class DjangoProjectQuery(ProjectQueryInterface):
         sort_order: str = "desc",
         page: int = 1,
         per_page: int = 20,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         queryset = _base_queryset().filter(status=ProjectStatus.APPROVED)
 
@@ -62,21 +136,52 @@ class DjangoProjectQuery(ProjectQueryInterface):
             queryset = queryset.filter(tags__slug__in=tags).distinct()
 
         if tech_stack:
-            for tech in tech_stack:
-                queryset = queryset.filter(tech_stack__icontains=tech)
+            # One join per technology, each an exact lookup on the
+            # (project, name) unique index.
+            names = {normalize_technology(tech) for tech in tech_stack} - {""}
+            for name in names:
+                queryset = queryset.filter(technologies__name=name)
 
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search),
-            )
-
-        order_field = f"-{sort_by}" if sort_order == "desc" else sort_by
-        queryset = queryset.order_by(order_field)
+            queryset = search_projects(queryset, search)
+
+        if sort_by == RELEVANCE_SORT and search:
+            queryset = queryset.order_by("-search_rank", "-created_at", "-id")
+        else:
+            if sort_by == RELEVANCE_SORT:
+                sort_by = "created_at"
+            prefix = "-" if sort_order == "desc" else ""
+            queryset = queryset.order_by(f"{prefix}{sort_by}", f"{prefix}id")
+        keyset = sort_by in CURSOR_SORT_FIELDS
+
+        if cursor is not None:
+            # Keyset mode: seek past the cursor instead of OFFSET, and skip
+            # the COUNT(*) - deep pages cost the same as the first one.
+            if not keyset:
+                msg = f"Cursor pagination is not supported for sort_by={sort_by}"
+                raise InvalidCursorError(msg)
+            if cursor:
+                queryset = _after_cursor(queryset, cursor, sort_by, sort_order)
+            projects = list(queryset[: per_page + 1])
+            has_next = len(projects) > per_page
+            projects = projects[:per_page]
+            return {
+                "projects": projects,
+                "total": None,
+                "page": None,
+                "per_page": per_page,
+                "pages": None,
+                "next_cursor": (
+                    encode_cursor(projects[-1], sort_by, sort_order)
+                    if has_next
+                    else None
+                ),
+            }
 
         total = queryset.count()
         pages = ceil(total / per_page)
         offset = (page - 1) * per_page
-        projects = queryset[offset : offset + per_page]
+        projects = list(queryset[offset : offset + per_page])
 
         return {
             "projects": projects,
@@ -84,6 +189,11 @@ class DjangoProjectQuery(ProjectQueryInterface):
             "page": page,
             "per_page": per_page,
             "pages": pages,
+            "next_cursor": (
+                encode_cursor(projects[-1], sort_by, sort_order)
+                if keyset and projects and page < pages
+                else None
+            ),
         }
 
     def list_for_owner(self, owner_id: UUID) -> QuerySet[Project]:
@@ -98,7 +208,7 @@ class DjangoProjectQuery(ProjectQueryInterface):
         return (
             _base_queryset()
             .filter(status=ProjectStatus.APPROVED)
-            .order_by("-monthly_visitors")[:limit]
+            .order_by("-trending_score", "-monthly_visitors")[:limit]
         )
 
     def count_pending(self) -> int:
@@ -115,3 +225,11 @@ class DjangoProjectQuery(ProjectQueryInterface):
             "owner_email": project.owner.email,
             "owner_first_name": project.owner.first_name,
         }
+
+    def count_unique_visitors(
+        self, project_id: UUID, start: date | None = None, end: date | None = None
+    ) -> int:
+        return count_unique_visitors(project_id, start, end)
+
+    def get_competition_results(self, competition_id: UUID) -> CompetitionResults:
+        return compute_competition_results(competition_id)
@@ -0,0 +1,53 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, FloatField, QuerySet, Value
+from django.db.models.functions import Cast, StrIndex
+
+from apps.projects.models import Project, normalize_search_text
+
+
+def search_terms(search: str) -> list[str]:
+    return re.findall(r"\w+", normalize_search_text(search))
+
+
+def search_projects(queryset: QuerySet[Project], search: str) -> QuerySet[Project]:
+    """Filter to projects matching every search term, annotated with search_rank.
+
+    Terms match as prefixes on PostgreSQL (tsvector + GIN index) and as
+    substrings of search_document elsewhere.
+    """
+    terms = search_terms(search)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0.0))
+    if connection.vendor == "postgresql":
+        return _search_postgres(queryset, terms)
+    return _search_fallback(queryset, terms)
+
+
+def _search_postgres(
+    queryset: QuerySet[Project], terms: list[str]
+) -> QuerySet[Project]:
+    # Terms are \w+ only, so they are safe to splice into a raw tsquery.
+    query = SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        config="simple",
+        search_type="raw",
+    )
+    return queryset.filter(search_vector=query).annotate(
+        search_rank=SearchRank(F("search_vector"), query)
+    )
+
+
+def _search_fallback(
+    queryset: QuerySet[Project], terms: list[str]
+) -> QuerySet[Project]:
+    rank = Value(0.0)
+    for term in terms:
+        queryset = queryset.filter(search_document__contains=term)
+        # search_document lists fields by weight, so an earlier hit ranks higher.
+        rank += Value(1.0) / Cast(
+            StrIndex("search_document", Value(term)), FloatField()
+        )
+    return queryset.annotate(search_rank=rank)
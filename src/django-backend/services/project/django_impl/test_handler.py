@@ -1,10 +1,23 @@
+import uuid
+from datetime import timedelta
+
 import pytest
+from django.utils import timezone
 
-from apps.projects.models import Project, ProjectStatus
-from services.project.django_impl import DjangoProjectHandler
+from apps.projects.models import Project, ProjectStatus, ProjectView
+from services.project.django_impl import DjangoProjectHandler, DjangoProjectQuery
 from services.project.exceptions import ProjectNotFoundError
-from services.project.handler_interface import CreateProjectInput, UpdateProjectInput
-from tests.factories import ProjectFactory, TagFactory, UserFactory
+from services.project.handler_interface import (
+    CreateProjectInput,
+    RecordViewInput,
+    UpdateProjectInput,
+)
+from tests.factories import (
+    ProjectFactory,
+    ProjectViewFactory,
+    TagFactory,
+    UserFactory,
+)
 
 handler = DjangoProjectHandler()
 
@@ -52,6 +65,21 @@ class TestCreate:
 
         assert tag in project.tags.all()
 
+    def test_indexes_normalized_tech_stack(self):
+        user = UserFactory()
+        data = CreateProjectInput(
+            owner_id=user.id,
+            website_url="https://example.com",
+            tech_stack=["Django", " Next.js ", "django"],
+        )
+
+        project = handler.create(data)
+
+        assert set(project.technologies.values_list("name", flat=True)) == {
+            "django",
+            "next.js",
+        }
+
 
 @pytest.mark.django_db
 class TestUpdate:
@@ -68,6 +96,20 @@ class TestUpdate:
         assert updated.title == "New Title"
         assert updated.website_url == "https://new.example.com"
 
+    def test_resyncs_tech_stack_index(self):
+        user = UserFactory()
+        project = ProjectFactory(owner=user, tech_stack=["Django", "React"])
+        data = UpdateProjectInput(
+            website_url="https://example.com", tech_stack=["React", "Go"]
+        )
+
+        handler.update(project.id, user.id, data)
+
+        assert set(project.technologies.values_list("name", flat=True)) == {
+            "react",
+            "go",
+        }
+
     def test_raises_when_not_owner(self):
         project = ProjectFactory()
         other_user = UserFactory()
@@ -109,3 +151,76 @@ class TestResubmit:
 
         assert result.status == ProjectStatus.PENDING
         assert result.rejection_reason is None
+
+
+@pytest.mark.django_db
+class TestRecordViews:
+    def test_inserts_views(self):
+        project = ProjectFactory()
+
+        handler.record_views(
+            [
+                RecordViewInput(project.id, "10.0.0.1", "Firefox"),
+                RecordViewInput(project.id, "10.0.0.2"),
+            ]
+        )
+
+        assert set(
+            ProjectView.objects.values_list("project_id", "viewer_ip", "user_agent")
+        ) == {
+            (project.id, "10.0.0.1", "Firefox"),
+            (project.id, "10.0.0.2", ""),
+        }
+
+    def test_ignores_repeat_visitors(self):
+        project = ProjectFactory()
+        ProjectViewFactory(project=project, viewer_ip="10.0.0.1")
+
+        handler.record_views([RecordViewInput(project.id, "10.0.0.1")])
+
+        assert ProjectView.objects.count() == 1
+
+    def test_feeds_visitor_sketches_including_repeat_visitors(self):
+        project = ProjectFactory()
+        ProjectViewFactory(project=project, viewer_ip="10.0.0.1")
+
+        handler.record_views(
+            [
+                RecordViewInput(project.id, "10.0.0.1"),
+                RecordViewInput(project.id, "10.0.0.2"),
+            ]
+        )
+
+        assert DjangoProjectQuery().count_unique_visitors(project.id) == 2
+
+    def test_drops_views_of_unknown_projects(self):
+        project = ProjectFactory()
+
+        handler.record_views(
+            [
+                RecordViewInput(project.id, "10.0.0.1"),
+                RecordViewInput(uuid.uuid4(), "10.0.0.1"),
+            ]
+        )
+
+        assert list(ProjectView.objects.values_list("project_id", flat=True)) == [
+            project.id
+        ]
+
+
+@pytest.mark.django_db
+class TestRefreshVisitorCounts:
+    def test_updates_monthly_visitors_and_expires_old_views(self, settings):
+        settings.PROJECT_VIEW_RETENTION_DAYS = 30
+        project = ProjectFactory()
+        handler.record_views([RecordViewInput(project.id, "10.0.0.1")])
+        old = ProjectViewFactory(project=project)
+        ProjectView.objects.filter(id=old.id).update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+
+        assert handler.refresh_visitor_counts() == 1
+
+        project.refresh_from_db()
+        assert project.monthly_visitors == 1
+        assert ProjectView.objects.filter(id=old.id).exists() is False
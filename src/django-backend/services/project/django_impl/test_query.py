@@ -4,7 +4,7 @@ import pytest
 
 from apps.projects.models import ProjectStatus
 from services.project.django_impl import DjangoProjectQuery, get_title_from_url
-from services.project.exceptions import ProjectNotFoundError
+from services.project.exceptions import InvalidCursorError, ProjectNotFoundError
 from tests.factories import ProjectFactory, UserFactory
 
 query = DjangoProjectQuery()
@@ -62,6 +62,145 @@ class TestListApproved:
         assert len(result["projects"]) == 2
         assert result["total"] == 3
         assert result["pages"] == 2
+        assert result["next_cursor"] is not None
+
+    def test_cursor_pages_cover_all_projects_in_order(self):
+        projects = [
+            ProjectFactory(status=ProjectStatus.APPROVED, monthly_visitors=v)
+            for v in (5, 3, 3, 1, 3)
+        ]
+
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            result = query.list_approved(
+                sort_by="monthly_visitors", per_page=2, cursor=cursor
+            )
+            seen.extend(result["projects"])
+            cursor = result["next_cursor"]
+
+        assert [p.monthly_visitors for p in seen] == [5, 3, 3, 3, 1]
+        assert {p.id for p in seen} == {p.id for p in projects}
+
+    def test_cursor_mode_skips_total(self):
+        ProjectFactory(status=ProjectStatus.APPROVED)
+
+        result = query.list_approved(cursor="")
+
+        assert len(result["projects"]) == 1
+        assert result["total"] is None
+        assert result["next_cursor"] is None
+
+    def test_page_mode_cursor_continues_to_next_page(self):
+        for _ in range(3):
+            ProjectFactory(status=ProjectStatus.APPROVED)
+
+        first = query.list_approved(per_page=2, page=1)
+        second = query.list_approved(per_page=2, cursor=first["next_cursor"])
+
+        assert [p.id for p in second["projects"]] == [
+            p.id for p in query.list_approved(per_page=2, page=2)["projects"]
+        ]
+
+    def test_rejects_malformed_cursor(self):
+        with pytest.raises(InvalidCursorError):
+            query.list_approved(cursor="not-a-cursor")
+
+    def test_rejects_cursor_for_other_sort_order(self):
+        for _ in range(3):
+            ProjectFactory(status=ProjectStatus.APPROVED)
+        cursor = query.list_approved(per_page=1, cursor="")["next_cursor"]
+
+        with pytest.raises(InvalidCursorError):
+            query.list_approved(sort_order="asc", cursor=cursor)
+
+
+@pytest.mark.django_db
+class TestTechStackFilter:
+    def test_matches_whole_technology_names_only(self):
+        go = ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Go"])
+        ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Django"])
+
+        result = query.list_approved(tech_stack=["go"])
+
+        assert [p.id for p in result["projects"]] == [go.id]
+
+    def test_requires_every_technology(self):
+        both = ProjectFactory(
+            status=ProjectStatus.APPROVED, tech_stack=["React", "PostgreSQL"]
+        )
+        ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["React"])
+
+        result = query.list_approved(tech_stack=["React", "postgresql"])
+
+        assert [p.id for p in result["projects"]] == [both.id]
+
+
+@pytest.mark.django_db
+class TestSearch:
+    def test_matches_icelandic_text_with_ascii_query(self):
+        project = ProjectFactory(
+            status=ProjectStatus.APPROVED, title="Ferðir í Þórsmörk"
+        )
+        ProjectFactory(status=ProjectStatus.APPROVED, title="Something else")
+
+        result = query.list_approved(search="thorsmork")
+
+        assert [p.id for p in result["projects"]] == [project.id]
+
+    def test_matches_tagline_and_long_description(self):
+        by_tagline = ProjectFactory(
+            status=ProjectStatus.APPROVED, tagline="A handy budgeting tool"
+        )
+        by_long_description = ProjectFactory(
+            status=ProjectStatus.APPROVED, long_description="Tracks your budget"
+        )
+
+        result = query.list_approved(search="budget")
+
+        assert {p.id for p in result["projects"]} == {
+            by_tagline.id,
+            by_long_description.id,
+        }
+
+    def test_requires_every_term(self):
+        both = ProjectFactory(status=ProjectStatus.APPROVED, title="Weather map")
+        ProjectFactory(status=ProjectStatus.APPROVED, title="Weather station")
+
+        result = query.list_approved(search="map weather")
+
+        assert [p.id for p in result["projects"]] == [both.id]
+
+    def test_relevance_sort_ranks_title_matches_first(self):
+        description_hit = ProjectFactory(
+            status=ProjectStatus.APPROVED,
+            title="Notes",
+            description="Keeps recipes in one place",
+        )
+        title_hit = ProjectFactory(status=ProjectStatus.APPROVED, title="Recipes")
+
+        result = query.list_approved(search="recipe", sort_by="relevance")
+
+        assert [p.id for p in result["projects"]] == [
+            title_hit.id,
+            description_hit.id,
+        ]
+
+    def test_relevance_sort_without_search_uses_newest_first(self):
+        older = ProjectFactory(status=ProjectStatus.APPROVED)
+        newer = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        result = query.list_approved(sort_by="relevance")
+
+        assert [p.id for p in result["projects"]] == [newer.id, older.id]
+
+    def test_search_document_follows_saved_changes(self):
+        project = ProjectFactory(status=ProjectStatus.APPROVED, title="Glacierwatch")
+        project.title = "Lavaflow"
+        project.save(update_fields=["title"])
+
+        assert query.list_approved(search="lavaflow")["total"] == 1
+        assert query.list_approved(search="glacierwatch")["total"] == 0
 
 
 @pytest.mark.django_db
@@ -0,0 +1,143 @@
+import pytest
+
+from services.project.django_impl.results import (
+    compute_competition_results,
+    kendall_tau,
+)
+from tests.factories import (
+    CompetitionFactory,
+    ProjectFactory,
+    ProjectRankingFactory,
+    UserFactory,
+)
+
+
+def _rank(competition, reviewer, projects, start=1):
+    competition.projects.add(*projects)
+    for position, project in enumerate(projects, start=start):
+        ProjectRankingFactory(
+            competition=competition,
+            reviewer=reviewer,
+            project=project,
+            position=position,
+        )
+
+
+def _ranking(*items):
+    return {item: rank for rank, item in enumerate(items, start=1)}
+
+
+class TestKendallTau:
+    def test_same_order_agrees_fully(self):
+        assert kendall_tau(_ranking("a", "b", "c"), _ranking("a", "b", "c")) == 1
+
+    def test_reversed_order_disagrees_fully(self):
+        assert kendall_tau(_ranking("a", "b", "c"), _ranking("c", "b", "a")) == -1
+
+    def test_one_swap_of_three(self):
+        tau = kendall_tau(_ranking("a", "b", "c"), _ranking("b", "a", "c"))
+
+        assert tau == pytest.approx(1 / 3)
+
+    def test_only_compares_shared_items(self):
+        tau = kendall_tau(_ranking("a", "x", "b"), _ranking("a", "b", "y"))
+
+        assert tau == 1
+
+    def test_needs_two_shared_items(self):
+        assert kendall_tau(_ranking("a", "b"), _ranking("a", "c")) is None
+
+
+@pytest.mark.django_db
+class TestComputeCompetitionResults:
+    def test_orders_projects_by_borda_score(self):
+        competition = CompetitionFactory()
+        first, second, third = ProjectFactory.create_batch(3)
+        _rank(competition, UserFactory(), [first, second, third])
+        _rank(competition, UserFactory(), [first, third, second])
+        _rank(competition, UserFactory(), [second, first, third])
+
+        results = compute_competition_results(competition.id)
+
+        assert [
+            (p.project_id, p.position, p.borda_score, p.ranked_by)
+            for p in results.projects
+        ] == [
+            (first.id, 1, 5, 3),
+            (second.id, 2, 3, 3),
+            (third.id, 3, 1, 3),
+        ]
+        assert results.projects[0].mean_rank == pytest.approx(4 / 3, abs=1e-4)
+
+    def test_breaks_borda_ties_by_mean_rank(self):
+        competition = CompetitionFactory()
+        broad, narrow, other = ProjectFactory.create_batch(3)
+        # Both projects score 2, but narrow only has the one top placing.
+        _rank(competition, UserFactory(), [narrow, broad, other])
+        _rank(competition, UserFactory(), [broad, other])
+
+        results = compute_competition_results(competition.id)
+
+        assert [p.project_id for p in results.projects[:2]] == [narrow.id, broad.id]
+
+    def test_closes_gaps_in_positions(self):
+        competition = CompetitionFactory()
+        projects = ProjectFactory.create_batch(2)
+        _rank(competition, UserFactory(), projects, start=3)
+
+        results = compute_competition_results(competition.id)
+
+        assert [p.mean_rank for p in results.projects] == [1, 2]
+        assert [p.borda_score for p in results.projects] == [1, 0]
+
+    def test_skips_projects_that_left_the_competition(self):
+        competition = CompetitionFactory()
+        first, removed, last = ProjectFactory.create_batch(3)
+        _rank(competition, UserFactory(), [first, removed, last])
+        competition.projects.remove(removed)
+
+        results = compute_competition_results(competition.id)
+
+        assert [(p.project_id, p.mean_rank) for p in results.projects] == [
+            (first.id, 1),
+            (last.id, 2),
+        ]
+        assert results.reviewers[0].ranked == 2
+
+    def test_reports_reviewer_agreement(self):
+        competition = CompetitionFactory()
+        projects = ProjectFactory.create_batch(3)
+        alice = UserFactory(email="alice@example.com")
+        bob = UserFactory(email="bob@example.com")
+        carol = UserFactory(email="carol@example.com")
+        _rank(competition, alice, projects)
+        _rank(competition, bob, projects)
+        _rank(competition, carol, projects[::-1])
+
+        results = compute_competition_results(competition.id)
+
+        assert [(r.email, r.ranked, r.agreement) for r in results.reviewers] == [
+            ("alice@example.com", 3, 0),
+            ("bob@example.com", 3, 0),
+            ("carol@example.com", 3, -1),
+        ]
+        assert results.agreement == pytest.approx(-1 / 3, abs=1e-4)
+
+    def test_ignores_other_competitions(self):
+        competition = CompetitionFactory()
+        _rank(CompetitionFactory(), UserFactory(), ProjectFactory.create_batch(2))
+
+        results = compute_competition_results(competition.id)
+
+        assert results.projects == []
+        assert results.reviewers == []
+        assert results.agreement is None
+
+    def test_query_count_does_not_grow_with_rankings(self, django_assert_num_queries):
+        competition = CompetitionFactory()
+        projects = ProjectFactory.create_batch(5)
+        for _ in range(4):
+            _rank(competition, UserFactory(), projects)
+
+        with django_assert_num_queries(3):
+            compute_competition_results(competition.id)
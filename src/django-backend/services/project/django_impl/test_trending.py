@@ -0,0 +1,77 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from apps.projects.models import Project, ProjectRanking
+from services.project.django_impl.trending import (
+    HALF_LIFE_DAYS,
+    RANKING_WEIGHT,
+    TRENDING_WINDOW_DAYS,
+    compute_trending_scores,
+    refresh_trending_scores,
+)
+from services.project.django_impl.visitors import add_to_sketches
+from tests.factories import ProjectFactory, ProjectRankingFactory
+
+NOW = datetime(2026, 3, 31, 12, 0, tzinfo=UTC)
+TODAY = NOW.date()
+
+
+def _visit(project, day, *ips):
+    add_to_sketches([(project.id, ip) for ip in ips], day)
+
+
+@pytest.mark.django_db
+class TestComputeTrendingScores:
+    def test_visitors_decay_with_age(self):
+        fresh = ProjectFactory()
+        older = ProjectFactory()
+        _visit(fresh, TODAY, "10.0.0.1", "10.0.0.2")
+        _visit(
+            older, TODAY - timedelta(days=int(HALF_LIFE_DAYS)), "10.0.0.1", "10.0.0.2"
+        )
+
+        scores = compute_trending_scores(NOW)
+
+        assert scores[fresh.id] == pytest.approx(2)
+        assert scores[older.id] == pytest.approx(1)
+
+    def test_ignores_activity_outside_window(self):
+        project = ProjectFactory()
+        _visit(project, TODAY - timedelta(days=TRENDING_WINDOW_DAYS), "10.0.0.1")
+
+        assert project.id not in compute_trending_scores(NOW)
+
+    def test_counts_rankings(self):
+        ranking = ProjectRankingFactory()
+        ProjectRanking.objects.filter(id=ranking.id).update(created_at=NOW)
+
+        scores = compute_trending_scores(NOW)
+
+        assert scores[ranking.project_id] == pytest.approx(RANKING_WEIGHT)
+
+
+@pytest.mark.django_db
+class TestRefreshTrendingScores:
+    def test_writes_changed_scores_only(self):
+        project = ProjectFactory()
+        _visit(project, TODAY, "10.0.0.1")
+
+        assert refresh_trending_scores(NOW) == 1
+        assert refresh_trending_scores(NOW) == 0
+        assert Project.objects.get(id=project.id).trending_score == 1
+
+    def test_resets_projects_without_recent_activity(self):
+        project = ProjectFactory()
+        Project.objects.filter(id=project.id).update(trending_score=7.5)
+
+        assert refresh_trending_scores(NOW) == 1
+        assert Project.objects.get(id=project.id).trending_score == 0
+
+    def test_does_not_touch_updated_at(self):
+        project = ProjectFactory()
+        _visit(project, TODAY, "10.0.0.1")
+
+        refresh_trending_scores(NOW)
+
+        assert Project.objects.get(id=project.id).updated_at == project.updated_at
@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.projects.hll import HyperLogLog
+from apps.projects.models import Project, ProjectView, ProjectVisitorSketch
+from services.project.django_impl.visitors import (
+    MONTHLY_WINDOW_DAYS,
+    add_to_sketches,
+    count_unique_visitors,
+    expire_views,
+    refresh_monthly_visitors,
+)
+from tests.factories import ProjectFactory, ProjectViewFactory
+
+TODAY = date(2026, 3, 31)
+
+
+def _visits(project, *ips):
+    return [(project.id, ip) for ip in ips]
+
+
+@pytest.mark.django_db
+class TestAddToSketches:
+    def test_keeps_one_sketch_per_project_and_day(self):
+        project = ProjectFactory()
+
+        add_to_sketches(_visits(project, "10.0.0.1", "10.0.0.2"), TODAY)
+        add_to_sketches(_visits(project, "10.0.0.2", "10.0.0.3"), TODAY)
+
+        sketch = ProjectVisitorSketch.objects.get(project=project)
+        assert sketch.day == TODAY
+        assert HyperLogLog.from_bytes(sketch.registers).count() == 3
+
+
+@pytest.mark.django_db
+class TestCountUniqueVisitors:
+    def test_merges_days_in_range(self):
+        project = ProjectFactory()
+        add_to_sketches(_visits(project, "10.0.0.1"), TODAY - timedelta(days=10))
+        add_to_sketches(
+            _visits(project, "10.0.0.1", "10.0.0.2"), TODAY - timedelta(days=3)
+        )
+        add_to_sketches(_visits(project, "10.0.0.3"), TODAY)
+
+        assert count_unique_visitors(project.id) == 3
+        assert count_unique_visitors(project.id, start=TODAY - timedelta(days=6)) == 3
+        assert (
+            count_unique_visitors(
+                project.id,
+                start=TODAY - timedelta(days=6),
+                end=TODAY - timedelta(days=1),
+            )
+            == 2
+        )
+
+    def test_project_without_sketches_has_no_visitors(self):
+        assert count_unique_visitors(ProjectFactory().id) == 0
+
+
+@pytest.mark.django_db
+class TestRefreshMonthlyVisitors:
+    def test_counts_distinct_visitors_in_window(self):
+        project = ProjectFactory()
+        add_to_sketches(_visits(project, "10.0.0.1", "10.0.0.2"), TODAY)
+        add_to_sketches(_visits(project, "10.0.0.2"), TODAY - timedelta(days=5))
+        add_to_sketches(
+            _visits(project, "10.0.0.9"), TODAY - timedelta(days=MONTHLY_WINDOW_DAYS)
+        )
+
+        changed = refresh_monthly_visitors(TODAY)
+
+        project.refresh_from_db()
+        assert changed == 1
+        assert project.monthly_visitors == 2
+
+    def test_decays_when_visits_leave_the_window(self):
+        project = ProjectFactory(monthly_visitors=1)
+        add_to_sketches(
+            _visits(project, "10.0.0.1"), TODAY - timedelta(days=MONTHLY_WINDOW_DAYS)
+        )
+
+        refresh_monthly_visitors(TODAY)
+
+        project.refresh_from_db()
+        assert project.monthly_visitors == 0
+
+    def test_resets_counts_without_any_sketches(self):
+        project = ProjectFactory(monthly_visitors=12_000)
+
+        assert refresh_monthly_visitors(TODAY) == 1
+
+        project.refresh_from_db()
+        assert project.monthly_visitors == 0
+
+    def test_leaves_updated_at_alone(self):
+        project = ProjectFactory()
+        add_to_sketches(_visits(project, "10.0.0.1"), TODAY)
+        updated_at = Project.objects.get(id=project.id).updated_at
+
+        refresh_monthly_visitors(TODAY)
+
+        assert Project.objects.get(id=project.id).updated_at == updated_at
+
+    def test_unchanged_counts_are_not_reported(self):
+        project = ProjectFactory()
+        add_to_sketches(_visits(project, "10.0.0.1"), TODAY)
+        refresh_monthly_visitors(TODAY)
+
+        assert refresh_monthly_visitors(TODAY) == 0
+
+
+@pytest.mark.django_db
+class TestExpireViews:
+    def test_deletes_views_older_than_cutoff(self):
+        old = ProjectViewFactory()
+        recent = ProjectViewFactory()
+        ProjectView.objects.filter(id=old.id).update(
+            created_at=timezone.now() - timedelta(days=40)
+        )
+
+        deleted = expire_views(timezone.now() - timedelta(days=30))
+
+        assert deleted == 1
+        assert list(ProjectView.objects.values_list("id", flat=True)) == [recent.id]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import timedelta
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+from apps.projects.hll import HyperLogLog
+from apps.projects.models import Project, ProjectRanking, ProjectVisitorSketch
+
+if TYPE_CHECKING:
+    from datetime import date, datetime
+    from uuid import UUID
+
+# Activity older than this no longer counts towards trending at all.
+TRENDING_WINDOW_DAYS = 14
+# Activity loses half its weight every this many days.
+HALF_LIFE_DAYS = 3.0
+# A reviewer placing a project in a ranking counts like this many visitors.
+RANKING_WEIGHT = 5.0
+# Rounding keeps float noise from rewriting every row on each refresh.
+_SCORE_PRECISION = 4
+_UPDATE_BATCH_SIZE = 1000
+
+
+def _decay(today: date, day: date) -> float:
+    return 0.5 ** ((today - day).days / HALF_LIFE_DAYS)
+
+
+def compute_trending_scores(now: datetime) -> dict[UUID, float]:
+    """Decayed daily unique visitors plus decayed reviewer ranking activity."""
+    today = now.date()
+    start = today - timedelta(days=TRENDING_WINDOW_DAYS - 1)
+    scores: dict[UUID, float] = defaultdict(float)
+
+    sketches = ProjectVisitorSketch.objects.filter(
+        day__gte=start, day__lte=today
+    ).values_list("project_id", "day", "registers")
+    for project_id, day, registers in sketches.iterator():
+        visitors = HyperLogLog.from_bytes(registers).count()
+        scores[project_id] += visitors * _decay(today, day)
+
+    rankings = (
+        ProjectRanking.objects.filter(created_at__date__gte=start)
+        .annotate(day=TruncDate("created_at"))
+        .values_list("project_id", "day")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    for project_id, day, count in rankings:
+        scores[project_id] += RANKING_WEIGHT * count * _decay(today, day)
+
+    return scores
+
+
+def refresh_trending_scores(now: datetime) -> int:
+    """Materialize trending_score for every project; returns projects changed."""
+    scores = {
+        project_id: round(score, _SCORE_PRECISION)
+        for project_id, score in compute_trending_scores(now).items()
+    }
+    # Projects that scored before but have no activity left drop to zero.
+    scored = Project.objects.filter(trending_score__gt=0).values_list("id", flat=True)
+    for project_id in scored.iterator():
+        scores.setdefault(project_id, 0.0)
+
+    changed: list[Project] = []
+    for project_ids in batched(scores, _UPDATE_BATCH_SIZE):
+        changed.extend(
+            Project(id=project_id, trending_score=scores[project_id])
+            for project_id, current in Project.objects.filter(
+                id__in=project_ids
+            ).values_list("id", "trending_score")
+            if current != scores[project_id]
+        )
+    # Bookkeeping, not an edit: bulk_update leaves updated_at and signals alone.
+    Project.objects.bulk_update(
+        changed, ["trending_score"], batch_size=_UPDATE_BATCH_SIZE
+    )
+    return len(changed)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import timedelta
+from itertools import batched, groupby
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from apps.projects.hll import HyperLogLog
+from apps.projects.models import Project, ProjectView, ProjectVisitorSketch
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import date, datetime
+    from uuid import UUID
+
+# monthly_visitors counts distinct visitors over this many days, today included.
+MONTHLY_WINDOW_DAYS = 30
+# Days that recently left the window. Projects with sketches on them are
+# recounted so their monthly_visitors decays even without new visits, as
+# long as the refresh runs at least once in this many days.
+_DECAY_LOOKBACK_DAYS = 7
+_UPDATE_BATCH_SIZE = 1000
+
+
+def add_to_sketches(visits: Iterable[tuple[UUID, str]], day: date) -> None:
+    """Add (project_id, viewer_ip) visits to the projects' sketches for day."""
+    by_project: dict[UUID, list[str]] = defaultdict(list)
+    for project_id, viewer_ip in visits:
+        by_project[project_id].append(viewer_ip)
+    if not by_project:
+        return
+    with transaction.atomic():
+        # Create missing rows first so concurrent writers both end up
+        # locking, and merging into, the same row.
+        ProjectVisitorSketch.objects.bulk_create(
+            [
+                ProjectVisitorSketch(
+                    project_id=project_id,
+                    day=day,
+                    registers=HyperLogLog().to_bytes(),
+                )
+                for project_id in by_project
+            ],
+            ignore_conflicts=True,
+        )
+        rows = list(
+            ProjectVisitorSketch.objects.select_for_update().filter(
+                day=day, project_id__in=by_project
+            )
+        )
+        for row in rows:
+            sketch = HyperLogLog.from_bytes(row.registers)
+            for viewer_ip in by_project[row.project_id]:
+                sketch.add(viewer_ip)
+            row.registers = sketch.to_bytes()
+        ProjectVisitorSketch.objects.bulk_update(rows, ["registers"])
+
+
+def count_unique_visitors(
+    project_id: UUID, start: date | None = None, end: date | None = None
+) -> int:
+    """Distinct visitors between start and end (inclusive, open if None)."""
+    sketches = ProjectVisitorSketch.objects.filter(project_id=project_id)
+    if start is not None:
+        sketches = sketches.filter(day__gte=start)
+    if end is not None:
+        sketches = sketches.filter(day__lte=end)
+    return HyperLogLog.union(sketches.values_list("registers", flat=True)).count()
+
+
+def refresh_monthly_visitors(today: date) -> int:
+    """Recompute monthly_visitors from the sketches; returns projects changed."""
+    window_start = today - timedelta(days=MONTHLY_WINDOW_DAYS - 1)
+    lookback_start = window_start - timedelta(days=_DECAY_LOOKBACK_DAYS)
+    touched = (
+        ProjectVisitorSketch.objects.filter(day__gte=lookback_start, day__lte=today)
+        .values_list("project_id", flat=True)
+        .distinct()
+    )
+    in_window = ProjectVisitorSketch.objects.filter(
+        day__gte=window_start, day__lte=today
+    ).order_by("project_id")
+
+    changed: list[Project] = []
+    for project_ids in batched(touched.iterator(), _UPDATE_BATCH_SIZE):
+        counts = dict.fromkeys(project_ids, 0)
+        rows = in_window.filter(project_id__in=project_ids).values_list(
+            "project_id", "registers"
+        )
+        for project_id, group in groupby(rows.iterator(), key=lambda row: row[0]):
+            counts[project_id] = HyperLogLog.union(
+                registers for _, registers in group
+            ).count()
+        changed.extend(
+            Project(id=project_id, monthly_visitors=counts[project_id])
+            for project_id, current in Project.objects.filter(
+                id__in=project_ids
+            ).values_list("id", "monthly_visitors")
+            if current != counts[project_id]
+        )
+    # Bookkeeping, not an edit: bulk_update leaves updated_at and signals alone.
+    Project.objects.bulk_update(
+        changed, ["monthly_visitors"], batch_size=_UPDATE_BATCH_SIZE
+    )
+    # Projects with a count but no sketches in the window at all, e.g. ones
+    # entered by hand before visitors were tracked (the field is read-only in
+    # the admin now).
+    stale = (
+        Project.objects.filter(monthly_visitors__gt=0)
+        .exclude(
+            Exists(
+                ProjectVisitorSketch.objects.filter(
+                    project=OuterRef("pk"), day__gte=window_start
+                )
+            )
+        )
+        .update(monthly_visitors=0)
+    )
+    return len(changed) + stale
+
+
+def expire_views(before: datetime) -> int:
+    """Delete raw view rows older than before; the sketches keep the counts."""
+    deleted, _ = ProjectView.objects.filter(created_at__lt=before).delete()
+    return deleted
@@ -12,3 +12,7 @@ class InvalidCompetitionError(Exception):
 
 class InvalidTagsError(Exception):
     pass
+
+
+class InvalidCursorError(Exception):
+    pass
@@ -33,6 +33,13 @@ class UpdateProjectInput:
     tag_ids: list[UUID] = field(default_factory=list)
 
 
+@dataclass
+class RecordViewInput:
+    project_id: UUID
+    viewer_ip: str
+    user_agent: str = ""
+
+
 class ProjectHandlerInterface(ABC):
     @abstractmethod
     def create(self, data: CreateProjectInput) -> Project: ...
@@ -47,3 +54,12 @@ class ProjectHandlerInterface(ABC):
 
     @abstractmethod
     def resubmit(self, project_id: UUID, owner_id: UUID) -> Project: ...
+
+    @abstractmethod
+    def record_views(self, views: list[RecordViewInput]) -> None: ...
+
+    @abstractmethod
+    def refresh_visitor_counts(self) -> int: ...
+
+    @abstractmethod
+    def refresh_trending_scores(self) -> int: ...
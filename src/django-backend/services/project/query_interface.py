@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
 from typing import Any
 from uuid import UUID
 
@@ -7,6 +9,32 @@ from django.db.models import QuerySet
 from apps.projects.models import Project
 
 
+@dataclass
+class ProjectResult:
+    project_id: UUID
+    title: str
+    position: int
+    borda_score: int
+    mean_rank: float
+    ranked_by: int
+
+
+@dataclass
+class ReviewerAgreement:
+    reviewer_id: UUID
+    email: str
+    ranked: int
+    # Mean Kendall tau with every other reviewer sharing two or more projects.
+    agreement: float | None
+
+
+@dataclass
+class CompetitionResults:
+    projects: list[ProjectResult]
+    reviewers: list[ReviewerAgreement]
+    agreement: float | None
+
+
 class ProjectQueryInterface(ABC):
     @abstractmethod
     def get_by_id(self, project_id: UUID) -> Project: ...
@@ -25,6 +53,7 @@ class ProjectQueryInterface(ABC):
         sort_order: str = "desc",
         page: int = 1,
         per_page: int = 20,
+        cursor: str | None = None,
     ) -> dict[str, Any]: ...
 
     @abstractmethod
@@ -41,3 +70,11 @@ class ProjectQueryInterface(ABC):
 
     @abstractmethod
     def get_project_with_owner(self, project_id: UUID) -> dict[str, Any]: ...
+
+    @abstractmethod
+    def count_unique_visitors(
+        self, project_id: UUID, start: date | None = None, end: date | None = None
+    ) -> int: ...
+
+    @abstractmethod
+    def get_competition_results(self, competition_id: UUID) -> CompetitionResults: ...
@@ -31,6 +31,14 @@ class DjangoUserQuery(UserQueryInterface):
             return None
         return user if user.is_active else None
 
+    def get_active_with_groups(self, user_id: UUID) -> User | None:
+        user_model = get_user_model()
+        return (
+            user_model.objects.filter(id=user_id, is_active=True)
+            .prefetch_related("groups")
+            .first()
+        )
+
     def email_exists(self, email: str) -> bool:
         return get_user_model().objects.filter(email=email).exists()
 
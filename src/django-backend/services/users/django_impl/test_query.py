@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 import pytest
+from django.contrib.auth.models import Group
 
 from services.users.django_impl import DjangoUserQuery
 from services.users.exceptions import UserNotFoundError
@@ -47,6 +48,24 @@ class TestGetActiveById:
         assert result is None
 
 
+@pytest.mark.django_db
+class TestGetActiveWithGroups:
+    def test_prefetches_groups(self, django_assert_num_queries):
+        user = UserFactory()
+        user.groups.add(Group.objects.create(name="reviewers"))
+
+        with django_assert_num_queries(2):
+            result = query.get_active_with_groups(user.id)
+            names = [group.name for group in result.groups.all()]
+
+        assert names == ["reviewers"]
+
+    def test_returns_none_for_inactive_user(self):
+        user = UserFactory(is_active=False)
+
+        assert query.get_active_with_groups(user.id) is None
+
+
 @pytest.mark.django_db
 class TestEmailExists:
     def test_true_when_email_registered(self):
@@ -18,6 +18,9 @@ class UserQueryInterface(ABC):
     @abstractmethod
     def get_active_by_id(self, user_id: UUID) -> User | None: ...
 
+    @abstractmethod
+    def get_active_with_groups(self, user_id: UUID) -> User | None: ...
+
     @abstractmethod
     def email_exists(self, email: str) -> bool: ...
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import http.client
 import json
 import logging
-import urllib.request
+import threading
+from urllib.parse import urlsplit
 
 from django.conf import settings
 
@@ -10,29 +12,76 @@ from services.web_ui.handler_interface import WebUIHandlerInterface
 
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = 5
+
 
 class DjangoWebUIHandler(WebUIHandlerInterface):
+    def __init__(self) -> None:
+        # One kept-alive connection to the frontend per process.
+        self._lock = threading.Lock()
+        self._connection: http.client.HTTPConnection | None = None
+        self._origin: tuple[str, str] | None = None
+
     def revalidate_paths(self, paths: list[str]) -> None:
         secret = settings.REVALIDATION_SECRET
         if not secret:
             logger.debug("REVALIDATION_SECRET not set, skipping revalidation")
             return
+        if not paths:
+            return
 
-        url = f"{settings.FRONTEND_URL}/api/revalidate"
         payload = json.dumps({"secret": secret, "paths": paths}).encode()
-        req = urllib.request.Request(  # noqa: S310
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-
         try:
-            with urllib.request.urlopen(req, timeout=5) as resp:  # noqa: S310
-                logger.info(
-                    "Revalidation request sent for %s (status %s)",
-                    paths,
-                    resp.status,
-                )
+            with self._lock:
+                status = self._post("/api/revalidate", payload)
+            logger.info(
+                "Revalidation request sent for %s (status %s)",
+                paths,
+                status,
+            )
         except Exception:
             logger.exception("Failed to send revalidation request for %s", paths)
+
+    def _post(self, path: str, body: bytes) -> int:
+        url = urlsplit(settings.FRONTEND_URL)
+        for attempt in range(2):
+            connection = self._get_connection(url.scheme, url.netloc)
+            try:
+                connection.request(
+                    "POST",
+                    f"{url.path.rstrip('/')}{path}",
+                    body=body,
+                    headers={"Content-Type": "application/json"},
+                )
+                response = connection.getresponse()
+                # Drain the body so the connection can be reused.
+                response.read()
+            except (http.client.HTTPException, OSError):
+                # The server may have closed the idle connection; reconnect
+                # once. Revalidating a path twice is harmless.
+                self._close()
+                if attempt:
+                    raise
+            else:
+                if response.will_close:
+                    self._close()
+                return response.status
+        return 0
+
+    def _get_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if self._connection is None or self._origin != (scheme, netloc):
+            self._close()
+            connection_class = (
+                http.client.HTTPSConnection
+                if scheme == "https"
+                else http.client.HTTPConnection
+            )
+            self._connection = connection_class(netloc, timeout=REQUEST_TIMEOUT)
+            self._origin = (scheme, netloc)
+        return self._connection
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+        self._origin = None
@@ -1,64 +1,98 @@
 import json
-from unittest.mock import patch
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
 from services.web_ui.django_impl import DjangoWebUIHandler
 
-handler = DjangoWebUIHandler()
 
-URLOPEN = "services.web_ui.django_impl.handler.urllib.request.urlopen"
+class _FrontendStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self.server.requests.append(
+            (
+                self.path,
+                self.headers["Content-Type"],
+                json.loads(self.rfile.read(length)),
+            )
+        )
+        body = b'{"revalidated": true}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def frontend(settings):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FrontendStub)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings.FRONTEND_URL = f"http://127.0.0.1:{server.server_port}"
+    settings.REVALIDATION_SECRET = "s3cret"  # noqa: S105
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def handler():
+    handler = DjangoWebUIHandler()
+    yield handler
+    handler._close()  # noqa: SLF001
 
 
 class TestRevalidatePaths:
-    def test_sends_post_with_secret_and_paths(self, settings):
-        settings.FRONTEND_URL = "https://example.com"
-        settings.REVALIDATION_SECRET = "test-secret"  # noqa: S105
-
-        with patch(URLOPEN) as mock:
-            mock.return_value.__enter__ = lambda s: s
-            mock.return_value.__exit__ = lambda s, *a: None
-            mock.return_value.status = 200
-
-            handler.revalidate_paths(["/", "/projects"])
-
-            mock.assert_called_once()
-            req = mock.call_args[0][0]
-            assert req.full_url == "https://example.com/api/revalidate"
-            assert req.method == "POST"
-            assert req.get_header("Content-type") == "application/json"
-
-    def test_does_not_raise_on_http_error(self, settings):
-        settings.FRONTEND_URL = "https://example.com"
-        settings.REVALIDATION_SECRET = "test-secret"  # noqa: S105
-
-        with patch(
-            URLOPEN,
-            side_effect=Exception("connection refused"),
-        ):
-            handler.revalidate_paths(["/"])
-
-    def test_skips_call_when_secret_is_empty(self, settings):
-        settings.REVALIDATION_SECRET = ""
+    def test_sends_post_with_secret_and_paths(self, frontend, handler):
+        handler.revalidate_paths(["/", "/projects"])
+
+        assert frontend.requests == [
+            (
+                "/api/revalidate",
+                "application/json",
+                {"secret": "s3cret", "paths": ["/", "/projects"]},
+            )
+        ]
+
+    def test_reuses_the_connection(self, frontend, handler):
+        handler.revalidate_paths(["/"])
+        handler.revalidate_paths(["/projects"])
+
+        assert len(frontend.requests) == 2
+        assert frontend.connections == 1
 
-        with patch(URLOPEN) as mock:
-            handler.revalidate_paths(["/"])
+    def test_reconnects_when_the_connection_was_dropped(self, frontend, handler):
+        handler.revalidate_paths(["/"])
+        handler._connection.sock.close()  # noqa: SLF001
 
-            mock.assert_not_called()
+        handler.revalidate_paths(["/projects"])
 
-    @pytest.mark.parametrize("paths", [["/projects/abc"], ["/", "/projects"]])
-    def test_request_body_contains_paths(self, settings, paths):
-        settings.FRONTEND_URL = "https://example.com"
+        assert [body["paths"] for _, _, body in frontend.requests] == [
+            ["/"],
+            ["/projects"],
+        ]
+
+    def test_does_not_raise_when_frontend_is_down(self, settings, handler):
+        settings.FRONTEND_URL = "http://127.0.0.1:9"
         settings.REVALIDATION_SECRET = "s3cret"  # noqa: S105
 
-        with patch(URLOPEN) as mock:
-            mock.return_value.__enter__ = lambda s: s
-            mock.return_value.__exit__ = lambda s, *a: None
-            mock.return_value.status = 200
+        handler.revalidate_paths(["/"])
+
+    def test_skips_call_when_secret_is_empty(self, frontend, handler, settings):
+        settings.REVALIDATION_SECRET = ""
 
-            handler.revalidate_paths(paths)
+        handler.revalidate_paths(["/"])
 
-            req = mock.call_args[0][0]
-            body = json.loads(req.data)
-            assert body["secret"] == "s3cret"  # noqa: S105
-            assert body["paths"] == paths
+        assert frontend.requests == []
@@ -12,6 +12,7 @@ from apps.projects.models import (
     ProjectImage,
     ProjectRanking,
     ProjectStatus,
+    ProjectView,
 )
 from apps.tags.models import Tag, TagCategory, TagStatus
 from apps.users.models import EmailVerificationCode, PasswordResetCode
@@ -79,6 +80,12 @@ class ProjectFactory(factory.django.DjangoModelFactory):
             return
         self.tags.add(*extracted)
 
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        project = super()._create(model_class, *args, **kwargs)
+        project.sync_technologies()
+        return project
+
 
 class ProjectImageFactory(factory.django.DjangoModelFactory):
     class Meta:
@@ -91,6 +98,21 @@ class ProjectImageFactory(factory.django.DjangoModelFactory):
     file_size = 1024
     upload_status = "uploaded"
 
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        image = super()._create(model_class, *args, **kwargs)
+        image.project.refresh_main_image()
+        return image
+
+
+class ProjectViewFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ProjectView
+
+    project = factory.SubFactory(ProjectFactory)
+    viewer_ip = factory.Sequence(lambda n: f"10.0.{n // 256 % 256}.{n % 256}")
+    user_agent = "Mozilla/5.0"
+
 
 class CompetitionFactory(factory.django.DjangoModelFactory):
     class Meta:
@@ -0,0 +1,83 @@
+"""A minimal local SMTP server for exercising the real SMTP email backend."""
+
+from __future__ import annotations
+
+import socketserver
+import threading
+from dataclasses import dataclass, field
+from email import message_from_bytes
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from email.message import Message
+
+
+@dataclass
+class SMTPLog:
+    connections: int = 0
+    messages: list[Message] = field(default_factory=list)
+    # Reply codes to answer the next MAIL FROM commands with, e.g. [451].
+    mail_failures: list[int] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    server: LocalSMTPServer
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        log = self.server.log
+        with log.lock:
+            log.connections += 1
+        self.reply("220 localhost ready")
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250 localhost")
+            elif command.startswith("MAIL"):
+                with log.lock:
+                    failure = log.mail_failures.pop(0) if log.mail_failures else None
+                self.reply(f"{failure} try again" if failure else "250 OK")
+            elif command.startswith(("RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 end with <CRLF>.<CRLF>")
+                self.receive_message()
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+    def receive_message(self) -> None:
+        lines = []
+        while (line := self.rfile.readline()) != b".\r\n":
+            lines.append(line.removeprefix(b"."))
+        with self.server.log.lock:
+            self.server.log.messages.append(message_from_bytes(b"".join(lines)))
+        self.reply("250 queued")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """Accepts mail on localhost and records it; use as a context manager."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.log = SMTPLog()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self) -> Self:
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
+        self.server_close()
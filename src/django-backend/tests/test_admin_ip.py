@@ -0,0 +1,21 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db
+class TestAdminIPMiddleware:
+    def test_allows_first_forwarded_ip(self, client):
+        response = client.get("/admin/", HTTP_X_FORWARDED_FOR="127.0.0.1, 10.0.0.1")
+
+        assert response.status_code == HTTPStatus.FOUND
+
+    def test_rejects_other_first_forwarded_ip(self, client):
+        response = client.get("/admin/", HTTP_X_FORWARDED_FOR="10.0.0.1, 127.0.0.1")
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_falls_back_to_remote_addr(self, client):
+        response = client.get("/admin/", REMOTE_ADDR="10.0.0.1")
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -6,7 +6,11 @@ from django.urls import reverse
 from django.utils import timezone
 
 from apps.emails.admin import BroadcastEmailAdmin, BroadcastEmailImageInline
-from apps.emails.models import BroadcastEmail, BroadcastEmailImage
+from apps.emails.models import (
+    BroadcastEmail,
+    BroadcastEmailImage,
+    BroadcastEmailRecipient,
+)
 
 from .factories import BroadcastEmailFactory, BroadcastEmailImageFactory, UserFactory
 
@@ -139,6 +143,45 @@ class TestBroadcastEmailAdminViews:
         broadcast_emails = [m for m in mailoutbox if broadcast.subject in m.subject]
         assert len(broadcast_emails) >= 1
 
+    def test_send_view_post_resumes_interrupted_send(self, admin_client, mailoutbox):
+        delivered = UserFactory(email_opt_in_platform_updates=True)
+        pending = UserFactory(email_opt_in_platform_updates=True)
+        broadcast = BroadcastEmailFactory(
+            email_type="platform_updates",
+            send_requested_at=timezone.now(),
+            recipient_total=2,
+        )
+        BroadcastEmailRecipient.objects.create(
+            broadcast_email=broadcast, user=delivered
+        )
+
+        url = reverse("admin:emails_broadcastemail_send", args=[broadcast.pk])
+        admin_client.post(url)
+
+        broadcast.refresh_from_db()
+        assert broadcast.sent_at is not None
+        sent_to = [m.to[0] for m in mailoutbox if broadcast.subject in m.subject]
+        assert pending.email in sent_to
+        assert delivered.email not in sent_to
+
+    def test_progress_view_reports_deliveries(self, admin_client):
+        broadcast = BroadcastEmailFactory(
+            send_requested_at=timezone.now(), recipient_total=4
+        )
+        BroadcastEmailRecipient.objects.create(
+            broadcast_email=broadcast, user=UserFactory()
+        )
+
+        url = reverse("admin:emails_broadcastemail_progress", args=[broadcast.pk])
+        response = admin_client.get(url)
+
+        assert response.json() == {
+            "total": 4,
+            "delivered": 1,
+            "failed": 0,
+            "done": False,
+        }
+
     def test_send_view_rejects_already_sent(self, admin_client):
         broadcast = BroadcastEmailFactory(email_type="platform_updates")
         broadcast.sent_at = timezone.now()
@@ -0,0 +1,47 @@
+import pytest
+
+from apps.projects.hll import REGISTER_COUNT, HyperLogLog
+
+
+def _sketch(values) -> HyperLogLog:
+    sketch = HyperLogLog()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+class TestHyperLogLog:
+    def test_empty_sketch_counts_zero(self):
+        assert HyperLogLog().count() == 0
+
+    def test_small_counts_are_exact(self):
+        assert _sketch(f"10.0.0.{i}" for i in range(50)).count() == 50
+
+    def test_duplicates_are_counted_once(self):
+        assert _sketch(["10.0.0.1"] * 100).count() == 1
+
+    @pytest.mark.parametrize("n", [1_000, 50_000])
+    def test_large_counts_are_within_error(self, n):
+        estimate = _sketch(str(i) for i in range(n)).count()
+
+        assert abs(estimate - n) / n < 0.05
+
+    def test_merge_counts_the_union(self):
+        sketch = _sketch(str(i) for i in range(3_000))
+        sketch.merge(_sketch(str(i) for i in range(2_000, 6_000)))
+
+        assert sketch.registers == _sketch(str(i) for i in range(6_000)).registers
+
+    def test_round_trips_through_bytes(self):
+        sketch = _sketch(str(i) for i in range(500))
+
+        assert HyperLogLog.from_bytes(sketch.to_bytes()).registers == sketch.registers
+
+    def test_union_of_serialized_sketches(self):
+        days = [_sketch(["a", "b"]).to_bytes(), _sketch(["b", "c"]).to_bytes()]
+
+        assert HyperLogLog.union(days).count() == 3
+
+    def test_rejects_wrong_register_count(self):
+        with pytest.raises(ValueError, match=str(REGISTER_COUNT)):
+            HyperLogLog(bytes(10))
@@ -28,15 +28,40 @@ class TestApproveProjectsAdminAction:
     def test_sends_email_for_each_approved_project(self):
         projects = ProjectFactory.create_batch(2)
 
-        with patch.object(HANDLERS.email, "send_project_approved_email") as mock_send:
+        with patch.object(
+            HANDLERS.email, "send_project_approved_emails", return_value=(2, 0)
+        ) as mock_send:
+            self._call_action(projects)
+
+        mock_send.assert_called_once()
+        [sent] = mock_send.call_args.args
+        assert {project.id for project in sent} == {project.id for project in projects}
+
+    def test_sends_emails_in_batches(self, settings):
+        settings.EMAIL_BATCH_SIZE = 2
+        projects = ProjectFactory.create_batch(3)
+
+        with patch.object(
+            HANDLERS.email, "send_project_approved_emails", return_value=(0, 0)
+        ) as mock_send:
+            self._call_action(projects)
+
+        assert [len(call.args[0]) for call in mock_send.call_args_list] == [2, 1]
+
+    def test_enqueues_one_task_per_batch(self, settings):
+        settings.EMAIL_BATCH_SIZE = 2
+        projects = ProjectFactory.create_batch(5)
+
+        with patch("apps.projects.admin.email_tasks") as email_tasks:
             self._call_action(projects)
 
-        assert mock_send.call_count == 2
+        enqueue = email_tasks.send_project_approved_emails.enqueue
+        assert [len(call.args[0]) for call in enqueue.call_args_list] == [2, 2, 1]
 
     def test_does_not_send_email_for_non_pending_projects(self):
         approved_project = ProjectFactory(status=ProjectStatus.APPROVED)
 
-        with patch.object(HANDLERS.email, "send_project_approved_email") as mock_send:
+        with patch.object(HANDLERS.email, "send_project_approved_emails") as mock_send:
             self._call_action([approved_project])
 
         mock_send.assert_not_called()
@@ -46,7 +71,7 @@ class TestApproveProjectsAdminAction:
 
         with patch.object(
             HANDLERS.email,
-            "send_project_approved_email",
+            "send_project_approved_emails",
             side_effect=Exception("SMTP error"),
         ):
             self._call_action(projects)
@@ -0,0 +1,136 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import models, transaction
+from django.db.models import QuerySet
+
+from apps.projects.models import Project, ProjectStatus
+from tests.factories import ProjectFactory, ProjectImageFactory, TagFactory
+
+
+@pytest.fixture
+def revalidated():
+    with patch("apps.projects.signals.revalidate_project") as mock:
+        yield mock
+
+
+def revalidated_ids(mock):
+    return [call.args[0] for call in mock.call_args_list]
+
+
+@pytest.mark.django_db
+class TestChangedPublicFields:
+    def test_loaded_project_has_no_changes(self):
+        project = Project.objects.get(pk=ProjectFactory().pk)
+
+        assert project.changed_public_fields() == set()
+
+    def test_tracks_assigned_fields(self):
+        project = Project.objects.get(pk=ProjectFactory().pk)
+        project.title = "Renamed"
+        project.rejection_reason = "Not public"
+
+        assert project.changed_public_fields() == {"title"}
+
+    def test_tracks_in_place_tech_stack_changes(self):
+        project = Project.objects.get(pk=ProjectFactory(tech_stack=["Django"]).pk)
+        project.tech_stack.append("React")
+
+        assert project.changed_public_fields() == {"tech_stack"}
+
+    def test_save_resets_tracking(self):
+        project = ProjectFactory()
+        project.title = "Renamed"
+        project.save()
+
+        assert project.saved_public_changes == {"title"}
+        assert project.changed_public_fields() == set()
+
+    @pytest.mark.skipif(
+        not hasattr(QuerySet, "fetch_mode"), reason="Django without fetch modes"
+    )
+    def test_loading_keeps_the_queryset_fetch_mode(self):
+        ProjectFactory()
+
+        project = Project.objects.fetch_mode(models.FETCH_PEERS).get()
+
+        assert project._state.fetch_mode is models.FETCH_PEERS  # noqa: SLF001
+        assert project.changed_public_fields() == set()
+
+    def test_update_fields_limits_saved_changes(self):
+        project = ProjectFactory()
+        project.title = "Renamed"
+        project.tagline = "Not saved"
+        project.save(update_fields=["title"])
+
+        assert project.saved_public_changes == {"title"}
+
+
+@pytest.mark.django_db
+class TestProjectSignals:
+    def test_public_change_revalidates_on_commit(
+        self, revalidated, django_capture_on_commit_callbacks
+    ):
+        project = ProjectFactory()
+        project.status = ProjectStatus.APPROVED
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            project.save()
+            revalidated.assert_not_called()
+
+        assert len(callbacks) == 1
+        callbacks[0]()
+        assert revalidated_ids(revalidated) == [project.id]
+
+    def test_private_change_schedules_nothing(
+        self, revalidated, django_capture_on_commit_callbacks
+    ):
+        project = ProjectFactory()
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            project.rejection_reason = "Needs a description"
+            project.save()
+            project.save()
+
+        assert callbacks == []
+        revalidated.assert_not_called()
+
+    def test_rolled_back_change_schedules_nothing(
+        self, revalidated, django_capture_on_commit_callbacks
+    ):
+        project = ProjectFactory()
+
+        with (
+            django_capture_on_commit_callbacks(execute=True) as callbacks,
+            transaction.atomic(),
+        ):
+            project.title = "Renamed"
+            project.save()
+            transaction.set_rollback(True)
+
+        assert callbacks == []
+        revalidated.assert_not_called()
+
+    def test_image_and_tag_changes_revalidate_the_project(
+        self, revalidated, django_capture_on_commit_callbacks
+    ):
+        project = ProjectFactory()
+        tag = TagFactory()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProjectImageFactory(project=project)
+            project.tags.add(tag)
+            tag.projects.remove(project)
+
+        assert set(revalidated_ids(revalidated)) == {project.id}
+
+    def test_delete_revalidates_the_project(
+        self, revalidated, django_capture_on_commit_callbacks
+    ):
+        project = ProjectFactory()
+        project_id = project.id
+
+        with django_capture_on_commit_callbacks(execute=True):
+            project.delete()
+
+        assert project_id in revalidated_ids(revalidated)
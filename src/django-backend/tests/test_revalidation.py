@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+import pytest
+
+from api.revalidation import (
+    PROJECT_LISTING_PATHS,
+    flush_revalidation,
+    project_paths,
+    revalidate,
+    revalidate_project,
+)
+from api.tasks import web_ui as web_ui_tasks
+from apps.projects.models import ProjectStatus
+from tests.factories import ProjectFactory
+
+REVALIDATE_PATHS = "services.web_ui.django_impl.DjangoWebUIHandler.revalidate_paths"
+
+
+@pytest.fixture
+def sent():
+    with patch(REVALIDATE_PATHS) as mock:
+        yield mock
+
+
+class TestRevalidationDispatcher:
+    def test_collects_and_dedupes_paths_until_flushed(self, sent):
+        revalidate_project("a")
+        revalidate_project("b")
+        revalidate(["/projects"])
+        sent.assert_not_called()
+
+        assert flush_revalidation() == len(PROJECT_LISTING_PATHS) + 2
+
+        sent.assert_called_once_with(
+            [*PROJECT_LISTING_PATHS, "/projects/a", "/projects/b"]
+        )
+
+    def test_flush_without_paths_sends_nothing(self, sent):
+        assert flush_revalidation() == 0
+        sent.assert_not_called()
+
+    def test_sends_early_once_enough_paths_are_pending(self, sent, settings):
+        settings.REVALIDATION_MAX_PATHS = 3
+
+        revalidate(["/a", "/b"])
+        sent.assert_not_called()
+        revalidate(["/c"])
+
+        sent.assert_called_once_with(["/a", "/b", "/c"])
+
+    def test_zero_window_sends_immediately(self, sent, settings):
+        settings.REVALIDATION_WINDOW = 0
+
+        revalidate(["/a"])
+
+        sent.assert_called_once_with(["/a"])
+
+    @pytest.mark.django_db
+    def test_many_project_saves_send_one_request(
+        self, sent, django_capture_on_commit_callbacks
+    ):
+        projects = ProjectFactory.create_batch(5, status=ProjectStatus.PENDING)
+        with django_capture_on_commit_callbacks(execute=True):
+            for project in projects:
+                project.status = ProjectStatus.APPROVED
+                project.save()
+
+        flush_revalidation()
+
+        sent.assert_called_once()
+        [paths] = sent.call_args.args
+        assert len(paths) == len(set(paths)) == len(PROJECT_LISTING_PATHS) + 5
+
+    def test_deprecated_project_task_sends_project_paths(self, sent):
+        web_ui_tasks.revalidate_project.call("a")
+
+        sent.assert_called_once_with(project_paths("a"))
@@ -12,6 +12,7 @@ export interface ListProjectsParams {
   search?: string;
   page?: number;
   per_page?: number;
+  cursor?: string;
 }
 
 export class ProjectsClient {
@@ -33,6 +34,7 @@ export class ProjectsClient {
     if (params.search) searchParams.set("search", params.search);
     if (params.page) searchParams.set("page", params.page.toString());
     if (params.per_page) searchParams.set("per_page", params.per_page.toString());
+    if (params.cursor !== undefined) searchParams.set("cursor", params.cursor);
 
     const query = searchParams.toString();
     const endpoint = query ? `/api/projects?${query}` : "/api/projects";